@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import game_launcher  # noqa: E402
+import library_index  # noqa: E402
+from game_record import GameRecord  # noqa: E402
+from synthetic_steam import make_game_records  # noqa: E402
+
+FRAME_MS = 1000 / 60
+
+
+def measure(app, renderer: str, steps: int, step_px: int) -> dict:
+    app.settings["library_renderer"] = renderer
+    started = time.perf_counter()
+    app.show_view("library")
+    app.update()
+    first_paint_ms = (time.perf_counter() - started) * 1000
+    while app._card_pool_after_id is not None:
+        app.update()
+
+    canvas = app.games_canvas
+    frames = []
+    for step in range(steps):
+        started = time.perf_counter()
+        canvas.yview_scroll(step_px if step < steps // 2 else -step_px, "units")
+        app.update()
+        frames.append((time.perf_counter() - started) * 1000)
+    frames.sort()
+    return {
+        "renderer": renderer,
+        "cards": len(app._grid_cards),
+        "first_paint_ms": round(first_paint_ms, 3),
+        "frame_p50_ms": round(statistics.median(frames), 3),
+        "frame_p95_ms": round(frames[int(len(frames) * 0.95) - 1], 3),
+        "frame_max_ms": round(frames[-1], 3),
+        "frames_over_budget": sum(frame > FRAME_MS for frame in frames),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Scroll the library grid with the widget and the canvas card renderer.")
+    parser.add_argument("--games", type=int, default=20000)
+    parser.add_argument("--steps", type=int, default=400, help="scroll steps per renderer")
+    parser.add_argument("--step-px", type=int, default=120)
+    parser.add_argument("--renderers", default=",".join(game_launcher.LIBRARY_RENDERERS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    app = game_launcher.GameLauncherApp()
+    app.settings["artwork_provider"] = "none"
+    app.games = [GameRecord.from_dict(game) for game in make_game_records(args.games, random.Random(args.seed))]
+    app._search_index = library_index.SearchIndex(app.games)
+    app.geometry("1400x900")
+    app.update()
+
+    results = []
+    for renderer in (name for name in args.renderers.split(",") if name):
+        if renderer not in game_launcher.LIBRARY_RENDERERS:
+            parser.error(f"unknown renderer: {renderer}")
+        result = measure(app, renderer, args.steps, args.step_px)
+        results.append(result)
+        print(f"{renderer:<8}{args.games:>7} games  first paint {result['first_paint_ms']:>8.2f} ms  "
+              f"frame p50 {result['frame_p50_ms']:>6.2f} ms  p95 {result['frame_p95_ms']:>6.2f} ms  "
+              f"max {result['frame_max_ms']:>7.2f} ms  over {FRAME_MS:.1f} ms: {result['frames_over_budget']}")
+    app.destroy()
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"games": args.games, "results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import steam_scanner  # noqa: E402
+from synthetic_steam import make_game_tree  # noqa: E402
+
+
+def find_game_exe_walk(game_root: str, game_name: str = "") -> str | None:
+    if not os.path.isdir(game_root):
+        return None
+
+    game_name_clean = re.sub(r'[^a-z0-9]', '', game_name.lower()) if game_name else ""
+    folder_name = os.path.basename(game_root).lower()
+    folder_clean = re.sub(r'[^a-z0-9]', '', folder_name)
+
+    candidates: list[str] = []
+
+    try:
+        for f in os.listdir(game_root):
+            if f.lower().endswith(".exe"):
+                candidates.append(os.path.join(game_root, f))
+    except Exception:
+        pass
+
+    if len(candidates) < 3:
+        for root, dirs, files in os.walk(game_root):
+            low = root.lower()
+
+            if any(x in low for x in ["_commonredist", "redist", "redistributable", "vcredist",
+                                      "directx", "dotnet", "installers", "support", "_data"]):
+                continue
+
+            for f in files:
+                if f.lower().endswith(".exe"):
+                    candidates.append(os.path.join(root, f))
+
+            if len(candidates) > 50:
+                break
+
+    if not candidates:
+        return None
+
+    def score(p: str) -> int:
+        n = os.path.basename(p).lower()
+        n_clean = re.sub(r'[^a-z0-9]', '', n)
+
+        bad_words = ["unins", "setup", "installer", "install", "crash", "crashreport",
+                     "report", "helper", "support", "redist", "vc_redist", "vcredist",
+                     "directx", "dotnet", "handler", "crs-handler", "connectinstaller",
+                     "uplay", "ubisoft", "ea", "origin", "battlenet", "epicgames",
+                     "steam", "launcher", "update", "patcher", "config", "settings",
+                     "unreal", "unity", "activation", "register"]
+
+        if any(w in n for w in bad_words):
+            return -100
+
+        points = 10
+        if game_name_clean and game_name_clean in n_clean:
+            points += 50
+        if folder_clean and len(folder_clean) > 3 and folder_clean in n_clean:
+            points += 40
+        if os.path.dirname(p) == os.path.normpath(game_root):
+            points += 20
+        parent = os.path.basename(os.path.dirname(p)).lower()
+        if parent in ["bin", "binaries", "bin64", "binary"]:
+            points += 15
+        if any(x in n for x in ["x64", "win64", "64bit"]):
+            points += 5
+        depth = p.count(os.sep) - game_root.count(os.sep)
+        if depth > 2:
+            points -= (depth - 2) * 5
+        return points
+
+    candidates.sort(key=score, reverse=True)
+    if candidates and score(candidates[0]) > 0:
+        return candidates[0]
+    return None
+
+
+def timed(fn, *args, repeat: int = 3):
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark exe discovery on a synthetic Unreal-style game tree.")
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", metavar="DIR", help="Build the tree in DIR and keep it")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="exe-bench-") as tmp:
+        base = args.keep or tmp
+        game_root = os.path.join(base, "Star Raiders")
+        start = time.perf_counter()
+        expected = make_game_tree(game_root, "StarRaiders.exe", files=args.files, rng=random.Random(args.seed))
+        print(f"Built {args.files} files in {time.perf_counter() - start:.1f}s: {game_root}")
+
+        for label, fn in (("os.walk", find_game_exe_walk), ("scandir", steam_scanner.find_game_exe)):
+            seconds, found = timed(fn, game_root, "Star Raiders", repeat=args.repeat)
+            status = "ok" if found == expected else "different"
+            print(f"{label:>8}: {seconds * 1000:9.2f} ms -> {os.path.relpath(found, base) if found else None} ({status})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import game_launcher  # noqa: E402
+
+App = game_launcher.GameLauncherApp
+WAKEUPS: Counter = Counter()
+_original_after = App.after
+_original_after_idle = App.after_idle
+
+
+def _counted(func):
+    name = getattr(func, "__qualname__", repr(func))
+
+    def wrapper(*args):
+        WAKEUPS[name] += 1
+        return func(*args)
+    return wrapper
+
+
+def counting_after(self, ms, func=None, *args):
+    if func is None:
+        return _original_after(self, ms)
+    return _original_after(self, ms, _counted(func), *args)
+
+
+def counting_after_idle(self, func, *args):
+    return _original_after_idle(self, _counted(func), *args)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Count app timer callbacks while the library view sits idle.")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--settle", type=float, default=5.0, help="seconds to wait after start before measuring")
+    parser.add_argument("--rebuilds", type=int, default=3, help="library view rebuilds before measuring")
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    App.after = counting_after
+    App.after_idle = counting_after_idle
+    app = App()
+    result = {}
+
+    def rebuild(remaining: int):
+        if remaining:
+            app.show_view("settings")
+            app.show_view("library")
+            _original_after(app, 200, lambda: rebuild(remaining - 1))
+        else:
+            _original_after(app, int(args.settle * 1000), start)
+
+    def start():
+        WAKEUPS.clear()
+        result["start"] = time.perf_counter()
+        _original_after(app, int(args.seconds * 1000), stop)
+
+    def stop():
+        elapsed = time.perf_counter() - result.pop("start")
+        result.update(seconds=round(elapsed, 3), wakeups=sum(WAKEUPS.values()),
+                      per_second=round(sum(WAKEUPS.values()) / elapsed, 2), callbacks=dict(WAKEUPS.most_common()))
+        app.destroy()
+
+    _original_after(app, 1000, lambda: rebuild(args.rebuilds))
+    app.mainloop()
+
+    print(f"{result['wakeups']} wakeups in {result['seconds']:.1f} s ({result['per_second']:.2f}/s)")
+    for name, count in result["callbacks"].items():
+        print(f"  {count:>6}  {name}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,414 @@
+import argparse
+import builtins
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import library_index  # noqa: E402
+import library_store  # noqa: E402
+import steam_scanner  # noqa: E402
+from game_record import GameRecord  # noqa: E402
+from synthetic_steam import make_game_records, make_icon_cache, make_steam_install  # noqa: E402
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+CASES = ("scan_cold", "scan_warm", "search", "search_typing", "search_fuzzy", "sort", "sort_views", "facets", "cache_prune")
+DEFAULT_SIZES = (100, 1000, 10000, 50000)
+SEARCH_TERMS = ("a", "dark", "legend", "star quest", "no such game")
+TYPED_QUERIES = ("dark souls", "star quest", "legend of", "tactics 100", "no such game")
+KEYSTROKE_BUDGET_MS = 5.0
+FACET_GENRES = ("Action", "Adventure", "RPG", "Strategy", "Puzzle", "Indie", "Simulation", "Racing")
+FACET_FILTERS = (
+    {"source": {"steam"}},
+    {"favorite": {"yes"}, "genre": {"RPG"}},
+    {"source": {"manual"}, "status": {"missing"}, "genre": {"Indie", "Puzzle"}},
+)
+FUZZY_QUERIES = ("drak qest", "legnd 12", "stra", "kingdm deluxe", "d", "zzqx")
+FIXTURE_VERSION = 1
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+class FsCallCounter:
+    TARGETS = (
+        (os, ("stat", "lstat", "scandir", "listdir", "remove", "replace", "utime")),
+        (os.path, ("exists", "isfile", "isdir", "getmtime", "getsize", "realpath")),
+        (builtins, ("open",)),
+    )
+
+    def __init__(self):
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._saved = []
+
+    def _wrap(self, label: str, fn):
+        def counted(*args, **kwargs):
+            if getattr(self._local, "depth", 0):
+                return fn(*args, **kwargs)
+            with self._lock:
+                self.counts[label] = self.counts.get(label, 0) + 1
+            self._local.depth = 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._local.depth = 0
+        return counted
+
+    def __enter__(self):
+        for module, names in self.TARGETS:
+            prefix = "os.path." if module is os.path else "os." if module is os else ""
+            for name in names:
+                original = getattr(module, name)
+                self._saved.append((module, name, original))
+                setattr(module, name, self._wrap(prefix + name, original))
+        return self
+
+    def __exit__(self, *exc):
+        for module, name, original in reversed(self._saved):
+            setattr(module, name, original)
+        self._saved.clear()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def peak_rss_bytes() -> int | None:
+    if psutil is not None:
+        peak = getattr(psutil.Process().memory_info(), "peak_wset", None)
+        if peak:
+            return peak
+    try:
+        import resource
+    except ImportError:
+        return psutil.Process().memory_info().rss if psutil is not None else None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def ensure_fixture(workdir: str, size: int, libraries: int, seed: int) -> dict:
+    root = os.path.join(workdir, f"steam-{size}-{libraries}-{seed}")
+    marker = os.path.join(root, "fixture.json")
+    try:
+        with open(marker, "r", encoding="utf-8") as f:
+            info = json.load(f)
+        if info.get("version") == FIXTURE_VERSION:
+            return info
+    except (OSError, ValueError):
+        pass
+
+    start = time.perf_counter()
+    print(f"Generating {size} games in {root} ...", file=sys.stderr)
+    rng = random.Random(seed)
+    install = make_steam_install(root, size, libraries, rng)
+    icon_cache = os.path.join(root, "IconCache")
+    icon_bytes = make_icon_cache(icon_cache, size, rng)
+    info = {
+        "version": FIXTURE_VERSION,
+        "size": size,
+        "seed": seed,
+        "steam_root": install["steam_root"],
+        "expected_games": len(install["expected"]),
+        "icon_cache": icon_cache,
+        "icon_cache_bytes": icon_bytes,
+        "generate_seconds": round(time.perf_counter() - start, 2),
+    }
+    with open(marker, "w", encoding="utf-8") as f:
+        json.dump(info, f, indent=2)
+    return info
+
+
+def _scan_case(fixture: dict, workers: int, use_index: bool):
+    steam_root = fixture["steam_root"]
+    appinfo_path = os.path.join(steam_root, "appcache", "appinfo.vdf")
+    index = None
+    if use_index:
+        index = steam_scanner.SteamScanIndex(os.path.join(os.path.dirname(steam_root), "scan-index.json"))
+
+    def run():
+        library_apps = steam_scanner.read_library_folders(steam_root)
+        games = steam_scanner.scan_steam_libraries(list(library_apps), workers, index, library_apps, appinfo_path)
+        return {"games": len(games), "expected_games": fixture["expected_games"]}
+
+    if index is not None:
+        run()
+    return run
+
+
+def _search_case(fixture: dict, workers: int):
+    games = [GameRecord.from_dict(game) for game in make_game_records(fixture["size"], random.Random(fixture["seed"]))]
+
+    def run():
+        return {"matches": {term: len(library_index.filter_sort_games(games, term, "name"))
+                            for term in SEARCH_TERMS}}
+    return run
+
+
+def _search_typing_case(fixture: dict, workers: int):
+    games = [GameRecord.from_dict(game) for game in make_game_records(fixture["size"], random.Random(fixture["seed"]))]
+    start = time.perf_counter()
+    index = library_index.SearchIndex(games)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    def run():
+        index._recent.clear()
+        latencies = []
+        for query in TYPED_QUERIES:
+            for end in range(1, len(query) + 1):
+                start = time.perf_counter()
+                index.search(query[:end])
+                latencies.append((time.perf_counter() - start) * 1000)
+        return {
+            "build_ms": round(build_ms, 3),
+            "keystrokes": len(latencies),
+            "keystroke_ms_median": round(statistics.median(latencies), 3),
+            "keystroke_ms_max": round(max(latencies), 3),
+            "within_budget": max(latencies) <= KEYSTROKE_BUDGET_MS,
+        }
+    return run
+
+
+def _search_fuzzy_case(fixture: dict, workers: int):
+    games = [GameRecord.from_dict(game) for game in make_game_records(fixture["size"], random.Random(fixture["seed"]))]
+    index = library_index.SearchIndex(games)
+    index.rank("warm up")
+
+    def run():
+        latencies = {}
+        results = {}
+        for query in FUZZY_QUERIES:
+            start = time.perf_counter()
+            results[query] = len(index.rank(query))
+            latencies[query] = round((time.perf_counter() - start) * 1000, 3)
+        return {
+            "results": results,
+            "query_ms": latencies,
+            "budget_ms": library_index.FUZZY_BUDGET_MS,
+            "query_ms_max": max(latencies.values()),
+        }
+    return run
+
+
+def _sort_case(fixture: dict, workers: int):
+    games = [GameRecord.from_dict(game) for game in make_game_records(fixture["size"], random.Random(fixture["seed"]))]
+
+    def run():
+        for mode in library_index.SORT_MODES:
+            library_index.filter_sort_games(games, "", mode)
+        return {"modes": list(library_index.SORT_MODES)}
+    return run
+
+
+def _sort_views_case(fixture: dict, workers: int):
+    games = [GameRecord.from_dict(game) for game in make_game_records(fixture["size"], random.Random(fixture["seed"]))]
+    index = library_index.SearchIndex(games)
+    start = time.perf_counter()
+    for mode in library_index.SORT_MODES:
+        index.view(mode)
+    build_ms = (time.perf_counter() - start) * 1000
+    game = games[len(games) // 2]
+
+    def run():
+        switch_ms = {}
+        for mode in library_index.SORT_MODES:
+            start = time.perf_counter()
+            library_index.filter_sort_games(games, "", mode, index)
+            switch_ms[mode] = round((time.perf_counter() - start) * 1000, 3)
+        start = time.perf_counter()
+        game["favorite"] = not game.favorite
+        index.update(game)
+        library_index.filter_sort_games(games, "", "favorite", index)
+        favorite_ms = (time.perf_counter() - start) * 1000
+        return {
+            "build_ms": round(build_ms, 3),
+            "switch_ms": switch_ms,
+            "favorite_toggle_ms": round(favorite_ms, 3),
+        }
+    return run
+
+
+def _facets_case(fixture: dict, workers: int):
+    rng = random.Random(fixture["seed"])
+    games = [GameRecord.from_dict(game) for game in make_game_records(fixture["size"], rng)]
+    for game in games:
+        game["genres"] = rng.sample(FACET_GENRES, rng.randint(1, 3))
+    installed = {game.path for game in games if rng.random() < 0.9}
+    index = library_index.SearchIndex(games)
+    start = time.perf_counter()
+    index.check_paths(exists=installed.__contains__)
+    check_ms = (time.perf_counter() - start) * 1000
+
+    def run():
+        index._view_records.clear()
+        filter_ms = {}
+        matches = {}
+        for filters in FACET_FILTERS:
+            label = "+".join(sorted(filters))
+            start = time.perf_counter()
+            matches[label] = len(library_index.filter_sort_games(games, "", "name", index, filters))
+            index.facet_counts("", filters)
+            filter_ms[label] = round((time.perf_counter() - start) * 1000, 3)
+        return {"check_paths_ms": round(check_ms, 3), "filter_ms": filter_ms, "matches": matches}
+    return run
+
+
+def _cache_prune_case(fixture: dict, workers: int):
+    max_files = max(1, fixture["size"] // 2)
+    max_size_mb = max(1, fixture["icon_cache_bytes"] // (2 * 1024 * 1024))
+
+    def run():
+        return library_store.prune_cache_dir(fixture["icon_cache"], max_size_mb, max_files, dry_run=True)
+    return run
+
+
+CASE_SETUP = {
+    "scan_cold": lambda fixture, workers: _scan_case(fixture, workers, False),
+    "scan_warm": lambda fixture, workers: _scan_case(fixture, workers, True),
+    "search": _search_case,
+    "search_typing": _search_typing_case,
+    "search_fuzzy": _search_fuzzy_case,
+    "sort": _sort_case,
+    "sort_views": _sort_views_case,
+    "facets": _facets_case,
+    "cache_prune": _cache_prune_case,
+}
+
+
+def run_child(case: str, fixture: dict, repeat: int, workers: int) -> dict:
+    baseline_rss = peak_rss_bytes()
+    run = CASE_SETUP[case](fixture, workers)
+
+    timings = []
+    detail = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        detail = run()
+        timings.append((time.perf_counter() - start) * 1000)
+    peak_rss = peak_rss_bytes()
+
+    with FsCallCounter() as counter:
+        run()
+
+    return {
+        "case": case,
+        "size": fixture["size"],
+        "wall_ms": round(min(timings), 3),
+        "wall_ms_median": round(statistics.median(timings), 3),
+        "repeat": repeat,
+        "baseline_rss_bytes": baseline_rss,
+        "peak_rss_bytes": peak_rss,
+        "fs_calls_total": counter.total,
+        "fs_calls": dict(sorted(counter.counts.items())),
+        "detail": detail,
+    }
+
+
+def run_case(case: str, fixture: dict, repeat: int, workers: int) -> dict:
+    cmd = [sys.executable, os.path.abspath(__file__), "--child", case,
+           "--fixture-json", json.dumps(fixture), "--repeat", str(repeat), "--workers", str(workers)]
+    proc = subprocess.run(cmd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise SystemExit(f"{case} at {fixture['size']} games failed:\n{proc.stderr}")
+    return json.loads(proc.stdout)
+
+
+def compare(results: list[dict], baseline_path: str, threshold: float, min_delta_ms: float) -> int:
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {(r["case"], r["size"]): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    print(f"\nCompared with {baseline_path}:")
+    for result in results:
+        old = baseline.get((result["case"], result["size"]))
+        if old is None:
+            continue
+        notes = []
+        for key in ("wall_ms", "peak_rss_bytes", "fs_calls_total"):
+            before, after = old.get(key), result.get(key)
+            if not before or after is None:
+                continue
+            ratio = after / before
+            flag = ""
+            if ratio > 1 + threshold and (key != "wall_ms" or after - before > min_delta_ms):
+                flag = " REGRESSION"
+                regressions += 1
+            notes.append(f"{key} x{ratio:.2f}{flag}")
+        print(f"  {result['case']:<14}{result['size']:>7}  " + ", ".join(notes))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Scale benchmarks for scan, search, sort and cache pruning.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--cases", default=",".join(CASES))
+    parser.add_argument("--libraries", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "alpha-launcher-bench"))
+    parser.add_argument("--output", help="result file (default: benchmarks/results/scale-<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown ratio before flagging")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore wall time changes below this")
+    parser.add_argument("--child", choices=CASES, help=argparse.SUPPRESS)
+    parser.add_argument("--fixture-json", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        json.dump(run_child(args.child, json.loads(args.fixture_json), args.repeat, args.workers), sys.stdout)
+        return 0
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    cases = [case for case in args.cases.split(",") if case]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    results = []
+    for size in sizes:
+        fixture = ensure_fixture(args.workdir, size, args.libraries, args.seed)
+        for case in cases:
+            result = run_case(case, fixture, args.repeat, args.workers)
+            results.append(result)
+            rss = result["peak_rss_bytes"]
+            rss_text = f"{rss / 1048576:8.1f} MiB" if rss else "     n/a"
+            print(f"{case:<14}{size:>7} games  {result['wall_ms']:>10.2f} ms  {rss_text}  "
+                  f"{result['fs_calls_total']:>8} fs calls")
+
+    output = args.output or os.path.join(RESULTS_DIR, time.strftime("scale-%Y%m%d-%H%M%S.json"))
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "psutil": psutil is not None,
+                "workers": steam_scanner.resolve_scan_workers(args.workers),
+                "libraries": args.libraries,
+                "seed": args.seed,
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"Results written to {output}")
+
+    if args.compare:
+        return 1 if compare(results, args.compare, args.threshold, args.min_delta_ms) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
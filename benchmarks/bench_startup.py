@@ -0,0 +1,121 @@
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import library_store  # noqa: E402
+from synthetic_steam import make_game_records  # noqa: E402
+
+DEFAULT_SIZES = (1000, 20000)
+MODES = ("legacy_json", "sqlite", "sqlite_snapshot", "files", "files_snapshot")
+
+CHILD_SCRIPT = """
+import sys, time, json
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+import library_store
+imported = time.perf_counter()
+mode, data_dir = sys.argv[1], sys.argv[2]
+if mode == "legacy_json":
+    settings = library_store.load_settings_state(data_dir)
+    games = library_store.load_games_state(data_dir)
+    source = "json"
+else:
+    store, settings, games, source = library_store.open_library_state(data_dir, use_snapshot=mode.endswith("_snapshot"))
+loaded = time.perf_counter()
+print(json.dumps({{"import_ms": (imported - start) * 1000, "load_ms": (loaded - imported) * 1000,
+                  "games": len(games), "source": source}}))
+"""
+
+
+def make_library(count: int, seed: int) -> list[dict]:
+    rng = random.Random(seed)
+    games = make_game_records(count, rng)
+    for game in games:
+        game["rawg_rating"] = round(rng.uniform(1, 5), 2)
+        game["rawg_playtime"] = rng.randint(0, 120)
+        game["description"] = " ".join(rng.choice(("epic", "story", "open", "world", "co-op", "puzzle"))
+                                       for _ in range(rng.randint(20, 60)))
+    return games
+
+
+def prepare(workdir: str, mode: str, count: int, seed: int) -> str:
+    data_dir = os.path.join(workdir, f"{mode}-{count}")
+    if os.path.isdir(data_dir):
+        return data_dir
+    os.makedirs(data_dir)
+    library_store.write_json_state(library_store.GAMES_FILE, make_library(count, seed), data_dir)
+    library_store.write_json_state(library_store.SETTINGS_FILE, library_store.DEFAULT_SETTINGS, data_dir)
+    if mode == "legacy_json":
+        return data_dir
+
+    backend = "files" if mode.startswith("files") else "sqlite"
+    store = library_store.open_library_store(data_dir, backend)
+    games = store.load_games()
+    settings = store.load_settings()
+    store.export_json()
+    store.close()
+    if mode.endswith("_snapshot"):
+        library_store.write_library_snapshot(backend, games, settings, data_dir)
+    return data_dir
+
+
+def run_child(mode: str, data_dir: str) -> dict:
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-c", CHILD_SCRIPT.format(root=ROOT), mode, data_dir],
+                          capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if proc.returncode != 0:
+        raise SystemExit(f"{mode} failed:\n{proc.stderr}")
+    result = json.loads(proc.stdout)
+    result["process_ms"] = wall_ms
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Cold-start state loading with and without the fast-start snapshot.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)))
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workdir", default=os.path.join(tempfile.gettempdir(), "alpha-launcher-startup-bench"))
+    parser.add_argument("--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+
+    results = []
+    for count in (int(size) for size in args.sizes.split(",") if size):
+        for mode in (m for m in args.modes.split(",") if m):
+            if mode not in MODES:
+                parser.error(f"unknown mode: {mode}")
+            data_dir = prepare(args.workdir, mode, count, args.seed)
+            runs = [run_child(mode, data_dir) for _ in range(args.repeat)]
+            best = min(runs, key=lambda run: run["process_ms"])
+            if mode.endswith("_snapshot") and best["source"] != "snapshot":
+                raise SystemExit(f"{mode} did not load from the snapshot ({best['source']})")
+            result = {
+                "mode": mode,
+                "size": count,
+                "source": best["source"],
+                "load_ms": round(min(run["load_ms"] for run in runs), 3),
+                "import_ms": round(best["import_ms"], 3),
+                "process_ms": round(best["process_ms"], 3),
+            }
+            results.append(result)
+            print(f"{mode:<16}{count:>7} games  load {result['load_ms']:>9.2f} ms  "
+                  f"process {result['process_ms']:>9.2f} ms  ({result['source']})")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"results": results}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
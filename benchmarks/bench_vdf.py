@@ -0,0 +1,70 @@
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import steam_scanner  # noqa: E402
+from synthetic_steam import make_manifest  # noqa: E402
+
+
+def parse_regex(acf_path: str) -> dict:
+    with open(acf_path, "r", encoding="utf-8", errors="ignore") as f:
+        content = f.read()
+    name = re.search(r'"name"\s*"([^"]+)"', content)
+    installdir = re.search(r'"installdir"\s*"([^"]+)"', content)
+    appid = re.search(r'"appid"\s*"([^"]+)"', content)
+    return {
+        "name": name.group(1) if name else None,
+        "installdir": installdir.group(1) if installdir else None,
+        "steam_appid": appid.group(1) if appid else None,
+    }
+
+
+def run(count: int, repeat: int, seed: int) -> dict:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory(prefix="vdf-bench-") as tmp:
+        paths = []
+        for i in range(count):
+            path = os.path.join(tmp, f"appmanifest_{10000 + i}.acf")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(make_manifest(rng, 10000 + i))
+            paths.append(path)
+
+        results = {}
+        for label, parser in (("regex", parse_regex), ("vdf", steam_scanner.parse_acf_manifest)):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                parsed = [parser(p) for p in paths]
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            results[label] = {"seconds": best, "per_manifest_us": best / count * 1e6}
+
+        for a, b in zip((parse_regex(p) for p in paths), parsed):
+            for key in ("name", "installdir", "steam_appid"):
+                if a[key] != b[key]:
+                    raise SystemExit(f"Parser mismatch on {key}: {a[key]!r} != {b[key]!r}")
+
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Compare regex manifest parsing against the VDF parser.")
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    results = run(args.count, args.repeat, args.seed)
+    for label, data in results.items():
+        print(f"{label:>6}: {data['seconds'] * 1000:8.1f} ms total, {data['per_manifest_us']:6.1f} us/manifest")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
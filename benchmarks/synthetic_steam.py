@@ -0,0 +1,319 @@
+import hashlib
+import os
+import random
+import struct
+
+MANIFEST_TEMPLATE = '''"AppState"
+{{
+\t"appid"\t\t"{appid}"
+\t"Universe"\t\t"1"
+\t"LauncherPath"\t\t"C:\\\\Program Files (x86)\\\\Steam\\\\steam.exe"
+\t"name"\t\t"{name}"
+\t"StateFlags"\t\t"4"
+\t"installdir"\t\t"{installdir}"
+\t"LastUpdated"\t\t"{last_updated}"
+\t"SizeOnDisk"\t\t"{size}"
+\t"StagingSize"\t\t"0"
+\t"buildid"\t\t"{buildid}"
+\t"LastOwner"\t\t"76561198000000000"
+\t"UpdateResult"\t\t"0"
+\t"BytesToDownload"\t\t"0"
+\t"BytesDownloaded"\t\t"0"
+\t"AutoUpdateBehavior"\t\t"0"
+\t"AllowOtherDownloadsWhileRunning"\t\t"0"
+\t"ScheduledAutoUpdate"\t\t"0"
+\t"InstalledDepots"
+\t{{
+{depots}\t}}
+\t"SharedDepots"
+\t{{
+\t\t"228988"\t\t"228980"
+\t\t"228990"\t\t"228980"
+\t}}
+\t"UserConfig"
+\t{{
+\t\t"language"\t\t"english"
+\t}}
+\t"MountedConfig"
+\t{{
+\t\t"language"\t\t"english"
+\t}}
+}}
+'''
+
+DEPOT_TEMPLATE = '''\t\t"{depot}"
+\t\t{{
+\t\t\t"manifest"\t\t"{manifest}"
+\t\t\t"size"\t\t"{size}"
+\t\t}}
+'''
+
+
+def make_manifest(rng: random.Random, appid: int, name: str | None = None, installdir: str | None = None) -> str:
+    if name is None:
+        name = " ".join(rng.choice(["Dark", "Star", "Iron", "Lost", "Super", "Tiny", "Night", "Road"]) for _ in range(3))
+        name = f"{name} {appid}"
+    depots = "".join(
+        DEPOT_TEMPLATE.format(depot=appid + i, manifest=rng.getrandbits(63), size=rng.getrandbits(34))
+        for i in range(1, rng.randint(2, 5))
+    )
+    return MANIFEST_TEMPLATE.format(
+        appid=appid,
+        name=name,
+        installdir=installdir or name,
+        last_updated=1700000000 + rng.randint(0, 10 ** 7),
+        size=rng.getrandbits(35),
+        buildid=rng.randint(10 ** 6, 10 ** 7),
+        depots=depots,
+    )
+
+
+def _touch(path: str, size: int = 0):
+    with open(path, "wb") as f:
+        if size:
+            f.write(b"\0" * size)
+
+
+def make_game_tree(game_root: str, exe_name: str, files: int = 2000, rng: random.Random | None = None,
+                   depth: int = 4, fanout: int = 12) -> str:
+    rng = rng or random.Random(0)
+    stem = os.path.splitext(exe_name)[0]
+
+    dirs = {
+        "root": game_root,
+        "binaries": os.path.join(game_root, stem, "Binaries", "Win64"),
+        "engine": os.path.join(game_root, "Engine", "Binaries", "Win64"),
+        "redist": os.path.join(game_root, "_CommonRedist", "vcredist", "2019"),
+        "directx": os.path.join(game_root, "_CommonRedist", "DirectX", "Jun2010"),
+        "data": os.path.join(game_root, f"{stem}_Data", "Plugins"),
+        "tools": os.path.join(game_root, "Tools"),
+    }
+    for path in dirs.values():
+        os.makedirs(path, exist_ok=True)
+
+    _touch(os.path.join(dirs["binaries"], f"{stem}-Win64-Shipping.exe"))
+    _touch(os.path.join(dirs["engine"], "CrashReportClient.exe"))
+    _touch(os.path.join(dirs["engine"], "UnrealCEFSubProcess.exe"))
+    _touch(os.path.join(dirs["redist"], "VC_redist.x64.exe"))
+    _touch(os.path.join(dirs["directx"], "DXSETUP.exe"))
+    _touch(os.path.join(dirs["data"], "UnityCrashHandler64.exe"))
+    _touch(os.path.join(dirs["tools"], "ModEditor.exe"))
+    _touch(os.path.join(dirs["root"], "unins000.exe"))
+
+    asset_roots = [
+        os.path.join(game_root, stem, "Content", "Paks"),
+        os.path.join(game_root, "Engine", "Content"),
+        os.path.join(game_root, "Assets"),
+    ]
+    created = 0
+    frontier = list(asset_roots)
+    all_dirs = []
+    while frontier and len(all_dirs) < max(1, files // 20):
+        current = frontier.pop(0)
+        os.makedirs(current, exist_ok=True)
+        all_dirs.append(current)
+        if current.count(os.sep) - game_root.count(os.sep) < depth + 2:
+            for i in range(rng.randint(2, fanout)):
+                frontier.append(os.path.join(current, f"dir{i:02d}"))
+
+    extensions = (".uasset", ".pak", ".ubulk", ".dds", ".wem", ".json", ".dll")
+    while created < files:
+        folder = rng.choice(all_dirs)
+        _touch(os.path.join(folder, f"asset{created:06d}{rng.choice(extensions)}"))
+        created += 1
+
+    return os.path.join(dirs["binaries"], f"{stem}-Win64-Shipping.exe")
+
+
+NAME_WORDS = (
+    "Dark", "Star", "Iron", "Lost", "Super", "Tiny", "Night", "Road", "Hollow", "Crystal", "Shadow", "Rogue",
+    "Legend", "Empire", "Frontier", "Dungeon", "Galaxy", "Racing", "Tactics", "Island", "Kingdom", "Forge",
+    "Drift", "Echo", "Pixel", "Storm", "Quest", "Odyssey", "Zero", "Horizon",
+)
+NAME_SUFFIXES = ("", "", "", " II", " III", ": Remastered", " Deluxe Edition", " - Definitive Edition")
+LAYOUTS = ("unreal", "unity", "bin", "flat")
+
+
+def make_game_name(rng: random.Random, appid: int) -> str:
+    words = " ".join(rng.choice(NAME_WORDS) for _ in range(rng.randint(1, 3)))
+    return f"{words}{rng.choice(NAME_SUFFIXES)} {appid}"
+
+
+def make_compact_game_tree(game_root: str, stem: str, rng: random.Random, layout: str = "flat",
+                           asset_depth: int = 6, asset_files: int = 4) -> str:
+    redist = os.path.join(game_root, "_CommonRedist", "vcredist", "2019")
+    os.makedirs(redist, exist_ok=True)
+    _touch(os.path.join(redist, "VC_redist.x64.exe"))
+    _touch(os.path.join(game_root, "unins000.exe"))
+
+    if layout == "unreal":
+        exe_dir = os.path.join(game_root, stem, "Binaries", "Win64")
+        exe = os.path.join(exe_dir, f"{stem}-Win64-Shipping.exe")
+        decoys = [os.path.join(game_root, "Engine", "Binaries", "Win64", "CrashReportClient.exe")]
+        assets = os.path.join(game_root, stem, "Content", "Paks")
+    elif layout == "unity":
+        exe_dir = game_root
+        exe = os.path.join(exe_dir, f"{stem}.exe")
+        decoys = [os.path.join(game_root, "UnityCrashHandler64.exe")]
+        assets = os.path.join(game_root, f"{stem}_Data", "StreamingAssets")
+    elif layout == "bin":
+        exe_dir = os.path.join(game_root, "bin", "x64")
+        exe = os.path.join(exe_dir, f"{stem}.exe")
+        decoys = [os.path.join(game_root, "launcher.exe"), os.path.join(exe_dir, "crashpad_handler.exe")]
+        assets = os.path.join(game_root, "data")
+    else:
+        exe_dir = game_root
+        exe = os.path.join(exe_dir, f"{stem}.exe")
+        decoys = [os.path.join(game_root, "tools", "config.exe")]
+        assets = os.path.join(game_root, "assets")
+
+    os.makedirs(exe_dir, exist_ok=True)
+    _touch(exe)
+    for decoy in decoys:
+        os.makedirs(os.path.dirname(decoy), exist_ok=True)
+        _touch(decoy)
+
+    for level in range(asset_depth):
+        assets = os.path.join(assets, f"lvl{level}")
+    os.makedirs(assets, exist_ok=True)
+    for i in range(asset_files):
+        _touch(os.path.join(assets, f"chunk{i:03d}{rng.choice(('.pak', '.dds', '.wem', '.bank'))}"))
+    return exe
+
+
+def _kv_blob(node: dict, version: int, strings: dict) -> bytes:
+    out = bytearray()
+
+    def key(k):
+        if version >= 0x29:
+            if k not in strings:
+                strings[k] = len(strings)
+            return struct.pack("<I", strings[k])
+        return k.encode() + b"\0"
+
+    for k, v in node.items():
+        if isinstance(v, dict):
+            out += b"\x00" + key(k) + _kv_blob(v, version, strings) + b"\x08"
+        elif isinstance(v, int):
+            out += b"\x02" + key(k) + struct.pack("<i", v)
+        else:
+            out += b"\x01" + key(k) + str(v).encode() + b"\0"
+    return bytes(out)
+
+
+def write_appinfo(path: str, apps: dict[int, dict], version: int = 0x29):
+    strings: dict[str, int] = {}
+    body = bytearray()
+    for appid, data in apps.items():
+        blob = _kv_blob({"appinfo": data}, version, strings) + b"\x08"
+        digest = hashlib.sha1(blob).digest()
+        head = struct.pack("<IIQ", 2, 1700000000, 0) + digest + struct.pack("<I", 1)
+        if version >= 0x28:
+            head += digest
+        entry = head + blob
+        body += struct.pack("<II", appid, len(entry)) + entry
+    body += struct.pack("<I", 0)
+
+    magic = 0x07564400 | version
+    if version >= 0x29:
+        table_offset = 16 + len(body)
+        table = struct.pack("<I", len(strings)) + b"".join(k.encode() + b"\0" for k in sorted(strings, key=strings.get))
+        data = struct.pack("<IIq", magic, 1, table_offset) + bytes(body) + table
+    else:
+        data = struct.pack("<II", magic, 1) + bytes(body)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _library_folders_vdf(libraries: list[str], apps: list[list[int]]) -> str:
+    lines = ['"libraryfolders"', "{"]
+    for pos, (lib, appids) in enumerate(zip(libraries, apps)):
+        lines += [f'\t"{pos}"', "\t{", f'\t\t"path"\t\t"{lib}"', '\t\t"label"\t\t""', '\t\t"apps"', "\t\t{"]
+        lines += [f'\t\t\t"{appid}"\t\t"{1000000 + appid}"' for appid in appids]
+        lines += ["\t\t}", "\t}"]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def make_steam_install(root: str, games: int, libraries: int = 2, rng: random.Random | None = None,
+                       with_appinfo: bool = True, broken_ratio: float = 0.02) -> dict:
+    rng = rng or random.Random(0)
+    steam_root = os.path.join(root, "Steam")
+    library_paths = [steam_root] + [os.path.join(root, f"SteamLibrary{i}") for i in range(1, libraries)]
+    library_apps: list[list[int]] = [[] for _ in library_paths]
+    expected: dict[str, str] = {}
+    appinfo_apps: dict[int, dict] = {}
+
+    for lib in library_paths:
+        os.makedirs(os.path.join(lib, "steamapps", "common"), exist_ok=True)
+
+    for i in range(games):
+        appid = 10000 + i
+        lib_pos = rng.randrange(len(library_paths))
+        lib = library_paths[lib_pos]
+        name = make_game_name(rng, appid)
+        installdir = name.replace(":", "")
+        stem = "".join(ch for ch in installdir if ch.isalnum())[:24]
+        steamapps = os.path.join(lib, "steamapps")
+        with open(os.path.join(steamapps, f"appmanifest_{appid}.acf"), "w", encoding="utf-8") as f:
+            f.write(make_manifest(rng, appid, name, installdir))
+        library_apps[lib_pos].append(appid)
+
+        if rng.random() < broken_ratio:
+            continue
+        game_root = os.path.join(steamapps, "common", installdir)
+        exe = make_compact_game_tree(game_root, stem, rng, rng.choice(LAYOUTS))
+        expected[str(appid)] = exe
+        if with_appinfo and rng.random() < 0.5:
+            appinfo_apps[appid] = {
+                "appid": appid,
+                "common": {"name": name, "type": "Game"},
+                "config": {
+                    "installdir": installdir,
+                    "launch": {"0": {"executable": os.path.relpath(exe, game_root).replace(os.sep, "\\"),
+                                     "type": "default", "config": {"oslist": "windows"}}},
+                },
+            }
+
+    with open(os.path.join(steam_root, "steamapps", "libraryfolders.vdf"), "w", encoding="utf-8") as f:
+        f.write(_library_folders_vdf(library_paths, library_apps))
+    if with_appinfo:
+        write_appinfo(os.path.join(steam_root, "appcache", "appinfo.vdf"), appinfo_apps)
+
+    return {"steam_root": steam_root, "libraries": library_paths, "expected": expected}
+
+
+def make_game_records(count: int, rng: random.Random | None = None, favorite_ratio: float = 0.1) -> list[dict]:
+    rng = rng or random.Random(0)
+    games = []
+    for i in range(count):
+        appid = 10000 + i
+        name = make_game_name(rng, appid)
+        game = {
+            "name": name,
+            "path": os.path.join("C:\\", "Games", name.replace(":", ""), "game.exe"),
+            "source": rng.choice(("Steam", "Steam", "Steam", "Manual")),
+            "steam_appid": str(appid),
+        }
+        if rng.random() < favorite_ratio:
+            game["favorite"] = True
+        games.append(game)
+    return games
+
+
+def make_icon_cache(cache_dir: str, count: int, rng: random.Random | None = None,
+                    min_size: int = 2048, max_size: int = 65536) -> int:
+    rng = rng or random.Random(0)
+    os.makedirs(cache_dir, exist_ok=True)
+    total = 0
+    now = 1700000000
+    for i in range(count):
+        path = os.path.join(cache_dir, f"{rng.getrandbits(64):016x}_{i}.png")
+        size = rng.randint(min_size, max_size)
+        with open(path, "wb") as f:
+            f.truncate(size)
+        mtime = now - rng.randint(0, 90 * 86400)
+        os.utime(path, (mtime, mtime))
+        total += size
+    return total
@@ -1,22 +1,40 @@
 import os
-import json
+import platform
+import sys
+import time
+
+_PROCESS_CLOCK_START = time.perf_counter()
+
+if __name__ == "__main__" and len(sys.argv) > 1:
+    import launcher_cli
+
+    if sys.argv[1] in launcher_cli.COMMANDS:
+        sys.exit(launcher_cli.main(sys.argv[1:]))
+
 import customtkinter as ctk
 import winreg
-import sys
 import win32gui  # type: ignore
 import win32ui  # type: ignore
 import win32con  # type: ignore
 import win32api  # type: ignore
-import re
-import hashlib
-import tempfile
 import shutil
+from collections import OrderedDict
 from io import BytesIO
-from threading import RLock, Thread
+from threading import Event, RLock, Thread
 from tkinter import filedialog, messagebox
 from urllib.parse import quote
-from PIL import Image
+from PIL import Image, ImageTk
 import ssl
+import steam_scanner
+import library_index
+import library_store
+from game_record import GameRecord, icon_cache_key
+from virtual_grid import FrameBudget, GridLayout, rounded_rect
+from library_store import (
+    DEFAULT_SETTINGS,
+    app_data_dir,
+    cache_data_dir,
+)
 
 _requests_import_error: str | None = None
 try:
@@ -32,20 +50,24 @@ except ImportError as e:
     requests = None
     _requests_import_error = str(e)
 
-GAMES_FILE = "games.json"
-SETTINGS_FILE = "settings.json"
-USER_DATA_DIR_NAME = "Alpha Game Launcher"
-CACHE_DIR_NAME = "Cache"
+STEAM_SCAN_INDEX_FILE = "steam_scan_index.json"
+STEAM_IMPORT_BATCH_INTERVAL = 0.25
+SEARCH_DEBOUNCE_MS = 150
+GAME_CARD_HEIGHT = 252
+GAME_CARD_PADDING = 10
+GAME_CARD_ART_SIZE = (214, 100)
+CARD_FRAME_BUDGET_MS = 8.0
+CANVAS_ART_DELAY_MS = 60
+CANVAS_PHOTO_CACHE_SIZE = 512
+LIBRARY_RENDERERS = ("widgets", "canvas")
+LIBRARY_FACET_BUTTONS = (
+    ("source", "steam", "facet_steam"),
+    ("source", "manual", "facet_manual"),
+    ("favorite", "yes", "facet_favorites"),
+    ("status", "installed", "facet_installed"),
+    ("status", "missing", "facet_missing"),
+)
 APP_VERSION = "1.0.0.0"
-DEFAULT_SETTINGS = {
-    "chunk_size": 12,
-    "cache_size_mb": 200,
-    "cache_max_files": 2000,
-    "steamgriddb_api_key": "",
-    "rawg_api_key": "",
-    "artwork_provider": "steamgriddb",
-    "language": "de",
-}
 UI = {
     "bg": ("#f5f7fb", "#070b12"),
     "sidebar": ("#e9edf5", "#0b111c"),
@@ -84,6 +106,14 @@ TRANSLATIONS = {
         "sort_name": "Name",
         "sort_favorites": "⭐ Favoriten",
         "sort_added": "Hinzugefügt",
+        "sort_relevance": "Relevanz",
+        "filter_label": "Filter:",
+        "facet_steam": "Steam",
+        "facet_manual": "Manuell",
+        "facet_favorites": "⭐ Favoriten",
+        "facet_installed": "Installiert",
+        "facet_missing": "Fehlt",
+        "facet_all_genres": "Alle Genres",
         "scrolling": "⚡ Scrolling...",
         "add_game": "➕ Manuell Spiel hinzufügen",
         "installed_games": "Installierte Spiele: {count}",
@@ -92,15 +122,29 @@ TRANSLATIONS = {
         "steam_import": "Steam-Bibliothek importieren",
         "steam_import_running": "Import läuft...",
         "remove_all_games": "Alle Spiele entfernen",
+        "reset_scan_index": "Steam-Scan-Index zurücksetzen",
+        "scan_index_reset_title": "Scan-Index zurückgesetzt",
+        "scan_index_reset": "Der nächste Steam-Import liest alle Bibliotheken neu ein.",
         "path_unknown": "Pfad unbekannt",
         "found": "✅ Gefunden",
         "not_found": "❌ Nicht gefunden",
         "steam_import_error": "Fehler beim Import:\n\n{error}",
         "steam_import_done": "Import abgeschlossen!\n\nHinzugefügt: {count}",
+        "steam_import_cancelled": "Import abgebrochen.\n\nHinzugefügt: {count}",
+        "steam_import_cancel": "Import abbrechen ({processed}/{total})",
         "settings_title": "Einstellungen",
         "language": "Sprache:",
         "theme": "Theme:",
         "performance": "Performance:",
+        "scan_workers": "Steam-Scan Threads:",
+        "scan_workers_auto": "Automatisch",
+        "library_storage": "Bibliotheksspeicher:",
+        "storage_sqlite": "Datenbank (SQLite)",
+        "storage_files": "Dateien (JSON + Journal)",
+        "storage_switch_failed": "Der Bibliotheksspeicher konnte nicht gewechselt werden.",
+        "library_renderer": "Spielekarten:",
+        "renderer_widgets": "Widgets (Standard)",
+        "renderer_canvas": "Leichtgewichtig (Canvas)",
         "steamgriddb_key": "SteamGridDB API Key:",
         "steamgriddb_placeholder": "Optional; alternativ STEAMGRIDDB_API_KEY nutzen",
         "rawg_key": "RAWG API Key:",
@@ -177,6 +221,14 @@ TRANSLATIONS = {
         "sort_name": "Name",
         "sort_favorites": "⭐ Favorites",
         "sort_added": "Added",
+        "sort_relevance": "Relevance",
+        "filter_label": "Filter:",
+        "facet_steam": "Steam",
+        "facet_manual": "Manual",
+        "facet_favorites": "⭐ Favorites",
+        "facet_installed": "Installed",
+        "facet_missing": "Missing",
+        "facet_all_genres": "All genres",
         "scrolling": "⚡ Scrolling...",
         "add_game": "➕ Add game manually",
         "installed_games": "Installed games: {count}",
@@ -185,15 +237,29 @@ TRANSLATIONS = {
         "steam_import": "Import Steam library",
         "steam_import_running": "Importing...",
         "remove_all_games": "Remove all games",
+        "reset_scan_index": "Reset Steam scan index",
+        "scan_index_reset_title": "Scan index reset",
+        "scan_index_reset": "The next Steam import will rescan all libraries.",
         "path_unknown": "Path unknown",
         "found": "✅ Found",
         "not_found": "❌ Not found",
         "steam_import_error": "Import failed:\n\n{error}",
         "steam_import_done": "Import complete!\n\nAdded: {count}",
+        "steam_import_cancelled": "Import cancelled.\n\nAdded: {count}",
+        "steam_import_cancel": "Cancel import ({processed}/{total})",
         "settings_title": "Settings",
         "language": "Language:",
         "theme": "Theme:",
         "performance": "Performance:",
+        "scan_workers": "Steam scan threads:",
+        "scan_workers_auto": "Automatic",
+        "library_storage": "Library storage:",
+        "storage_sqlite": "Database (SQLite)",
+        "storage_files": "Plain files (JSON + journal)",
+        "storage_switch_failed": "The library storage could not be switched.",
+        "library_renderer": "Game cards:",
+        "renderer_widgets": "Widgets (default)",
+        "renderer_canvas": "Lightweight (canvas)",
         "steamgriddb_key": "SteamGridDB API key:",
         "steamgriddb_placeholder": "Optional; can also use STEAMGRIDDB_API_KEY",
         "rawg_key": "RAWG API key:",
@@ -272,6 +338,14 @@ CLEAN_TRANSLATIONS = {
         "sort_name": "Name",
         "sort_favorites": "Favoriten",
         "sort_added": "Hinzugefuegt",
+        "sort_relevance": "Relevanz",
+        "filter_label": "Filter",
+        "facet_steam": "Steam",
+        "facet_manual": "Manuell",
+        "facet_favorites": "Favoriten",
+        "facet_installed": "Installiert",
+        "facet_missing": "Fehlt",
+        "facet_all_genres": "Alle Genres",
         "scrolling": "Scrolling...",
         "add_game": "Spiel hinzufuegen",
         "installed_games": "Installierte Spiele: {count}",
@@ -328,6 +402,14 @@ CLEAN_TRANSLATIONS = {
         "sort_name": "Name",
         "sort_favorites": "Favorites",
         "sort_added": "Added",
+        "sort_relevance": "Relevance",
+        "filter_label": "Filter",
+        "facet_steam": "Steam",
+        "facet_manual": "Manual",
+        "facet_favorites": "Favorites",
+        "facet_installed": "Installed",
+        "facet_missing": "Missing",
+        "facet_all_genres": "All genres",
         "scrolling": "Scrolling...",
         "add_game": "Add game",
         "installed_games": "Installed games: {count}",
@@ -375,14 +457,6 @@ CLEAN_TRANSLATIONS = {
 for _language, _values in CLEAN_TRANSLATIONS.items():
     TRANSLATIONS.setdefault(_language, {}).update(_values)
 
-def app_data_dir() -> str:
-    documents = os.path.join(os.path.expanduser("~"), "Documents")
-    base = documents if os.path.isdir(documents) else os.path.expanduser("~")
-    return os.path.join(base, USER_DATA_DIR_NAME)
-
-def cache_data_dir() -> str:
-    return os.path.join(app_data_dir(), CACHE_DIR_NAME)
-
 def resource_path(relative_path: str) -> str:
     try:
         base_path = sys._MEIPASS  # type: ignore[attr-defined]
@@ -422,6 +496,10 @@ class GameLauncherApp(ctk.CTk):
     def __init__(self):
         super().__init__()
         self._steam_import_running = False
+        self._steam_import_cancel: Event | None = None
+        self._steam_import_progress = (0, 0)
+        self._steam_import_added = 0
+        self._steam_scan_index: steam_scanner.SteamScanIndex | None = None
         icon_path = resource_path("assets/game_launcher.ico")
         self.iconbitmap(icon_path)
 
@@ -441,16 +519,32 @@ class GameLauncherApp(ctk.CTk):
         self._last_height = 0
 
         self._search_term = ""
+        self._search_after_id: str | None = None
+        self._search_generation = 0
         self._sort_mode = "name"
+        self._facet_filters: dict[str, set[str]] = {}
         self._current_game_detail = None
         self._is_scrolling = False
         self._scroll_idle_after_id: str | None = None
-        self._scroll_poll_after_id: str | None = None
+        self._card_pool_after_id: str | None = None
+        self._canvas_art_after_id: str | None = None
+        self._canvas_cards = False
+        self._canvas_hover: tuple[dict, str] | None = None
+        self._canvas_photo_cache: OrderedDict[tuple, ImageTk.PhotoImage] = OrderedDict()
+        self._grid_cards: list[dict] = []
+        self._grid_label_cards: dict[str, dict] = {}
+        self._grid_card_by_game: dict[int, dict] = {}
+        self._grid_range = (0, 0)
+        self._grid_layout = GridLayout(GAME_CARD_HEIGHT, GAME_CARD_PADDING)
+        self._grid_empty: ctk.CTkFrame | None = None
+        self._grid_empty_item: int | None = None
+        self._grid_wheel_bound = False
+        self._card_font_cache: dict[str, ctk.CTkFont] | None = None
+        self._display_games: list[GameRecord] = []
         self._pending_icon_updates: list[tuple[str, tuple[int, int], ctk.CTkLabel]] = []
         self._hovered_card: ctk.CTkFrame | None = None
         self._active_view = "library"
         self._nav_buttons: dict[str, ctk.CTkButton] = {}
-        self._last_library_width = 0
 
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("dark-blue")
@@ -471,17 +565,27 @@ class GameLauncherApp(ctk.CTk):
 
         self.minsize(980, 680)
         self.resizable(True, True)
-
-        self.settings = self.load_settings()
-
-        self.games = []
-        self.load_games()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self._notice_after_id = None
+        state_started = time.perf_counter()
+        store, self.settings, games, self._state_source = library_store.open_library_state()
+        self.games = [GameRecord.from_dict(game) for game in games]
+        self._search_index = library_index.SearchIndex(self.games, background=True,
+                                                        on_ready=self._search_index_built)
+        self._check_game_paths()
+        self._card_budget = FrameBudget(CARD_FRAME_BUDGET_MS, self.settings.get("card_chunk_sizes", {}).get(
+            platform.node(), self.settings.get("chunk_size", DEFAULT_SETTINGS["chunk_size"])))
+        self._library_store = library_store.WriteBehindStore(store, on_error=self._on_store_error)
+        self._library_store.track_ids(self.games)
+        self._state_load_ms = (time.perf_counter() - state_started) * 1000
 
         self.configure(fg_color=UI["bg"])
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
         self.create_main_tabs()
+        self.after_idle(self._log_first_paint)
 
         self.bind("<Configure>", self._detect_resize_start, add="+")
 
@@ -536,7 +640,7 @@ class GameLauncherApp(ctk.CTk):
         return ctk.CTkFrame(parent, **options)
 
     def _clear_content(self):
-        self._cancel_games_scroll_poll()
+        self._stop_games_scroll_tracking()
         for widget in self.content_frame.winfo_children():
             widget.destroy()
 
@@ -790,19 +894,10 @@ class GameLauncherApp(ctk.CTk):
             return None
 
     def _get_icon_cache_dir(self) -> str:
-        return os.path.join(cache_data_dir(), "IconCache")
-
-    def _icon_cache_key(self, exe_path: str) -> str:
-        try:
-            mtime = int(os.path.getmtime(exe_path))
-        except Exception:
-            mtime = 0
-        h = hashlib.sha1()
-        h.update((exe_path + "|" + str(mtime)).encode("utf-8", errors="ignore"))
-        return h.hexdigest()
+        return library_store.icon_cache_dir()
 
     def _icon_cache_file(self, exe_path: str) -> str:
-        return os.path.join(self._get_icon_cache_dir(), self._icon_cache_key(exe_path) + ".png")
+        return os.path.join(self._get_icon_cache_dir(), icon_cache_key(exe_path) + ".png")
 
     def _get_artwork_cache_dir(self) -> str:
         return os.path.join(cache_data_dir(), "ArtworkCache")
@@ -810,16 +905,10 @@ class GameLauncherApp(ctk.CTk):
     def _get_custom_artwork_dir(self) -> str:
         return os.path.join(app_data_dir(), "Artwork")
 
-    def _game_artwork_id(self, game: dict) -> str:
-        steam_appid = str(game.get("steam_appid") or "").strip()
-        if steam_appid:
-            return f"steam-{steam_appid}"
-        name = str(game.get("name") or game.get("path") or "unknown").strip().lower()
-        h = hashlib.sha1()
-        h.update(name.encode("utf-8", errors="ignore"))
-        return f"name-{h.hexdigest()}"
+    def _game_artwork_id(self, game: GameRecord) -> str:
+        return game.artwork_id
 
-    def _artwork_cache_file(self, game: dict, asset_type: str) -> str:
+    def _artwork_cache_file(self, game: GameRecord, asset_type: str) -> str:
         return os.path.join(self._get_artwork_cache_dir(), f"{self._game_artwork_id(game)}-{asset_type}.png")
 
     def _get_steamgriddb_api_key(self) -> str:
@@ -847,7 +936,7 @@ class GameLauncherApp(ctk.CTk):
             return None
         return data.get("data")
 
-    def _fetch_steamgriddb_artwork_url(self, game: dict, asset_type: str = "grid") -> str | None:
+    def _fetch_steamgriddb_artwork_url(self, game: GameRecord, asset_type: str = "grid") -> str | None:
         params = {
             "types": "static",
             "nsfw": "false",
@@ -882,7 +971,7 @@ class GameLauncherApp(ctk.CTk):
             return data[0].get("url")
         return None
 
-    def _load_game_artwork_pil(self, game: dict, asset_type: str = "grid") -> Image.Image | None:
+    def _load_game_artwork_pil(self, game: GameRecord, asset_type: str = "grid") -> Image.Image | None:
         override_path = game.get("artwork_path")
         if override_path and os.path.exists(override_path):
             try:
@@ -914,7 +1003,7 @@ class GameLauncherApp(ctk.CTk):
         except Exception:
             return None
 
-    def get_game_artwork_image(self, game: dict, size=(180, 84), asset_type: str = "grid") -> ctk.CTkImage:
+    def get_game_artwork_image(self, game: GameRecord, size=(180, 84), asset_type: str = "grid") -> ctk.CTkImage:
         artwork_id = self._game_artwork_id(game)
         w, h = size
         ctk_key = (artwork_id, asset_type, w, h)
@@ -923,7 +1012,7 @@ class GameLauncherApp(ctk.CTk):
         with self._icon_cache_lock:
             if ctk_key in self._artwork_ctk_cache:
                 cached = self._artwork_ctk_cache[ctk_key]
-                return cached or self.get_game_icon_image(game.get("path", ""), (min(w, h), min(w, h)))
+                return cached or self.get_game_icon_image(game.norm_path, (min(w, h), min(w, h)))
             pil_cache_hit = pil_key in self._artwork_pil_cache
             pil_artwork = self._artwork_pil_cache.get(pil_key)
 
@@ -935,7 +1024,7 @@ class GameLauncherApp(ctk.CTk):
         if pil_artwork is None:
             with self._icon_cache_lock:
                 self._artwork_ctk_cache[ctk_key] = None
-            return self.get_game_icon_image(game.get("path", ""), (min(w, h), min(w, h)))
+            return self.get_game_icon_image(game.norm_path, (min(w, h), min(w, h)))
 
         try:
             ctk_img = ctk.CTkImage(light_image=pil_artwork, dark_image=pil_artwork, size=size)
@@ -945,7 +1034,7 @@ class GameLauncherApp(ctk.CTk):
         except Exception:
             with self._icon_cache_lock:
                 self._artwork_ctk_cache[ctk_key] = None
-            return self.get_game_icon_image(game.get("path", ""), (min(w, h), min(w, h)))
+            return self.get_game_icon_image(game.norm_path, (min(w, h), min(w, h)))
 
     def invalidate_icon_cache(self, exe_path: str):
         exe_path = os.path.normpath(exe_path)
@@ -955,8 +1044,9 @@ class GameLauncherApp(ctk.CTk):
 
             for k in [k for k in self._icon_ctk_cache if k[0] == exe_path]:
                 self._icon_ctk_cache.pop(k, None)
+        self._canvas_photo_cache.pop(("icon", exe_path), None)
 
-    def invalidate_artwork_cache(self, game: dict):
+    def invalidate_artwork_cache(self, game: GameRecord):
         artwork_id = self._game_artwork_id(game)
         with self._icon_cache_lock:
             for key in [k for k in self._artwork_pil_cache if k[0] == artwork_id]:
@@ -965,6 +1055,7 @@ class GameLauncherApp(ctk.CTk):
                 self._artwork_ctk_cache.pop(key, None)
             for key in [k for k in self._artwork_load_inflight if k[0] == artwork_id]:
                 self._artwork_load_inflight.discard(key)
+        self._canvas_photo_cache.pop((artwork_id, "grid"), None)
 
     def get_fallback_icon(self, size=(48, 48)) -> ctk.CTkImage:
         w, h = size
@@ -993,7 +1084,6 @@ class GameLauncherApp(ctk.CTk):
         if not exe_path:
             return self.get_fallback_icon(size)
 
-        exe_path = os.path.normpath(exe_path)
         w, h = size
         key = (exe_path, w, h)
 
@@ -1027,11 +1117,16 @@ class GameLauncherApp(ctk.CTk):
         self.games_tab.grid_rowconfigure(0, weight=1)
         self.games_tab.grid_columnconfigure(0, weight=1)
 
+        self._current_game_detail = None
         self.left_frame = ctk.CTkFrame(self.games_tab, fg_color="transparent", corner_radius=0)
         self.left_frame.grid(row=0, column=0, sticky="nsew")
         self.left_frame.grid_rowconfigure(1, weight=1)
         self.left_frame.grid_columnconfigure(0, weight=1)
 
+        self.detail_frame = ctk.CTkFrame(self.games_tab, fg_color="transparent", corner_radius=0)
+        self.detail_frame.grid(row=0, column=0, sticky="nsew")
+        self.detail_frame.grid_remove()
+
         header_frame = self._create_view_header(
             self.left_frame,
             self.t("games_title"),
@@ -1112,16 +1207,90 @@ class GameLauncherApp(ctk.CTk):
             corner_radius=8,
             command=lambda: self._set_sort_mode("date_added")
         )
-        self.sort_date_btn.pack(side="left", padx=(2, 4), pady=4)
+        self.sort_date_btn.pack(side="left", padx=2, pady=4)
+
+        self.sort_relevance_btn = ctk.CTkButton(
+            sort_frame,
+            text=self.t("sort_relevance"),
+            width=96,
+            height=30,
+            corner_radius=8,
+            command=lambda: self._set_sort_mode("relevance")
+        )
+        self.sort_relevance_btn.pack(side="left", padx=(2, 4), pady=4)
         self._refresh_sort_buttons()
 
+        facet_frame = ctk.CTkFrame(command_panel, fg_color="transparent")
+        facet_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=12, pady=(0, 12))
+
+        facet_label = ctk.CTkLabel(facet_frame, text=self.t("filter_label"), text_color=UI["muted"], font=self.font_caption)
+        facet_label.pack(side="left", padx=(0, 6))
+
+        self._facet_buttons: dict[tuple[str, str], tuple[ctk.CTkButton, str]] = {}
+        for facet, value, key in LIBRARY_FACET_BUTTONS:
+            button = ctk.CTkButton(
+                facet_frame,
+                text=self.t(key),
+                width=96,
+                height=28,
+                corner_radius=8,
+                command=lambda f=facet, v=value: self._toggle_facet(f, v),
+                **self._button_style("primary" if value in self._facet_filters.get(facet, ()) else "ghost")
+            )
+            button.pack(side="left", padx=2)
+            self._facet_buttons[(facet, value)] = (button, key)
+
+        self._genre_labels: dict[str, str | None] = {}
+        self.genre_var = ctk.StringVar(value=self.t("facet_all_genres"))
+        self.genre_optionmenu = ctk.CTkOptionMenu(
+            facet_frame,
+            values=[self.t("facet_all_genres")],
+            variable=self.genre_var,
+            width=170,
+            height=28,
+            command=self._set_genre_facet
+        )
+        self.genre_optionmenu.pack(side="left", padx=(8, 0))
+
+        self.import_progress = ctk.CTkProgressBar(command_panel, mode="determinate")
+        self.import_progress.grid(row=2, column=0, columnspan=2, sticky="ew", padx=12, pady=(0, 12))
+        self.import_progress.grid_remove()
+        self._refresh_steam_import_controls()
+
         scroll_container = self._create_panel(self.left_frame, fg_color=UI["surface"], corner_radius=16)
         scroll_container.pack(fill="both", expand=True)
 
-        self.games_scroll = ctk.CTkScrollableFrame(scroll_container, fg_color="transparent")
-        self.games_scroll.pack(fill="both", expand=True, padx=8, pady=8)
+        self.games_scrollbar = ctk.CTkScrollbar(scroll_container)
+        self.games_scrollbar.pack(side="right", fill="y", padx=(0, 6), pady=8)
 
-        self._scroll_canvas = self.games_scroll._parent_canvas
+        self.games_canvas = ctk.CTkCanvas(
+            scroll_container,
+            bg=self._apply_appearance_mode(UI["surface"]),
+            highlightthickness=0,
+            borderwidth=0,
+            yscrollincrement=1,
+            yscrollcommand=self._on_games_yview
+        )
+        self.games_canvas.pack(side="left", fill="both", expand=True, padx=(8, 0), pady=8)
+        self.games_scrollbar.configure(command=self._on_games_scrollbar)
+        self.games_canvas.bind("<Configure>", self._on_games_canvas_configure, add="+")
+        if not self._grid_wheel_bound:
+            self.bind_all("<MouseWheel>", self._on_games_mousewheel, add="+")
+            self._grid_wheel_bound = True
+
+        self._grid_cards = []
+        self._grid_label_cards = {}
+        self._grid_card_by_game = {}
+        self._grid_range = (0, 0)
+        self._grid_empty = None
+        self._grid_empty_item = None
+        self._grid_layout = GridLayout(GAME_CARD_HEIGHT, GAME_CARD_PADDING)
+        self._canvas_cards = self.settings.get("library_renderer") == "canvas"
+        self._canvas_hover = None
+        if self._canvas_cards:
+            self.games_canvas.tag_bind("card", "<Button-1>", self._on_canvas_card_click)
+            self.games_canvas.bind("<Motion>", self._on_canvas_card_motion, add="+")
+            self.games_canvas.bind("<Leave>", lambda e: self._set_canvas_hover(None, ""), add="+")
 
         self.scroll_overlay = ctk.CTkFrame(
             scroll_container,
@@ -1137,72 +1306,133 @@ class GameLauncherApp(ctk.CTk):
         self.scroll_overlay_label.pack(expand=True)
 
         self.scroll_overlay.place_forget()
+        self.scroll_overlay.bind("<MouseWheel>", self._on_overlay_mousewheel)
+        self.scroll_overlay_label.bind("<MouseWheel>", self._on_overlay_mousewheel)
 
-        def _forward_scroll(e):
-            scroll_amount = int(-1 * (e.delta / 120)) * 6
-            self._scroll_canvas.yview_scroll(scroll_amount, "units")
-            _scroll_started()
-            return "break"
-
-        self.scroll_overlay.bind("<MouseWheel>", _forward_scroll)
-        self.scroll_overlay_label.bind("<MouseWheel>", _forward_scroll)
+        self._games_columns = self._calculate_game_columns()
 
-        self._last_scroll_pos = 0.0
+        self.render_game_buttons()
 
-        def _check_scroll_position():
-            if hasattr(self, '_scroll_canvas') and self._scroll_canvas.winfo_exists():
-                try:
-                    current_pos = self._scroll_canvas.yview()[0]
-                    if abs(current_pos - self._last_scroll_pos) > 0.001:
-                        self._last_scroll_pos = current_pos
-                        _scroll_started()
-                except Exception:
-                    pass
-            self.after(50, _check_scroll_position)
+    def _on_search_changed(self, event=None):
+        term = self.search_entry.get().casefold()
+        if term == self._search_term:
+            return
+        self._search_term = term
+        self._search_generation += 1
+        if self._search_after_id:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._run_search)
+
+    def _run_search(self):
+        self._search_after_id = None
+        generation = self._search_generation
+        games, term, sort_mode, index = list(self.games), self._search_term, self._sort_mode, self._search_index
+        filters = {facet: set(values) for facet, values in self._facet_filters.items()}
 
-        def _scroll_started(e=None):
-            if not self._is_scrolling:
-                self._is_scrolling = True
+        def worker():
+            try:
+                result = library_index.filter_sort_games(games, term, sort_mode, index, filters)
+                counts = index.facet_counts(term, filters) if index.ready else None
+            except Exception as e:
+                print(f"Search failed: {e}", file=sys.stderr)
+                return
+            try:
+                self.after(0, lambda: self._apply_search_result(generation, result, counts))
+            except RuntimeError:
+                pass
 
-                if self._hovered_card is not None:
-                    try:
-                        self._hovered_card.configure(border_color=UI["border"], border_width=1)
-                    except Exception:
-                        pass
-                    self._hovered_card = None
+        Thread(target=worker, daemon=True).start()
 
-                self.scroll_overlay.place(x=0, y=0, relwidth=0.98, relheight=1)
-                self.scroll_overlay.lift()
-            if self._scroll_idle_after_id:
-                try:
-                    self.after_cancel(self._scroll_idle_after_id)
-                except Exception:
-                    pass
-            self._scroll_idle_after_id = self.after(350, _scroll_stopped)
+    def _apply_search_result(self, generation: int, result: list[GameRecord],
+                             counts: dict[str, dict[str, int]] | None):
+        if self._live_widget("games_canvas") is None:
+            return
+        if generation == self._search_generation and self._current_game_detail is None:
+            self.render_game_buttons(result)
+            self._refresh_facet_controls(counts)
+
+    def _toggle_facet(self, facet: str, value: str):
+        values = self._facet_filters.setdefault(facet, set())
+        if value in values:
+            values.discard(value)
+            if not values:
+                del self._facet_filters[facet]
+        else:
+            values.add(value)
+        self.render_game_buttons()
 
-        def _scroll_stopped():
-            self._is_scrolling = False
-            self._scroll_idle_after_id = None
+    def _set_genre_facet(self, label: str):
+        genre = self._genre_labels.get(label)
+        if genre:
+            self._facet_filters["genre"] = {genre}
+        else:
+            self._facet_filters.pop("genre", None)
+        self.render_game_buttons()
 
-            self.scroll_overlay.place_forget()
+    def _refresh_facet_controls(self, counts: dict[str, dict[str, int]] | None = None):
+        if not hasattr(self, "genre_optionmenu") or not self.genre_optionmenu.winfo_exists():
+            return
+        if counts is None:
+            if not self._search_index.ready:
+                return
+            counts = self._search_index.facet_counts(self._search_term, self._facet_filters)
+        for (facet, value), (button, key) in self._facet_buttons.items():
+            selected = value in self._facet_filters.get(facet, ())
+            button.configure(
+                text=f"{self.t(key)} {counts[facet].get(value, 0)}",
+                **self._button_style("primary" if selected else "ghost")
+            )
 
-            self.after(10, self._process_pending_icons)
+        all_label = self.t("facet_all_genres")
+        selected_genres = self._facet_filters.get("genre", set())
+        genres = dict(counts["genre"])
+        for genre in selected_genres:
+            genres.setdefault(genre, 0)
+        self._genre_labels = {all_label: None}
+        current = all_label
+        for genre in sorted(genres, key=str.casefold):
+            label = f"{genre} ({genres[genre]})"
+            self._genre_labels[label] = genre
+            if genre in selected_genres:
+                current = label
+        self.genre_optionmenu.configure(values=list(self._genre_labels))
+        self.genre_var.set(current)
+
+    def _search_index_built(self):
+        try:
+            self.after(0, self._on_search_index_ready)
+        except RuntimeError:
+            pass
 
-        self.games_scroll.bind("<MouseWheel>", _scroll_started, add="+")
-        self._scroll_canvas.bind("<MouseWheel>", _scroll_started, add="+")
+    def _on_search_index_ready(self):
+        if self._current_game_detail is None and self._live_widget("games_canvas") is not None:
+            self._refresh_game_grid()
 
-        self.after(100, _check_scroll_position)
+    def _check_game_paths(self, games: list[GameRecord] | None = None):
+        index = self._search_index
 
-        self._games_columns = self._calculate_game_columns()
-        self._games_chunk_size = self.settings.get("chunk_size", 12)
-        self._rendered_games_count = 0
-        self._scroll_poll_after_id: str | None = None
+        def worker():
+            try:
+                index.check_paths(games)
+            except Exception as e:
+                print(f"Checking game paths failed: {e}", file=sys.stderr)
+                return
+            try:
+                self.after(0, self._on_game_paths_checked)
+            except RuntimeError:
+                pass
 
-        self.render_game_buttons()
+        Thread(target=worker, daemon=True).start()
 
-    def _on_search_changed(self, event=None):
-        self._search_term = self.search_entry.get().lower()
-        self.render_game_buttons()
+    def _on_game_paths_checked(self):
+        if self._current_game_detail is not None:
+            return
+        if self._live_widget("games_canvas") is None:
+            return
+        if self._facet_filters.get("status"):
+            self._refresh_game_grid()
+        else:
+            self._refresh_facet_controls()
 
     def _set_sort_mode(self, mode: str):
         self._sort_mode = mode
@@ -1210,21 +1440,23 @@ class GameLauncherApp(ctk.CTk):
         self.render_game_buttons()
 
     def _refresh_sort_buttons(self):
-        if not all(hasattr(self, attr) for attr in ("sort_name_btn", "sort_fav_btn", "sort_date_btn")):
+        if not all(hasattr(self, attr) for attr in ("sort_name_btn", "sort_fav_btn", "sort_date_btn", "sort_relevance_btn")):
             return
         buttons = {
             "name": self.sort_name_btn,
             "favorite": self.sort_fav_btn,
             "date_added": self.sort_date_btn,
+            "relevance": self.sort_relevance_btn,
         }
         for mode, button in buttons.items():
             button.configure(**self._button_style("primary" if self._sort_mode == mode else "ghost"))
 
-    def _calculate_game_columns(self) -> int:
+    def _games_grid_width(self) -> int:
         width = 0
-        if hasattr(self, "games_scroll") and self.games_scroll.winfo_exists():
+        canvas = self._live_widget("games_canvas")
+        if canvas is not None:
             try:
-                width = self.games_scroll.winfo_width()
+                width = canvas.winfo_width()
             except Exception:
                 width = 0
         if width <= 1 and hasattr(self, "content_frame"):
@@ -1234,26 +1466,24 @@ class GameLauncherApp(ctk.CTk):
                 width = 0
         if width <= 1:
             width = self.winfo_width() - 300
-        return max(2, min(5, width // 285))
-
-    def _get_filtered_sorted_games(self) -> list[dict]:
-        filtered = self.games
-        if self._search_term:
-            filtered = [g for g in filtered if self._search_term in g.get("name", "").lower()]
+        return width
 
-        if self._sort_mode == "name":
-            filtered = sorted(filtered, key=lambda g: g.get("name", "").lower())
-        elif self._sort_mode == "favorite":
-            filtered = sorted(filtered, key=lambda g: (not g.get("favorite", False), g.get("name", "").lower()))
-        elif self._sort_mode == "date_added":
-            filtered = list(reversed(filtered))
+    def _calculate_game_columns(self) -> int:
+        return max(2, min(5, self._games_grid_width() // 285))
 
-        return filtered
+    def _get_filtered_sorted_games(self) -> list[GameRecord]:
+        return library_index.filter_sort_games(self.games, self._search_term, self._sort_mode, self._search_index,
+                                               self._facet_filters)
 
-    def _toggle_favorite(self, game: dict):
+    def _toggle_favorite(self, game: GameRecord):
         game["favorite"] = not game.get("favorite", False)
-        self.save_games()
-        self.render_game_buttons()
+        self._search_index.update(game)
+        self.save_game(game)
+        self._patch_game_card(game)
+        if self._sort_mode == "favorite" or "favorite" in self._facet_filters:
+            self._refresh_game_grid()
+        else:
+            self._refresh_facet_controls()
 
     def update_games_count_label(self):
         if hasattr(self, "games_count_label"):
@@ -1337,6 +1567,16 @@ class GameLauncherApp(ctk.CTk):
         )
         self.steam_import_btn.grid(row=start_row + 6, column=0, sticky="ew", padx=10, pady=(10, 6))
 
+        reset_index_btn = ctk.CTkButton(
+            parent,
+            text=self.t("reset_scan_index"),
+            command=self.reset_steam_scan_index,
+            height=36,
+            corner_radius=10,
+            **self._button_style("secondary")
+        )
+        reset_index_btn.grid(row=start_row + 7, column=0, sticky="ew", padx=10, pady=(0, 6))
+
         self.remove_all_btn = ctk.CTkButton(
             parent,
             text=self.t("remove_all_games"),
@@ -1345,232 +1585,183 @@ class GameLauncherApp(ctk.CTk):
             corner_radius=10,
             **self._button_style("danger")
         )
-        self.remove_all_btn.grid(row=start_row + 7, column=0, sticky="ew", padx=10, pady=(0, 6))
+        self.remove_all_btn.grid(row=start_row + 8, column=0, sticky="ew", padx=10, pady=(0, 6))
 
-        self.import_progress = ctk.CTkProgressBar(parent, mode="indeterminate")
-        self.import_progress.grid(row=start_row + 8, column=0, sticky="ew", padx=10, pady=(0, 10))
+        self.import_progress = ctk.CTkProgressBar(parent, mode="determinate")
+        self.import_progress.grid(row=start_row + 9, column=0, sticky="ew", padx=10, pady=(0, 10))
         self.import_progress.grid_remove()
+        self._refresh_steam_import_controls()
 
         self.refresh_launcher_info()
         self.update_games_count_label()
-        return start_row + 9
+        return start_row + 10
+
+    def _live_widget(self, attr: str):
+        widget = getattr(self, attr, None)
+        try:
+            if widget is not None and widget.winfo_exists():
+                return widget
+        except Exception:
+            pass
+        return None
+
+    def _refresh_steam_import_controls(self):
+        button = self._live_widget("steam_import_btn")
+        progress = self._live_widget("import_progress")
+        processed, total = self._steam_import_progress
+
+        if self._steam_import_running:
+            if button is not None:
+                cancelling = self._steam_import_cancel is not None and self._steam_import_cancel.is_set()
+                button.configure(
+                    state="disabled" if cancelling else "normal",
+                    text=self.t("steam_import_cancel", processed=processed, total=total or "?"),
+                    command=self.cancel_steam_import
+                )
+            if progress is not None:
+                progress.grid()
+                progress.set(processed / total if total else 0)
+        else:
+            if button is not None:
+                button.configure(state="normal", text=self.t("steam_import"), command=self.import_steam_games)
+            if progress is not None:
+                progress.grid_remove()
 
     def import_steam_games(self):
         if getattr(self, "_steam_import_running", False):
             return
 
         self._steam_import_running = True
+        self._steam_import_cancel = Event()
+        self._steam_import_progress = (0, 0)
+        self._steam_import_added = 0
+        self._refresh_steam_import_controls()
 
-        self.steam_import_btn.configure(state="disabled", text=self.t("steam_import_running"))
-        self.import_progress.grid()
-        self.import_progress.start()
-
-        t = Thread(target=self._steam_import_worker, daemon=True)
+        existing_paths = {g.path for g in self.games if g.path}
+        t = Thread(target=self._steam_import_worker, args=(self._steam_import_cancel, existing_paths), daemon=True)
         t.start()
 
-    def _steam_import_worker(self):
-        try:
-            steam_games = self.scan_steam_games()
+    def cancel_steam_import(self):
+        if self._steam_import_running and self._steam_import_cancel is not None:
+            self._steam_import_cancel.set()
+            self._refresh_steam_import_controls()
+
+    def _steam_import_worker(self, cancel: Event, existing_paths: set[str]):
+        batch: list[GameRecord] = []
+        processed = total = 0
+        delivered_first = False
+        last_post = time.monotonic()
+
+        def post(games: list[GameRecord], done: int, count: int):
+            self.after(0, lambda: self._steam_import_batch(games, done, count))
 
-            existing_paths = {g.get("path") for g in self.games if g.get("path")}
-            new_games = [g for g in steam_games if g.get("path") and g.get("path") not in existing_paths]
-            result = ("ok", new_games, None)
+        try:
+            for progress in self.iter_steam_games(cancel):
+                processed, total = progress.processed, progress.total
+                game = progress.game
+                if game and game.get("path") and game["path"] not in existing_paths:
+                    existing_paths.add(game["path"])
+                    record = GameRecord.from_dict(game)
+                    record["added_at"] = int(time.time())
+                    batch.append(record)
+
+                now = time.monotonic()
+                if (batch and not delivered_first) or now - last_post >= STEAM_IMPORT_BATCH_INTERVAL:
+                    delivered_first = delivered_first or bool(batch)
+                    post(batch, processed, total)
+                    batch = []
+                    last_post = now
+
+            post(batch, processed, total)
+            result = ("cancelled" if cancel.is_set() else "ok", None)
         except Exception as e:
-            result = ("err", [], str(e))
+            post(batch, processed, total)
+            result = ("err", str(e))
 
         self.after(0, lambda: self._steam_import_done(*result))
 
-    def _steam_import_done(self, status: str, new_games: list[dict], err: str | None):
+    def _steam_import_batch(self, new_games: list[GameRecord], processed: int, total: int):
+        self._steam_import_progress = (processed, total)
+        if new_games:
+            self.games.extend(new_games)
+            self._search_index.add(new_games)
+            self._check_game_paths(new_games)
+            self.save_new_games(new_games)
+            self._steam_import_added += len(new_games)
+            self.update_games_count_label()
+            self._refresh_library_after_import_batch()
+        self._refresh_steam_import_controls()
+
+    def _refresh_library_after_import_batch(self):
+        if self._active_view == "library":
+            self._refresh_game_grid()
+
+    def _steam_import_done(self, status: str, err: str | None):
         try:
             if status == "err":
                 messagebox.showerror("Steam Import", self.t("steam_import_error", error=err))
                 return
 
-            self.games.extend(new_games)
-            self.save_games()
-            self.render_game_buttons()
-
-            messagebox.showinfo(
-                "Steam Import",
-                self.t("steam_import_done", count=len(new_games))
-            )
+            key = "steam_import_cancelled" if status == "cancelled" else "steam_import_done"
+            messagebox.showinfo("Steam Import", self.t(key, count=self._steam_import_added))
         finally:
-            self.import_progress.stop()
-            self.import_progress.grid_remove()
-            self.steam_import_btn.configure(state="normal", text=self.t("steam_import"))
             self._steam_import_running = False
+            self._steam_import_cancel = None
+            self._refresh_steam_import_controls()
+
+    def iter_steam_games(self, cancel: Event | None = None):
+        steam_path = self.get_steam_install_path()
+        if not steam_path:
+            return iter(())
+
+        library_apps = steam_scanner.read_library_folders(steam_path)
+        return steam_scanner.iter_steam_scan(
+            list(library_apps),
+            workers=self.settings.get("scan_workers", 0),
+            index=self._get_steam_scan_index(),
+            library_apps=library_apps,
+            appinfo_path=os.path.join(steam_path, "appcache", "appinfo.vdf"),
+            cancel=cancel
+        )
 
     def scan_steam_games(self) -> list[dict]:
         steam_path = self.get_steam_install_path()
         if not steam_path:
             return []
 
-        libraries = self.get_steam_library_paths(steam_path)
-        found_games: list[dict] = []
-
-        seen_roots: set[str] = set()
-
-        for lib in libraries:
-            steamapps = os.path.join(lib, "steamapps")
-            if not os.path.isdir(steamapps):
-                continue
-
-            for file in os.listdir(steamapps):
-                if not (file.startswith("appmanifest_") and file.endswith(".acf")):
-                    continue
-
-                acf_path = os.path.join(steamapps, file)
-                meta = self.parse_acf_manifest(acf_path)
-
-                name = meta.get("name")
-                installdir = meta.get("installdir")
-                steam_appid = meta.get("steam_appid") or os.path.splitext(file)[0].replace("appmanifest_", "")
-
-                if not name or not installdir:
-                    continue
-
-                game_root = os.path.join(lib, "steamapps", "common", installdir)
-                game_root_norm = os.path.normpath(game_root).lower()
-
-                if game_root_norm in seen_roots:
-                    continue
-                seen_roots.add(game_root_norm)
-
-                exe_path = self.find_game_exe(game_root, name)
-
-                if not exe_path:
-                    continue
+        library_apps = steam_scanner.read_library_folders(steam_path)
+        return steam_scanner.scan_steam_libraries(
+            list(library_apps),
+            workers=self.settings.get("scan_workers", 0),
+            index=self._get_steam_scan_index(),
+            library_apps=library_apps,
+            appinfo_path=os.path.join(steam_path, "appcache", "appinfo.vdf")
+        )
 
-                found_games.append({
-                    "name": name,
-                    "path": exe_path,
-                    "source": "Steam",
-                    "steam_appid": steam_appid
-                })
+    def _get_steam_scan_index(self) -> steam_scanner.SteamScanIndex:
+        if self._steam_scan_index is None:
+            self._steam_scan_index = steam_scanner.SteamScanIndex(
+                os.path.join(cache_data_dir(), STEAM_SCAN_INDEX_FILE)
+            )
+        return self._steam_scan_index
 
-        return found_games
+    def reset_steam_scan_index(self):
+        if self._steam_import_running:
+            return
+        self._get_steam_scan_index().clear()
+        messagebox.showinfo(self.t("scan_index_reset_title"), self.t("scan_index_reset"))
 
     def get_steam_install_path(self) -> str | None:
-        steam_path = (
-            read_reg_str(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam", "SteamPath")
-            or read_reg_str(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath")
-            or read_reg_str(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Valve\Steam", "InstallPath")
-        )
-        return os.path.normpath(steam_path) if steam_path else None
+        return steam_scanner.find_steam_install_path()
 
     def get_steam_library_paths(self, steam_path: str) -> list[str]:
-        paths = [os.path.normpath(steam_path)]
-
-        vdf_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
-        if not os.path.exists(vdf_path):
-            return paths
-
-        try:
-            with open(vdf_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-
-            for p in re.findall(r'"path"\s*"([^"]+)"', content):
-                paths.append(os.path.normpath(p.replace("\\\\", "\\")))
-        except Exception:
-            pass
-
-        return list(dict.fromkeys(p for p in paths if p))
+        return steam_scanner.get_steam_library_paths(steam_path)
 
     def parse_acf_manifest(self, acf_path: str) -> dict:
-        try:
-            with open(acf_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            name = re.search(r'"name"\s*"([^"]+)"', content)
-            installdir = re.search(r'"installdir"\s*"([^"]+)"', content)
-            appid = re.search(r'"appid"\s*"([^"]+)"', content)
-
-            return {
-                "name": name.group(1) if name else None,
-                "installdir": installdir.group(1) if installdir else None,
-                "steam_appid": appid.group(1) if appid else None,
-            }
-        except Exception:
-            return {"name": None, "installdir": None, "steam_appid": None}
+        return steam_scanner.parse_acf_manifest(acf_path)
 
     def find_game_exe(self, game_root: str, game_name: str = "") -> str | None:
-        if not os.path.isdir(game_root):
-            return None
-
-        game_name_clean = re.sub(r'[^a-z0-9]', '', game_name.lower()) if game_name else ""
-        folder_name = os.path.basename(game_root).lower()
-        folder_clean = re.sub(r'[^a-z0-9]', '', folder_name)
-
-        candidates: list[str] = []
-
-        try:
-            for f in os.listdir(game_root):
-                if f.lower().endswith(".exe"):
-                    candidates.append(os.path.join(game_root, f))
-        except Exception:
-            pass
-
-        if len(candidates) < 3:
-            for root, dirs, files in os.walk(game_root):
-                low = root.lower()
-
-                if any(x in low for x in ["_commonredist", "redist", "redistributable", "vcredist",
-                                          "directx", "dotnet", "installers", "support", "_data"]):
-                    continue
-
-                for f in files:
-                    if f.lower().endswith(".exe"):
-                        candidates.append(os.path.join(root, f))
-
-                if len(candidates) > 50:
-                    break
-
-        if not candidates:
-            return None
-
-        def score(p: str) -> int:
-            n = os.path.basename(p).lower()
-            n_clean = re.sub(r'[^a-z0-9]', '', n)
-
-            bad_words = ["unins", "setup", "installer", "install", "crash", "crashreport",
-                        "report", "helper", "support", "redist", "vc_redist", "vcredist",
-                        "directx", "dotnet", "handler", "crs-handler", "connectinstaller",
-                        "uplay", "ubisoft", "ea", "origin", "battlenet", "epicgames",
-                        "steam", "launcher", "update", "patcher", "config", "settings",
-                        "unreal", "unity", "activation", "register"]
-
-            if any(w in n for w in bad_words):
-                return -100
-
-            points = 10
-
-            if game_name_clean and game_name_clean in n_clean:
-                points += 50
-
-            if folder_clean and len(folder_clean) > 3 and folder_clean in n_clean:
-                points += 40
-
-            if os.path.dirname(p) == os.path.normpath(game_root):
-                points += 20
-
-            parent = os.path.basename(os.path.dirname(p)).lower()
-            if parent in ["bin", "binaries", "bin64", "binary"]:
-                points += 15
-
-            if any(x in n for x in ["x64", "win64", "64bit"]):
-                points += 5
-
-            depth = p.count(os.sep) - game_root.count(os.sep)
-            if depth > 2:
-                points -= (depth - 2) * 5
-
-            return points
-
-        candidates.sort(key=score, reverse=True)
-
-        if candidates and score(candidates[0]) > 0:
-            return candidates[0]
-
-        return None
+        return steam_scanner.find_game_exe(game_root, game_name)
 
     def detect_launchers(self):
         launchers = {}
@@ -1650,6 +1841,67 @@ class GameLauncherApp(ctk.CTk):
         )
         self.language_optionmenu.grid(row=2, column=1, sticky="ew", padx=(10, 16), pady=(0, 16))
 
+        performance_panel = self._create_panel(settings_scroll)
+        performance_panel.pack(fill="x", pady=(0, 12))
+        performance_panel.grid_columnconfigure(1, weight=1)
+
+        ctk.CTkLabel(
+            performance_panel,
+            text=self.t("performance").rstrip(":"),
+            font=self.font_subsection,
+            text_color=UI["text"]
+        ).grid(row=0, column=0, columnspan=2, sticky="w", padx=16, pady=(14, 10))
+
+        scan_workers_label = ctk.CTkLabel(
+            performance_panel,
+            text=self.t("scan_workers"),
+            text_color=UI["muted"]
+        )
+        scan_workers_label.grid(row=1, column=0, sticky="w", padx=16, pady=(0, 16))
+
+        scan_worker_choices = [self.t("scan_workers_auto")] + [str(n) for n in (1, 2, 4, 8, 16)]
+        saved_workers = self.settings.get("scan_workers", 0)
+        self.scan_workers_var = ctk.StringVar(
+            value=str(saved_workers) if str(saved_workers) in scan_worker_choices[1:] else scan_worker_choices[0]
+        )
+        self.scan_workers_optionmenu = ctk.CTkOptionMenu(
+            performance_panel,
+            values=scan_worker_choices,
+            variable=self.scan_workers_var
+        )
+        self.scan_workers_optionmenu.grid(row=1, column=1, sticky="ew", padx=(10, 16), pady=(0, 16))
+
+        storage_label = ctk.CTkLabel(
+            performance_panel,
+            text=self.t("library_storage"),
+            text_color=UI["muted"]
+        )
+        storage_label.grid(row=2, column=0, sticky="w", padx=16, pady=(0, 16))
+
+        self.storage_var = ctk.StringVar(value=self.t(f"storage_{self._library_store.name}"))
+        self.storage_optionmenu = ctk.CTkOptionMenu(
+            performance_panel,
+            values=[self.t(f"storage_{backend}") for backend in library_store.LIBRARY_BACKENDS],
+            variable=self.storage_var
+        )
+        self.storage_optionmenu.grid(row=2, column=1, sticky="ew", padx=(10, 16), pady=(0, 16))
+
+        renderer_label = ctk.CTkLabel(
+            performance_panel,
+            text=self.t("library_renderer"),
+            text_color=UI["muted"]
+        )
+        renderer_label.grid(row=3, column=0, sticky="w", padx=16, pady=(0, 16))
+
+        renderer = self.settings.get("library_renderer", DEFAULT_SETTINGS["library_renderer"])
+        self.renderer_var = ctk.StringVar(value=self.t(f"renderer_{renderer}"))
+        self.renderer_optionmenu = ctk.CTkOptionMenu(
+            performance_panel,
+            values=[self.t(f"renderer_{name}") for name in LIBRARY_RENDERERS],
+            variable=self.renderer_var
+        )
+        self.renderer_optionmenu.grid(row=3, column=1, sticky="ew", padx=(10, 16), pady=(0, 16))
+
         api_panel = self._create_panel(settings_scroll)
         api_panel.pack(fill="x", pady=(0, 12))
         api_panel.grid_columnconfigure(0, weight=1)
@@ -1854,15 +2106,25 @@ class GameLauncherApp(ctk.CTk):
 
     def _save_all_settings(self):
         self.settings["theme"] = self.theme_var.get()
-        self.settings["chunk_size"] = DEFAULT_SETTINGS["chunk_size"]
         self.settings["cache_size_mb"] = DEFAULT_SETTINGS["cache_size_mb"]
         self.settings["steamgriddb_api_key"] = self.steamgriddb_key_entry.get().strip()
         self.settings["rawg_api_key"] = self.rawg_key_entry.get().strip()
         self.settings["artwork_provider"] = "steamgriddb"
+        scan_workers = self.scan_workers_var.get()
+        self.settings["scan_workers"] = int(scan_workers) if scan_workers.isdigit() else 0
+        self.settings["library_renderer"] = next(
+            (name for name in LIBRARY_RENDERERS if self.t(f"renderer_{name}") == self.renderer_var.get()),
+            DEFAULT_SETTINGS["library_renderer"]
+        )
         previous_language = self.settings.get("language", DEFAULT_SETTINGS["language"])
         self.settings["language"] = self._language_code(self.language_var.get())
 
-        self._games_chunk_size = self.settings["chunk_size"]
+        backend = next(
+            (b for b in library_store.LIBRARY_BACKENDS if self.t(f"storage_{b}") == self.storage_var.get()),
+            self._library_store.name
+        )
+        if backend != self._library_store.name:
+            self._switch_library_backend(backend)
 
         self.save_settings()
 
@@ -1903,104 +2165,152 @@ class GameLauncherApp(ctk.CTk):
                 ))
         Thread(target=worker, daemon=True).start()
 
-    def _state_file_path(self, filename: str) -> str:
-        return os.path.join(app_data_dir(), filename)
+    def load_games(self):
+        self.games = [GameRecord.from_dict(game) for game in self._library_store.load_games()]
+        self._search_index = library_index.SearchIndex(self.games)
+        self._check_game_paths()
 
-    def _legacy_state_candidates(self, filename: str) -> list[str]:
-        candidates = [
-            os.path.abspath(filename),
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), filename),
-        ]
-        seen = set()
-        result = []
-        for path in candidates:
-            norm = os.path.normcase(os.path.abspath(path))
-            if norm not in seen:
-                seen.add(norm)
-                result.append(path)
-        return result
-
-    def _load_json_state(self, filename: str, default):
-        state_path = self._state_file_path(filename)
-        paths_to_try = [state_path]
-        if not os.path.exists(state_path):
-            paths_to_try.extend(self._legacy_state_candidates(filename))
-
-        for path in paths_to_try:
-            if not os.path.exists(path):
-                continue
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if path != state_path:
-                    self._write_json_state(filename, data)
-                return data
-            except Exception as e:
-                print(f"Failed to load {filename} from {path}: {e}", file=sys.stderr)
+    def save_games(self):
+        self._library_store.replace_games(self.games)
+
+    def save_game(self, game: GameRecord):
+        self._library_store.update_game(game)
+
+    def save_new_games(self, games: list[GameRecord]):
+        self._library_store.add_games(games)
+
+    def delete_saved_game(self, game: GameRecord):
+        self._library_store.remove_game(game)
+
+    def load_settings(self) -> dict:
+        return self._library_store.load_settings()
 
-        return default.copy() if isinstance(default, dict) else list(default)
+    def save_settings(self):
+        self._library_store.save_settings(self.settings)
 
-    def _write_json_state(self, filename: str, data) -> bool:
-        state_path = self._state_file_path(filename)
-        state_dir = os.path.dirname(state_path)
+    def _switch_library_backend(self, backend: str):
+        current = self._library_store
+        current.flush()
+        target = None
         try:
-            os.makedirs(state_dir, exist_ok=True)
-            fd, temp_path = tempfile.mkstemp(prefix=f".{filename}.", suffix=".tmp", dir=state_dir, text=True)
-            try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=4, ensure_ascii=False)
-                    f.write("\n")
-                os.replace(temp_path, state_path)
-                return True
-            finally:
-                if os.path.exists(temp_path):
-                    try:
-                        os.remove(temp_path)
-                    except OSError:
-                        pass
+            target = library_store.open_library_store(backend=backend)
+            if target.name != backend:
+                raise RuntimeError(f"{backend} storage is not available")
+            if not (target.replace_games([dict(g) for g in self.games]) and target.save_settings(self.settings)):
+                raise RuntimeError("could not write the library")
         except Exception as e:
-            print(f"Failed to save {filename} to {state_path}: {e}", file=sys.stderr)
-            return False
+            print(f"Failed to switch library storage to {backend}: {e}", file=sys.stderr)
+            if target is not None:
+                target.close()
+                if target.name == backend:
+                    library_store.retire_library_backend(backend)
+            self.storage_var.set(self.t(f"storage_{current.name}"))
+            messagebox.showerror(self.t("save_failed_title"), self.t("storage_switch_failed"))
+            return
 
-    def load_games(self):
-        games = self._load_json_state(GAMES_FILE, [])
-        self.games = games if isinstance(games, list) else []
+        current.close()
+        library_store.retire_library_backend(current.name)
+        self._library_store = library_store.WriteBehindStore(target, on_error=self._on_store_error)
+        self._library_store.track_ids(self.games)
 
-    def save_games(self):
-        if not self._write_json_state(GAMES_FILE, self.games):
-            messagebox.showerror(self.t("save_failed_title"), self.t("save_games_failed"))
+    def _on_store_error(self, kind: str):
+        key = "save_games_failed" if kind == "games" else "save_settings_failed"
+        try:
+            self.after(0, lambda: self._show_notice(f"{self.t('save_failed_title')}: {self.t(key)}"))
+        except RuntimeError:
+            pass
 
-    def load_settings(self) -> dict:
-        loaded = self._load_json_state(SETTINGS_FILE, DEFAULT_SETTINGS)
-        settings = DEFAULT_SETTINGS.copy()
-        if isinstance(loaded, dict):
-            settings.update(loaded)
-        return settings
+    def _show_notice(self, text: str, duration_ms: int = 6000):
+        notice = self._live_widget("notice_label")
+        if notice is None:
+            notice = ctk.CTkLabel(
+                self,
+                text="",
+                font=self.font_body,
+                fg_color=UI["danger"],
+                text_color="#ffffff",
+                corner_radius=8,
+                padx=14,
+                pady=8
+            )
+            self.notice_label = notice
+        notice.configure(text=text)
+        notice.place(relx=0.98, rely=0.97, anchor="se")
+        notice.lift()
+        if self._notice_after_id is not None:
+            self.after_cancel(self._notice_after_id)
+        self._notice_after_id = self.after(duration_ms, self._hide_notice)
+
+    def _hide_notice(self):
+        self._notice_after_id = None
+        notice = self._live_widget("notice_label")
+        if notice is not None:
+            notice.place_forget()
+
+    def _log_first_paint(self):
+        if not os.environ.get("ALPHA_LAUNCHER_PROFILE_STARTUP"):
+            return
+        first_paint_ms = (time.perf_counter() - _PROCESS_CLOCK_START) * 1000
+        print(
+            f"startup: state={self._state_source} games={len(self.games)} "
+            f"state_load_ms={self._state_load_ms:.1f} first_paint_ms={first_paint_ms:.1f}",
+            file=sys.stderr
+        )
 
-    def save_settings(self):
-        if not self._write_json_state(SETTINGS_FILE, self.settings):
-            messagebox.showerror(self.t("save_failed_title"), self.t("save_settings_failed"))
+    def _on_close(self):
+        chunk_sizes = self.settings.get("card_chunk_sizes", {})
+        if chunk_sizes.get(platform.node()) != self._card_budget.chunk_size:
+            self.settings["card_chunk_sizes"] = {**chunk_sizes, platform.node(): self._card_budget.chunk_size}
+            self.save_settings()
+        exported = self._library_store.export_json()
+        saved = self._library_store.close()
+        if saved and exported and self.settings.get("fast_start_snapshot", True):
+            games = [game.to_dict() for game in self.games]
+            library_store.write_library_snapshot(self._library_store.name, games, self.settings)
+        else:
+            library_store.remove_library_snapshot()
+        self.destroy()
 
-    def render_game_buttons(self):
+    def render_game_buttons(self, display_games: list[GameRecord] | None = None):
         if getattr(self, "_is_resizing", False):
             return
-
         self._ui_image_refs.clear()
+        self._games_columns = self._calculate_game_columns()
+        if display_games is None:
+            self._search_generation += 1
+            display_games = self._get_filtered_sorted_games()
+            self._refresh_facet_controls()
 
-        for widget in self.games_scroll.winfo_children():
-            widget.destroy()
+        self.games_canvas.yview_moveto(0)
+        self._show_display_games(display_games)
 
-        columns = self._calculate_game_columns()
-        self._games_columns = columns
-        for col in range(columns):
-            self.games_scroll.grid_columnconfigure(col, weight=1, uniform="games")
+    def _refresh_game_grid(self):
+        if self._live_widget("games_canvas") is None or self._current_game_detail is not None:
+            return
+        self._search_generation += 1
+        self._show_display_games(self._get_filtered_sorted_games())
+        self._refresh_facet_controls()
+
+    def _show_display_games(self, display_games: list[GameRecord]):
+        canvas = self.games_canvas
+        if self._grid_empty is not None:
+            canvas.delete(self._grid_empty_item)
+            self._grid_empty.destroy()
+            self._grid_empty = None
+            self._grid_empty_item = None
 
-        self._display_games = self._get_filtered_sorted_games()
+        self._display_games = display_games
+        self._layout_game_grid(refresh=True)
 
-        if not self._display_games:
-            msg = self.t("no_games_found") if self._search_term else self.t("no_games_empty")
-            empty = self._create_panel(self.games_scroll, fg_color=UI["surface_alt"], corner_radius=14)
-            empty.grid(row=0, column=0, columnspan=columns, pady=22, padx=12, sticky="nsew")
+        if not display_games:
+            msg = self.t("no_games_found") if self._search_term or self._facet_filters else self.t("no_games_empty")
+            empty = self._create_panel(canvas, fg_color=UI["surface_alt"], corner_radius=14)
+            self._grid_empty_item = canvas.create_window(
+                GAME_CARD_PADDING + 2, 22,
+                window=empty,
+                anchor="nw",
+                width=max(1, self._games_grid_width() - 2 * GAME_CARD_PADDING - 4)
+            )
             label = ctk.CTkLabel(
                 empty,
                 text=msg,
@@ -2009,15 +2319,13 @@ class GameLauncherApp(ctk.CTk):
                 justify="center"
             )
             label.pack(expand=True, fill="both", padx=20, pady=34)
-
-            self._cancel_games_scroll_poll()
+            self._grid_empty = empty
             return
 
-        self._rendered_games_count = 0
-
-        self._render_next_game_chunk()
-
-        self._setup_games_scroll_poll()
+        try:
+            self.after(500, self._start_idle_icon_prewarm)
+        except Exception:
+            pass
 
         self.update_games_count_label()
 
@@ -2032,8 +2340,8 @@ class GameLauncherApp(ctk.CTk):
                 except Exception:
                     pass
 
-            if game.get("path"):
-                exe_path = os.path.normpath(game["path"])
+            if game.path:
+                exe_path = game.norm_path
                 self.invalidate_icon_cache(exe_path)
 
                 try:
@@ -2044,8 +2352,9 @@ class GameLauncherApp(ctk.CTk):
                     pass
 
             self.games = [g for g in self.games if g is not game]
-            self.save_games()
-            self.render_game_buttons()
+            self._search_index.remove([game])
+            self.delete_saved_game(game)
+            self._refresh_game_grid()
             self.update_games_count_label()
 
     def remove_all_games(self):
@@ -2067,8 +2376,8 @@ class GameLauncherApp(ctk.CTk):
                     except Exception:
                         pass
 
-                if game.get("path"):
-                    exe_path = os.path.normpath(game["path"])
+                if game.path:
+                    exe_path = game.norm_path
 
                     self.invalidate_icon_cache(exe_path)
 
@@ -2080,18 +2389,27 @@ class GameLauncherApp(ctk.CTk):
                         pass
 
             self.games = []
+            self._search_index.clear()
             self.save_games()
             self.render_game_buttons()
             self.update_games_count_label()
             messagebox.showinfo(self.t("remove_all_done_title"), self.t("remove_all_done"))
 
-    def _show_game_detail(self, game: dict):
+    def _show_game_detail(self, game: GameRecord):
         self._current_game_detail = game
+        if self._scroll_idle_after_id:
+            try:
+                self.after_cancel(self._scroll_idle_after_id)
+            except Exception:
+                pass
+            self._games_scroll_stopped()
 
-        for widget in self.left_frame.winfo_children():
+        for widget in self.detail_frame.winfo_children():
             widget.destroy()
+        self.left_frame.grid_remove()
+        self.detail_frame.grid()
 
-        detail_scroll = ctk.CTkScrollableFrame(self.left_frame, fg_color="transparent")
+        detail_scroll = ctk.CTkScrollableFrame(self.detail_frame, fg_color="transparent")
         detail_scroll.pack(fill="both", expand=True)
 
         back_btn = ctk.CTkButton(
@@ -2183,13 +2501,40 @@ class GameLauncherApp(ctk.CTk):
 
         def fetch_info():
             info = self._fetch_game_info(game.get("name", ""))
+            self.after(0, lambda: self._remember_game_genres(game, info.get("genres")))
             self.after(0, lambda: self._display_game_info(detail_scroll, loading_label, info))
 
         Thread(target=fetch_info, daemon=True).start()
 
+    def _remember_game_genres(self, game: GameRecord, genres: list[str] | None):
+        genres = [genre for genre in genres or [] if genre]
+        if not genres or game.get("genres") == genres or game not in self.games:
+            return
+        game["genres"] = genres
+        self._search_index.update(game)
+        self.save_game(game)
+
     def _hide_game_detail(self):
-        self._current_game_detail = None
-        self.show_view("library")
+        game, self._current_game_detail = self._current_game_detail, None
+        if self._live_widget("detail_frame") is None or self._live_widget("games_canvas") is None:
+            self.show_view("library")
+            return
+        self.detail_frame.grid_remove()
+        for widget in self.detail_frame.winfo_children():
+            widget.destroy()
+        self.left_frame.grid()
+
+        if self._hovered_card is not None:
+            try:
+                self._hovered_card.configure(border_color=UI["border"], border_width=1)
+            except Exception:
+                pass
+            self._hovered_card = None
+        self._set_canvas_hover(None, "")
+        card = self._game_card(game) if game is not None else None
+        if card is not None:
+            self._unbind_game_card(card)
+        self._refresh_game_grid()
 
     def _fetch_game_info(self, game_name: str) -> dict:
         if not requests:
@@ -2202,7 +2547,7 @@ class GameLauncherApp(ctk.CTk):
         try:
             search_name = game_name
 
-            search_name = re.sub(r'([a-z])(\d)', r'\1 \2', search_name, flags=re.IGNORECASE)
+            search_name = library_index.split_letter_digits(search_name)
 
             for suffix in [" Enhanced", " Remastered", " Edition", " GOTY", " Complete", " Definitive"]:
                 if suffix.lower() in search_name.lower():
@@ -2266,6 +2611,8 @@ class GameLauncherApp(ctk.CTk):
             return {"error": f"Failed to fetch info: {str(e)}"}
 
     def _display_game_info(self, parent: ctk.CTkScrollableFrame, loading_label: ctk.CTkLabel, info: dict):
+        if not parent.winfo_exists():
+            return
         loading_label.destroy()
 
         if info.get("error"):
@@ -2406,10 +2753,12 @@ class GameLauncherApp(ctk.CTk):
             return
 
         name = os.path.splitext(os.path.basename(file_path))[0]
-        new_game = {"name": name, "path": file_path}
+        new_game = GameRecord(name=name, path=file_path, added_at=int(time.time()))
         self.games.append(new_game)
-        self.save_games()
-        self.render_game_buttons()
+        self._search_index.add([new_game])
+        self._check_game_paths([new_game])
+        self.save_new_games([new_game])
+        self._refresh_game_grid()
 
     def launch_game(self, game):
         path = game["path"]
@@ -2418,12 +2767,16 @@ class GameLauncherApp(ctk.CTk):
                 self.t("file_not_found_title"), self.t("file_not_found", path=path))
             return
 
+        working_dir = game.get("working_dir")
         try:
-            os.startfile(path)
+            if working_dir and os.path.isdir(working_dir):
+                os.startfile(path, cwd=working_dir)
+            else:
+                os.startfile(path)
         except Exception as e:
             messagebox.showerror(self.t("launch_error_title"), str(e))
 
-    def change_game_artwork(self, game: dict):
+    def change_game_artwork(self, game: GameRecord):
         file_path = filedialog.askopenfilename(
             title=self.t("select_artwork"),
             filetypes=[
@@ -2440,13 +2793,13 @@ class GameLauncherApp(ctk.CTk):
             Image.open(file_path).convert("RGBA").save(custom_path, format="PNG")
             game["artwork_path"] = custom_path
             self.invalidate_artwork_cache(game)
-            self.save_games()
+            self.save_game(game)
             messagebox.showinfo(self.t("artwork_saved_title"), self.t("artwork_saved"))
             self._show_game_detail(game)
         except Exception as e:
             messagebox.showerror(self.t("artwork_failed_title"), self.t("artwork_failed", error=e))
 
-    def refresh_game_artwork(self, game: dict):
+    def refresh_game_artwork(self, game: GameRecord):
         old_override = game.pop("artwork_path", None)
         if old_override and os.path.exists(old_override):
             try:
@@ -2463,10 +2816,10 @@ class GameLauncherApp(ctk.CTk):
                 pass
 
         self.invalidate_artwork_cache(game)
-        self.save_games()
+        self.save_game(game)
         self._show_game_detail(game)
 
-    def _set_game_artwork_async(self, game: dict, size: tuple[int, int], label: ctk.CTkLabel, asset_type: str = "grid"):
+    def _set_game_artwork_async(self, game: GameRecord, size: tuple[int, int], label: ctk.CTkLabel, asset_type: str = "grid"):
         if self._is_resizing or self._is_scrolling:
             return
 
@@ -2507,17 +2860,17 @@ class GameLauncherApp(ctk.CTk):
 
         Thread(target=worker, daemon=True).start()
 
-    def _on_artwork_ready(self, game: dict, size: tuple[int, int], label: ctk.CTkLabel, asset_type: str):
+    def _on_artwork_ready(self, game: GameRecord, size: tuple[int, int], label: ctk.CTkLabel, asset_type: str):
         artwork_id = self._game_artwork_id(game)
         pil_key = (artwork_id, asset_type)
         with self._icon_cache_lock:
             self._artwork_load_inflight.discard(pil_key)
-        if not label.winfo_exists():
+        if not label.winfo_exists() or not self._label_shows(label, game=game):
             return
         with self._icon_cache_lock:
             pil_artwork = self._artwork_pil_cache.get(pil_key)
         if pil_artwork is None:
-            self._set_icon_async(game.get("path"), (min(size), min(size)), label)
+            self._set_icon_async(game.norm_path, (min(size), min(size)), label)
             return
         img = self.get_game_artwork_image(game, size, asset_type)
         label.configure(image=img)
@@ -2534,7 +2887,6 @@ class GameLauncherApp(ctk.CTk):
         if not exe_path:
             return
 
-        exe_path = os.path.normpath(exe_path)
         w, h = size
         key = (exe_path, w, h)
 
@@ -2576,7 +2928,7 @@ class GameLauncherApp(ctk.CTk):
         if self._is_scrolling:
             self._pending_icon_updates.append((exe_path, size, label))
             return
-        if label.winfo_exists():
+        if label.winfo_exists() and self._label_shows(label, exe_path=exe_path):
             label.configure(image=img)
             self._ui_image_refs.append(img)
 
@@ -2584,83 +2936,95 @@ class GameLauncherApp(ctk.CTk):
         pending = list(self._pending_icon_updates)
         self._pending_icon_updates.clear()
         for exe_path, size, label in pending:
-            if not label.winfo_exists():
+            if not label.winfo_exists() or not self._label_shows(label, exe_path=exe_path):
                 continue
             img = self.get_game_icon_image(exe_path, size)
             label.configure(image=img)
             self._ui_image_refs.append(img)
 
-    def _create_game_card(self, parent: ctk.CTkScrollableFrame, index: int, game: dict):
-        columns = getattr(self, "_games_columns", 3)
-        row, col = divmod(index, columns)
+    def _card_fonts(self) -> dict[str, ctk.CTkFont]:
+        if self._card_font_cache is None:
+            self._card_font_cache = {
+                "star": ctk.CTkFont(size=16),
+                "name": ctk.CTkFont(size=14, weight="bold"),
+                "info": ctk.CTkFont(size=12, weight="bold"),
+                "delete": ctk.CTkFont(size=14),
+            }
+        return self._card_font_cache
+
+    def _create_game_card(self, canvas: ctk.CTkCanvas) -> dict:
+        fonts = self._card_fonts()
+        card = {"game": None, "index": -1, "art_pending": False}
 
-        card = self._create_panel(parent, fg_color=UI["surface_alt"], border_width=1, border_color=UI["border"], corner_radius=14, cursor="hand2")
-        card.grid(row=row, column=col, padx=10, pady=10, sticky="nsew")
-        card.configure(width=270, height=252)
-        card.grid_propagate(False)
-        card.pack_propagate(False)
+        frame = self._create_panel(canvas, fg_color=UI["surface_alt"], border_width=1, border_color=UI["border"], corner_radius=14, cursor="hand2")
+        frame.configure(width=270, height=GAME_CARD_HEIGHT)
+        frame.grid_propagate(False)
+        frame.pack_propagate(False)
+        card["frame"] = frame
+        card["item"] = canvas.create_window(0, 0, window=frame, anchor="nw", state="hidden")
+
+        def run(action):
+            if card["game"] is not None:
+                action(card["game"])
 
         def show_detail(e=None):
-            self._show_game_detail(game)
+            run(self._show_game_detail)
 
         def on_enter(e=None):
             if not self._is_scrolling:
-                if self._hovered_card is not None and self._hovered_card != card:
+                if self._hovered_card is not None and self._hovered_card != frame:
                     try:
                         self._hovered_card.configure(border_color=UI["border"], border_width=1)
                     except Exception:
                         pass
-                self._hovered_card = card
-                card.configure(border_color=UI["border_hover"], border_width=2)
+                self._hovered_card = frame
+                frame.configure(border_color=UI["border_hover"], border_width=2)
 
         def on_leave(e=None):
             if self._is_scrolling:
                 return
 
             try:
-                x = card.winfo_pointerx() - card.winfo_rootx()
-                y = card.winfo_pointery() - card.winfo_rooty()
-                if 0 <= x < card.winfo_width() and 0 <= y < card.winfo_height():
+                x = frame.winfo_pointerx() - frame.winfo_rootx()
+                y = frame.winfo_pointery() - frame.winfo_rooty()
+                if 0 <= x < frame.winfo_width() and 0 <= y < frame.winfo_height():
                     return
             except Exception:
                 pass
 
-            card.configure(border_color=UI["border"], border_width=1)
-            if self._hovered_card == card:
+            frame.configure(border_color=UI["border"], border_width=1)
+            if self._hovered_card == frame:
                 self._hovered_card = None
 
-        card.bind("<Enter>", on_enter)
-        card.bind("<Leave>", on_leave)
-        card.bind("<Button-1>", show_detail)
+        frame.bind("<Enter>", on_enter)
+        frame.bind("<Leave>", on_leave)
+        frame.bind("<Button-1>", show_detail)
 
-        is_fav = game.get("favorite", False)
         fav_btn = ctk.CTkButton(
-            card,
-            text="⭐" if is_fav else "☆",
+            frame,
+            text="☆",
             width=30,
             height=30,
             fg_color="transparent",
             hover_color=UI["surface_hover"],
-            command=lambda g=game: self._toggle_favorite(g),
-            font=ctk.CTkFont(size=16)
+            command=lambda: run(self._toggle_favorite),
+            font=fonts["star"]
         )
         fav_btn.place(relx=0.95, rely=0.05, anchor="ne")
         fav_btn.bind("<Button-1>", lambda e: "break", add="+")
+        card["fav_btn"] = fav_btn
 
-        icon_label = ctk.CTkLabel(card, text="", cursor="hand2", width=214, height=100)
+        icon_label = ctk.CTkLabel(frame, text="", cursor="hand2", width=GAME_CARD_ART_SIZE[0], height=GAME_CARD_ART_SIZE[1])
         icon_label.pack(side="top", pady=(14, 8))
         icon_label.pack_propagate(False)
         icon_label.bind("<Button-1>", show_detail)
-
-        fallback_img = self.get_game_icon_image(game.get("path", ""), (64, 64))
-        icon_label.configure(image=fallback_img)
-        self._ui_image_refs.append(fallback_img)
-        self._set_game_artwork_async(game, (214, 100), icon_label)
+        card["icon_label"] = icon_label
+        self._grid_label_cards[str(icon_label)] = card
 
         name_label = ctk.CTkLabel(
-            card,
-            text=game.get("name", "Unknown"),
-            font=ctk.CTkFont(size=14, weight="bold"),
+            frame,
+            text="",
+            font=fonts["name"],
             text_color=UI["text"],
             wraplength=210,
             cursor="hand2",
@@ -2668,20 +3032,20 @@ class GameLauncherApp(ctk.CTk):
         )
         name_label.pack(side="top", padx=8, pady=(0, 8))
         name_label.bind("<Button-1>", show_detail)
+        card["name_label"] = name_label
 
-        info_available = bool(game.get("name")) and requests is not None
-        if info_available:
-            info_label = ctk.CTkLabel(
-                card,
-                text=self.t("info_available"),
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=UI["accent"]
-            )
-            info_label.pack(side="top", pady=(0, 6))
-            info_label.bind("<Button-1>", show_detail)
+        info_label = ctk.CTkLabel(
+            frame,
+            text=self.t("info_available"),
+            font=fonts["info"],
+            text_color=UI["accent"]
+        )
+        info_label.bind("<Button-1>", show_detail)
+        card["info_label"] = info_label
 
-        button_frame = ctk.CTkFrame(card, fg_color="transparent")
+        button_frame = ctk.CTkFrame(frame, fg_color="transparent")
         button_frame.pack(side="top", pady=(0, 10))
+        card["button_frame"] = button_frame
 
         play_btn = ctk.CTkButton(
             button_frame,
@@ -2689,7 +3053,7 @@ class GameLauncherApp(ctk.CTk):
             width=80,
             height=32,
             corner_radius=8,
-            command=lambda g=game: self.launch_game(g),
+            command=lambda: run(self.launch_game),
             **self._button_style("success")
         )
         play_btn.pack(side="left", padx=4)
@@ -2701,66 +3065,430 @@ class GameLauncherApp(ctk.CTk):
             width=35,
             height=32,
             corner_radius=8,
-            font=ctk.CTkFont(size=14),
-            command=lambda g=game: self.remove_game(g),
+            font=fonts["delete"],
+            command=lambda: run(self.remove_game),
             **self._button_style("danger")
         )
         del_btn.pack(side="left", padx=4)
         del_btn.bind("<Button-1>", lambda e: "break", add="+")
+        return card
 
-    def _render_next_game_chunk(self):
-        if self._is_resizing:
+    def _card_art_loaded(self, game: GameRecord) -> bool:
+        with self._icon_cache_lock:
+            if (game.artwork_id, "grid", *GAME_CARD_ART_SIZE) in self._artwork_ctk_cache:
+                return True
+            pil_key = (game.artwork_id, "grid")
+            return pil_key in self._artwork_pil_cache and self._artwork_pil_cache[pil_key] is None
+
+    def _cached_card_image(self, game: GameRecord) -> ctk.CTkImage:
+        with self._icon_cache_lock:
+            img = self._artwork_ctk_cache.get((game.artwork_id, "grid", *GAME_CARD_ART_SIZE))
+            for size in ((100, 100), (64, 64)):
+                img = img or self._icon_ctk_cache.get((game.norm_path, *size))
+        return img or self.get_fallback_icon((64, 64))
+
+    def _game_card(self, game: GameRecord) -> dict | None:
+        card = self._grid_card_by_game.get(id(game))
+        if card is None or card["game"] is not game:
+            return None
+        if card["frame"] is not None and not card["frame"].winfo_exists():
+            return None
+        return card
+
+    def _patch_game_card(self, game: GameRecord):
+        card = self._game_card(game)
+        if card is not None and card["frame"] is None:
+            self._set_canvas_card_text(card, game)
+        elif card is not None:
+            card["fav_btn"].configure(text="⭐" if game.favorite else "☆")
+            card["name_label"].configure(text=game.get("name", "Unknown"))
+
+    def _unbind_game_card(self, card: dict):
+        game = card["game"]
+        if game is not None and self._grid_card_by_game.get(id(game)) is card:
+            del self._grid_card_by_game[id(game)]
+        card["game"] = None
+
+    def _bind_game_card(self, card: dict, game: GameRecord):
+        self._unbind_game_card(card)
+        card["game"] = game
+        self._grid_card_by_game[id(game)] = card
+        if card["frame"] is None:
+            self._bind_canvas_card(card, game)
             return
-        display_games = getattr(self, "_display_games", [])
-        if not display_games:
+        card["fav_btn"].configure(text="⭐" if game.favorite else "☆")
+        card["name_label"].configure(text=game.get("name", "Unknown"))
+
+        info_label = card["info_label"]
+        if bool(game.get("name")) and requests is not None:
+            if not info_label.winfo_manager():
+                info_label.pack(side="top", pady=(0, 6), before=card["button_frame"])
+        elif info_label.winfo_manager():
+            info_label.pack_forget()
+
+        icon_label = card["icon_label"]
+        icon_label.configure(image=self._cached_card_image(game))
+        card["art_pending"] = not self._card_art_loaded(game)
+        if card["art_pending"] and not self._is_scrolling and not self._is_resizing:
+            card["art_pending"] = False
+            self._set_game_artwork_async(game, GAME_CARD_ART_SIZE, icon_label)
+
+    def _layout_game_grid(self, force: bool = False, refresh: bool = False):
+        canvas = self._live_widget("games_canvas")
+        if canvas is None or self._is_resizing:
+            return
+        layout = self._grid_layout
+        display_games = self._display_games
+        top = canvas.canvasy(0)
+        anchor, columns = layout.index_at(top), layout.columns
+        if layout.update(self._games_grid_width(), getattr(self, "_games_columns", 3), len(display_games)):
+            force = True
+            canvas.configure(scrollregion=(0, 0, layout.width, max(1, layout.total_height)))
+            if self._grid_empty_item is not None:
+                canvas.itemconfigure(self._grid_empty_item,
+                                     width=max(1, layout.width - 2 * GAME_CARD_PADDING - 4))
+            if not refresh and columns != layout.columns and layout.total_height:
+                top = layout.cell(min(anchor, max(0, layout.count - 1)))[1] - layout.padding
+                canvas.yview_moveto(top / layout.total_height)
+                top = canvas.canvasy(0)
+
+        height = canvas.winfo_height()
+        start, end = layout.visible_range(top, height)
+        if not force and not refresh and (start, end) == self._grid_range:
             return
-        start = self._rendered_games_count
-        end = min(start + getattr(self, "_games_chunk_size", 12), len(display_games))
-        for idx in range(start, end):
-            self._create_game_card(self.games_scroll, idx, display_games[idx])
-        self._rendered_games_count = end
+        self._grid_range = (start, end)
+
+        cards = self._grid_cards
+        if len(cards) < layout.pool_size(height):
+            self._grow_card_pool(canvas, layout.pool_size(height))
+        if len(self._ui_image_refs) > 8 * len(cards):
+            self._ui_image_refs.clear()
+
+        placed = {}
+        unplaced = []
+        for index in range(start, end):
+            card = self._game_card(display_games[index])
+            if card is None:
+                unplaced.append(index)
+            else:
+                placed[id(card)] = card
+                self._place_game_card(canvas, card, index, force)
+        free = iter([card for card in cards if id(card) not in placed])
+        first = layout.index_at(top)
+        unplaced.sort(key=lambda index: index < first)
+        for index in unplaced:
+            card = next(free, None)
+            if card is None:
+                break
+            self._bind_game_card(card, display_games[index])
+            self._place_game_card(canvas, card, index, True)
+        for card in free:
+            if card["index"] != -1:
+                canvas.itemconfigure(card["item"], state="hidden")
+                card["index"] = -1
+            self._unbind_game_card(card)
+
+    def _grow_card_pool(self, canvas: ctk.CTkCanvas, size: int):
+        cards = self._grid_cards
+        count = min(self._card_budget.chunk_size, size - len(cards))
+        create = self._create_canvas_card if self._canvas_cards else self._create_game_card
+        started = time.perf_counter()
+        for _ in range(count):
+            cards.append(create(canvas))
+        self._card_budget.record(count, (time.perf_counter() - started) * 1000)
+        if len(cards) < size and self._card_pool_after_id is None:
+            self._card_pool_after_id = self.after(1, self._continue_card_pool)
+
+    def _continue_card_pool(self):
+        self._card_pool_after_id = None
+        self._layout_game_grid(refresh=True)
+
+    def _place_game_card(self, canvas: ctk.CTkCanvas, card: dict, index: int, force: bool):
+        if force or card["index"] != index:
+            x, y, width, card_height = self._grid_layout.cell(index)
+            if card["frame"] is None:
+                self._place_canvas_card(canvas, card, x, y, width, card_height)
+            else:
+                canvas.coords(card["item"], x, y)
+                canvas.itemconfigure(card["item"], width=width, height=card_height, state="normal")
+            card["index"] = index
+
+    def _canvas_color(self, key: str) -> str:
+        return self._apply_appearance_mode(UI[key])
+
+    def _create_canvas_card(self, canvas: ctk.CTkCanvas) -> dict:
+        fonts = self._card_fonts()
+        tag = f"card{len(self._grid_cards)}"
+        card = {"game": None, "index": -1, "art_pending": False, "frame": None, "item": tag, "photo": None,
+                "info_visible": False}
+
+        def tags(role: str) -> tuple[str, ...]:
+            return "card", tag, role
+
+        card["bg"] = canvas.create_polygon(0, 0, 0, 0, 0, 0, smooth=True, fill=self._canvas_color("surface_alt"),
+                                           outline=self._canvas_color("border"), width=1, tags=tags("body"),
+                                           state="hidden")
+        card["art"] = canvas.create_image(0, 0, anchor="center", tags=tags("body"), state="hidden")
+        card["name"] = canvas.create_text(0, 0, anchor="n", justify="center", font=fonts["name"],
+                                          fill=self._canvas_color("text"), tags=tags("body"), state="hidden")
+        card["info"] = canvas.create_text(0, 0, anchor="n", text=self.t("info_available"), font=fonts["info"],
+                                          fill=self._canvas_color("accent"), tags=tags("body"), state="hidden")
+        card["star"] = canvas.create_text(0, 0, anchor="ne", font=fonts["star"], fill=self._canvas_color("text"),
+                                          tags=tags("star"), state="hidden")
+        for role, text, font in (("play", self.t("play"), fonts["info"]), ("delete", "🗑", fonts["delete"])):
+            card[role] = canvas.create_polygon(0, 0, 0, 0, 0, 0, smooth=True, tags=tags(role), state="hidden",
+                                               fill=self._canvas_color("success" if role == "play" else "danger"))
+            card[f"{role}_text"] = canvas.create_text(0, 0, text=text, font=font, fill="white", tags=tags(role),
+                                                      state="hidden")
+        return card
+
+    def _place_canvas_card(self, canvas: ctk.CTkCanvas, card: dict, x: int, y: int, width: int, height: int):
+        center = x + width / 2
+        canvas.coords(card["bg"], *rounded_rect(x, y, x + width, y + height, 14))
+        canvas.coords(card["star"], x + width - 12, y + 10)
+        canvas.coords(card["art"], center, y + 14 + GAME_CARD_ART_SIZE[1] / 2)
+        canvas.coords(card["name"], center, y + GAME_CARD_ART_SIZE[1] + 22)
+        canvas.itemconfigure(card["name"], width=max(1, width - 24))
+        canvas.coords(card["info"], center, y + GAME_CARD_ART_SIZE[1] + 70)
+        left, top = center - 61, y + height - 42
+        for role, button_width in (("play", 80), ("delete", 35)):
+            canvas.coords(card[role], *rounded_rect(left, top, left + button_width, top + 32, 8))
+            canvas.coords(card[f"{role}_text"], left + button_width / 2, top + 16)
+            left += button_width + 8
+        canvas.itemconfigure(card["item"], state="normal")
+        if not card["info_visible"]:
+            canvas.itemconfigure(card["info"], state="hidden")
+
+    def _set_canvas_card_text(self, card: dict, game: GameRecord):
+        canvas = self.games_canvas
+        name = game.get("name", "Unknown")
+        canvas.itemconfigure(card["name"], text=name if len(name) <= 48 else name[:47] + "…")
+        canvas.itemconfigure(card["star"], text="⭐" if game.favorite else "☆")
+
+    def _bind_canvas_card(self, card: dict, game: GameRecord):
+        canvas = self.games_canvas
+        if self._canvas_hover is not None and self._canvas_hover[0] is card:
+            self._set_canvas_hover(None, "")
+        self._set_canvas_card_text(card, game)
+        card["info_visible"] = bool(game.get("name")) and requests is not None
+        card["photo"], loaded = self._canvas_card_photo(game)
+        canvas.itemconfigure(card["art"], image=card["photo"])
+        card["art_pending"] = not loaded
+        if card["art_pending"] and self._canvas_art_after_id is None:
+            self._canvas_art_after_id = self.after(CANVAS_ART_DELAY_MS, self._load_canvas_card_art)
+
+    def _canvas_photo(self, key: tuple, image: Image.Image, size: tuple[int, int]) -> ImageTk.PhotoImage:
+        cache = self._canvas_photo_cache
+        photo = cache.get(key)
+        if photo is None:
+            photo = ImageTk.PhotoImage(image.resize(size), master=self)
+            cache[key] = photo
+            if len(cache) > CANVAS_PHOTO_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return photo
 
-        if start == 0:
-            try:
-                self.after(500, self._start_idle_icon_prewarm)
-            except Exception:
-                pass
+    def _canvas_card_photo(self, game: GameRecord) -> tuple[ImageTk.PhotoImage, bool]:
+        art_key = (game.artwork_id, "grid")
+        exe_path = game.norm_path
+        with self._icon_cache_lock:
+            art_known = art_key in self._artwork_pil_cache
+            artwork = self._artwork_pil_cache.get(art_key)
+            icon_known = not exe_path or exe_path in self._icon_pil_cache
+            icon = self._icon_pil_cache.get(exe_path) if exe_path else None
+        if artwork is not None:
+            return self._canvas_photo(art_key, artwork, GAME_CARD_ART_SIZE), True
+        loaded = art_known and icon_known
+        if icon is not None:
+            return self._canvas_photo(("icon", exe_path), icon, (100, 100)), loaded
+        self.get_fallback_icon((64, 64))
+        return self._canvas_photo(("__fallback__",), self._fallback_pil_image, (64, 64)), loaded
+
+    def _load_canvas_card_art(self):
+        self._canvas_art_after_id = None
+        for card in self._grid_cards:
+            if not card["art_pending"] or card["index"] == -1:
+                continue
+            card["art_pending"] = False
+            game = card["game"]
+            art_key = (game.artwork_id, "grid")
+            with self._icon_cache_lock:
+                if art_key in self._artwork_load_inflight:
+                    continue
+                self._artwork_load_inflight.add(art_key)
+            Thread(target=self._canvas_art_worker, args=(game, art_key), daemon=True).start()
 
-    def _setup_games_scroll_poll(self):
-        self._cancel_games_scroll_poll()
+    def _canvas_art_worker(self, game: GameRecord, art_key: tuple[str, str]):
+        try:
+            with self._icon_cache_lock:
+                artwork = self._artwork_pil_cache.get(art_key)
+                needs_art = art_key not in self._artwork_pil_cache
+            if needs_art:
+                artwork = self._load_game_artwork_pil(game)
+                with self._icon_cache_lock:
+                    self._artwork_pil_cache[art_key] = artwork
+            exe_path = game.norm_path
+            with self._icon_cache_lock:
+                needs_icon = artwork is None and exe_path and exe_path not in self._icon_pil_cache
+            if needs_icon:
+                icon = self.extract_icon_pil(exe_path)
+                with self._icon_cache_lock:
+                    self._icon_pil_cache[exe_path] = icon
+        finally:
+            with self._icon_cache_lock:
+                self._artwork_load_inflight.discard(art_key)
+            self.after(0, lambda: self._on_canvas_art_ready(game))
 
-        def poll():
-            try:
-                if not self._is_resizing:
-                    canvas = getattr(self.games_scroll, "_parent_canvas", None)
-                    if canvas and hasattr(canvas, "yview"):
-                        y1, y2 = canvas.yview()
-                        display_games = getattr(self, "_display_games", [])
-
-                        if y2 > 0.96 and self._rendered_games_count < len(display_games):
-                            self._render_next_game_chunk()
-
-                            next_delay = 150
-                        else:
-                            next_delay = 300
-                    else:
-                        next_delay = 300
-                else:
-                    next_delay = 400
+    def _on_canvas_art_ready(self, game: GameRecord):
+        card = self._game_card(game)
+        if card is None or card["frame"] is not None or self._live_widget("games_canvas") is None:
+            return
+        card["photo"] = self._canvas_card_photo(game)[0]
+        self.games_canvas.itemconfigure(card["art"], image=card["photo"])
+
+    def _canvas_card_at(self, event) -> tuple[dict | None, str]:
+        canvas = self.games_canvas
+        index = self._grid_layout.index_at_point(canvas.canvasx(event.x), canvas.canvasy(event.y))
+        if index is None or index >= len(self._display_games):
+            return None, ""
+        card = self._game_card(self._display_games[index])
+        if card is None:
+            return None, ""
+        current = canvas.gettags("current")
+        return card, next((role for role in ("star", "play", "delete") if role in current), "body")
+
+    def _on_canvas_card_click(self, event):
+        card, role = self._canvas_card_at(event)
+        if card is None:
+            return
+        actions = {"star": self._toggle_favorite, "play": self.launch_game, "delete": self.remove_game}
+        actions.get(role, self._show_game_detail)(card["game"])
 
-                if self.games_scroll.winfo_exists():
-                    self._scroll_poll_after_id = self.after(next_delay, poll)
-            except Exception:
-                self._scroll_poll_after_id = None
-        self._scroll_poll_after_id = self.after(200, poll)
+    def _on_canvas_card_motion(self, event):
+        self._set_canvas_hover(*self._canvas_card_at(event))
+
+    def _set_canvas_hover(self, card: dict | None, role: str):
+        previous = self._canvas_hover
+        if previous is not None and previous[0] is card and previous[1] == role:
+            return
+        canvas = self._live_widget("games_canvas")
+        if canvas is None:
+            return
+        if previous is not None:
+            old_card, old_role = previous
+            if old_card is not card:
+                canvas.itemconfigure(old_card["bg"], outline=self._canvas_color("border"), width=1)
+            if old_role in ("play", "delete"):
+                canvas.itemconfigure(old_card[old_role], fill=self._canvas_color("success" if old_role == "play" else "danger"))
+        if card is not None:
+            canvas.itemconfigure(card["bg"], outline=self._canvas_color("border_hover"), width=2)
+            if role in ("play", "delete"):
+                canvas.itemconfigure(card[role], fill=self._canvas_color("success_hover" if role == "play" else "danger_hover"))
+        canvas.configure(cursor="hand2" if card is not None else "")
+        self._canvas_hover = (card, role) if card is not None else None
+
+    def _load_pending_card_art(self):
+        if self._is_scrolling or self._is_resizing or self._canvas_cards:
+            return
+        for card in self._grid_cards:
+            if card["index"] == -1 or not card["icon_label"].winfo_exists():
+                continue
+            if card["art_pending"] or not self._card_art_loaded(card["game"]):
+                card["art_pending"] = False
+                self._set_game_artwork_async(card["game"], GAME_CARD_ART_SIZE, card["icon_label"])
+
+    def _label_shows(self, label: ctk.CTkLabel, game: GameRecord | None = None, exe_path: str | None = None) -> bool:
+        card = self._grid_label_cards.get(str(label))
+        if card is None:
+            return True
+        if card["game"] is None or card["index"] == -1:
+            return False
+        if game is not None:
+            return card["game"] is game
+        return card["game"].norm_path == exe_path
+
+    def _on_games_yview(self, first: str, last: str):
+        scrollbar = self._live_widget("games_scrollbar")
+        if scrollbar is not None:
+            scrollbar.set(first, last)
+        self._layout_game_grid()
+
+    def _on_games_scrollbar(self, *args):
+        canvas = self._live_widget("games_canvas")
+        if canvas is not None:
+            canvas.yview(*args)
+            self._games_scroll_started()
+
+    def _on_overlay_mousewheel(self, event):
+        canvas = self._live_widget("games_canvas")
+        if canvas is not None:
+            canvas.yview_scroll(-int(event.delta / 6), "units")
+            self._games_scroll_started()
+        return "break"
+
+    def _games_scroll_started(self):
+        if self._canvas_cards:
+            return
+        if not self._is_scrolling:
+            self._is_scrolling = True
 
-    def _cancel_games_scroll_poll(self):
-        if self._scroll_poll_after_id:
+            if self._hovered_card is not None:
+                try:
+                    self._hovered_card.configure(border_color=UI["border"], border_width=1)
+                except Exception:
+                    pass
+                self._hovered_card = None
+
+            self.scroll_overlay.place(x=0, y=0, relwidth=0.98, relheight=1)
+            self.scroll_overlay.lift()
+        if self._scroll_idle_after_id:
             try:
-                self.after_cancel(self._scroll_poll_after_id)
+                self.after_cancel(self._scroll_idle_after_id)
             except Exception:
                 pass
-            self._scroll_poll_after_id = None
+        self._scroll_idle_after_id = self.after(350, self._games_scroll_stopped)
+
+    def _games_scroll_stopped(self):
+        self._is_scrolling = False
+        self._scroll_idle_after_id = None
+        if self._live_widget("scroll_overlay") is None:
+            return
+
+        self.scroll_overlay.place_forget()
+        self._process_pending_icons()
+        self._load_pending_card_art()
+
+    def _stop_games_scroll_tracking(self):
+        for attr in ("_scroll_idle_after_id", "_search_after_id", "_card_pool_after_id", "_canvas_art_after_id"):
+            after_id = getattr(self, attr)
+            if after_id:
+                try:
+                    self.after_cancel(after_id)
+                except Exception:
+                    pass
+                setattr(self, attr, None)
+        self._is_scrolling = False
+        self._pending_icon_updates.clear()
+        self._hovered_card = None
+
+    def _on_games_canvas_configure(self, event=None):
+        if self._is_resizing:
+            return
+        self._games_columns = self._calculate_game_columns()
+        self._layout_game_grid()
+
+    def _on_games_mousewheel(self, event):
+        canvas = self._live_widget("games_canvas")
+        if canvas is None or self._current_game_detail is not None:
+            return
+        widget = event.widget
+        while widget is not None and widget is not canvas:
+            widget = getattr(widget, "master", None)
+        if widget is None:
+            return
+        canvas.yview_scroll(-int(event.delta / 6), "units")
+        self._games_scroll_started()
 
     def _detect_resize_start(self, event):
         if event.widget != self:
@@ -2793,15 +3521,10 @@ class GameLauncherApp(ctk.CTk):
         except Exception:
             pass
 
-        if getattr(self, "_active_view", "") == "library" and hasattr(self, "games_scroll"):
-            try:
-                new_columns = self._calculate_game_columns()
-                if new_columns != getattr(self, "_games_columns", 0) or self.winfo_width() != self._last_library_width:
-                    self._games_columns = new_columns
-                    self._last_library_width = self.winfo_width()
-                    self.render_game_buttons()
-            except Exception:
-                pass
+        if getattr(self, "_active_view", "") == "library" and self._live_widget("games_canvas") is not None:
+            self._games_columns = self._calculate_game_columns()
+            self._layout_game_grid()
+            self._load_pending_card_art()
 
     def _start_idle_icon_prewarm(self):
         if getattr(self, "_prewarm_started", False):
@@ -2811,10 +3534,9 @@ class GameLauncherApp(ctk.CTk):
         def worker():
             try:
                 for game in self.games[:50]:
-                    p = game.get("path")
+                    p = game.norm_path
                     if not p:
                         continue
-                    p = os.path.normpath(p)
                     with self._icon_cache_lock:
                         needs_load = p not in self._icon_pil_cache
                     if needs_load:
@@ -2835,48 +3557,7 @@ class GameLauncherApp(ctk.CTk):
             pass
 
     def _prune_icon_cache(self, max_size_mb: int = 300, max_files: int = 5000):
-        try:
-            cache_dir = self._get_icon_cache_dir()
-            if not os.path.isdir(cache_dir):
-                return
-            entries = []
-            total_size = 0
-            try:
-                files = list(os.listdir(cache_dir))
-            except Exception:
-                return
-
-            for name in files:
-                path = os.path.join(cache_dir, name)
-                try:
-                    if not os.path.isfile(path):
-                        continue
-                    st = os.stat(path)
-                    entries.append((path, st.st_mtime, st.st_size))
-                    total_size += st.st_size
-                except (OSError, PermissionError):
-                    continue
-
-            if not entries:
-                return
-
-            entries.sort(key=lambda x: x[1])
-
-            size_limit = max_size_mb * 1024 * 1024
-            removed_count = 0
-            while (total_size > size_limit or len(entries) > max_files) and entries:
-                if removed_count > 1000:
-                    break
-                path, _, sz = entries.pop(0)
-                try:
-                    if os.path.isfile(path):
-                        os.remove(path)
-                        total_size -= sz
-                        removed_count += 1
-                except (OSError, PermissionError):
-                    continue
-        except Exception:
-            pass
+        library_store.prune_cache_dir(self._get_icon_cache_dir(), max_size_mb, max_files)
 
 if __name__ == "__main__":
     app = GameLauncherApp()
@@ -0,0 +1,157 @@
+import hashlib
+import os
+import re
+import sys
+
+GAME_FIELDS = ("name", "path", "source", "steam_appid", "favorite", "artwork_path", "working_dir", "added_at", "_id")
+_CACHE_DEPENDENCIES = {
+    "name": ("_name_key", "_sort_key", "_artwork_id"),
+    "path": ("_norm_path", "_artwork_id"),
+    "steam_appid": ("_artwork_id",),
+}
+_FIELD_INDEX = frozenset(GAME_FIELDS)
+_DIGITS_RE = re.compile(r"(\d+)")
+
+
+def natural_key(text: str) -> tuple:
+    parts = _DIGITS_RE.split(text)
+    parts[1::2] = map(int, parts[1::2])
+    return tuple(parts)
+
+
+def artwork_id_for(steam_appid, name, path) -> str:
+    steam_appid = str(steam_appid or "").strip()
+    if steam_appid:
+        return f"steam-{steam_appid}"
+    key = str(name or path or "unknown").strip().lower()
+    return f"name-{hashlib.sha1(key.encode('utf-8', errors='ignore')).hexdigest()}"
+
+
+def icon_cache_key(exe_path: str) -> str:
+    try:
+        mtime = int(os.path.getmtime(exe_path))
+    except Exception:
+        mtime = 0
+    return hashlib.sha1((exe_path + "|" + str(mtime)).encode("utf-8", errors="ignore")).hexdigest()
+
+
+class GameRecord:
+    __slots__ = GAME_FIELDS + ("extra", "_name_key", "_sort_key", "_norm_path", "_artwork_id")
+
+    def __init__(self, name: str | None = None, path: str | None = None, source: str | None = None,
+                 steam_appid: str | None = None, favorite: bool | None = None, artwork_path: str | None = None,
+                 working_dir: str | None = None, added_at: int | None = None, _id: int | None = None,
+                 extra: dict | None = None):
+        self.name = name
+        self.path = path
+        self.source = sys.intern(source) if type(source) is str else source
+        self.steam_appid = steam_appid
+        self.favorite = favorite
+        self.artwork_path = artwork_path
+        self.working_dir = working_dir
+        self.added_at = added_at
+        self._id = _id
+        self.extra = extra or None
+        self._name_key = self._sort_key = self._norm_path = self._artwork_id = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GameRecord":
+        extra = None
+        if not _FIELD_INDEX.issuperset(data):
+            extra = {sys.intern(key): value for key, value in data.items()
+                     if key not in _FIELD_INDEX and value is not None}
+        get = data.get
+        return cls(get("name"), get("path"), get("source"), get("steam_appid"), get("favorite"),
+                   get("artwork_path"), get("working_dir"), get("added_at"), get("_id"), extra)
+
+    def __repr__(self) -> str:
+        return f"GameRecord({self.to_dict()!r})"
+
+    @property
+    def name_key(self) -> str:
+        if self._name_key is None:
+            self._name_key = str(self.name or "").casefold()
+        return self._name_key
+
+    @property
+    def sort_key(self) -> tuple:
+        if self._sort_key is None:
+            self._sort_key = natural_key(self.name_key)
+        return self._sort_key
+
+    @property
+    def norm_path(self) -> str:
+        if self._norm_path is None:
+            self._norm_path = os.path.normpath(self.path) if self.path else ""
+        return self._norm_path
+
+    @property
+    def artwork_id(self) -> str:
+        if self._artwork_id is None:
+            self._artwork_id = artwork_id_for(self.steam_appid, self.name, self.path)
+        return self._artwork_id
+
+    def keys(self) -> list[str]:
+        keys = [field for field in GAME_FIELDS if getattr(self, field) is not None]
+        if self.extra:
+            keys.extend(self.extra)
+        return keys
+
+    def items(self) -> list[tuple]:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __getitem__(self, key: str):
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default=None):
+        if key in _FIELD_INDEX:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key) if self.extra else None
+        return default if value is None else value
+
+    def __setitem__(self, key: str, value):
+        if key in _FIELD_INDEX:
+            if key == "source" and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+            for cache in _CACHE_DEPENDENCIES.get(key, ()):
+                setattr(self, cache, None)
+        elif value is None:
+            self.pop(key, None)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[sys.intern(key)] = value
+
+    def pop(self, key: str, *default):
+        value = self.get(key)
+        if value is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        if key in _FIELD_INDEX:
+            self[key] = None
+        else:
+            del self.extra[key]
+            if not self.extra:
+                self.extra = None
+        return value
+
+    def copy(self) -> "GameRecord":
+        return GameRecord.from_dict(self.to_dict())
+
+    def to_dict(self) -> dict:
+        return dict(self.items())
@@ -0,0 +1,188 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from threading import Event
+
+import library_store
+import steam_scanner
+
+COMMANDS = ("scan",)
+
+
+class PhaseTimer:
+    def __init__(self):
+        self.phases: dict[str, float] = {}
+
+    def run(self, name: str, fn, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.phases[name] = round((time.perf_counter() - start) * 1000, 3)
+
+
+def _parse_manifests(tasks: list[tuple[str, tuple]]) -> list[tuple]:
+    return [steam_scanner._load_manifest((lib, file, stamp, None)) for _, (lib, file, stamp) in tasks]
+
+
+def _discover_exes(tasks: list[tuple[str, tuple]], loaded: list[tuple]) -> list[dict]:
+    games = []
+    seen_roots = set()
+    for task, manifest in zip(tasks, loaded):
+        _, (lib, _, _) = task
+        meta = manifest[2]
+        root = steam_scanner._claim_game_root(lib, meta, seen_roots)
+        if root is None:
+            continue
+        exe = steam_scanner.find_game_exe(root[0], meta["name"])
+        game = steam_scanner._scan_result_game(task, manifest, {"exe": exe})
+        if game is not None:
+            games.append(game)
+    return games
+
+
+def _run_pipeline(libraries: list[str], library_apps: dict, args) -> dict:
+    if args.index or args.no_index:
+        return _time_pipeline(libraries, library_apps, args, None if args.no_index else args.index)
+    with tempfile.TemporaryDirectory(prefix="alpha-launcher-scan-") as tmp:
+        result = _time_pipeline(libraries, library_apps, args, os.path.join(tmp, "steam_scan_index.json"))
+    result["index"] = "temporary"
+    return result
+
+
+def _time_pipeline(libraries: list[str], library_apps: dict, args, index_path: str | None) -> dict:
+    index = steam_scanner.SteamScanIndex(index_path) if index_path else None
+    appinfo_path = None
+    if not args.no_appinfo:
+        appinfo_path = os.path.join(args.steam_root, "appcache", "appinfo.vdf")
+
+    start = time.perf_counter()
+    first_game_ms = None
+    found = 0
+    for progress in steam_scanner.iter_steam_scan(libraries, args.workers, index, library_apps,
+                                                  appinfo_path, Event()):
+        if progress.game is not None:
+            found += 1
+            if first_game_ms is None:
+                first_game_ms = round((time.perf_counter() - start) * 1000, 3)
+    return {
+        "games": found,
+        "workers": steam_scanner.resolve_scan_workers(args.workers),
+        "index": index.path if index is not None else None,
+        "first_game_ms": first_game_ms,
+    }
+
+
+def run_scan(args) -> dict:
+    timer = PhaseTimer()
+    data_dir = args.data_dir
+
+    settings, stored_games, state_source = timer.run("state_load", library_store.read_library_state, data_dir)
+
+    library_apps = timer.run("libraries", steam_scanner.read_library_folders, args.steam_root)
+    libraries = list(library_apps)
+    for extra in args.library:
+        libraries.append(os.path.normpath(extra))
+        library_apps.setdefault(os.path.normpath(extra), None)
+
+    tasks = timer.run("manifest_listing", steam_scanner._list_manifest_tasks, libraries, library_apps)
+    loaded = timer.run("manifest_parsing", _parse_manifests, tasks)
+    games = timer.run("exe_discovery", _discover_exes, tasks, loaded)
+
+    pipeline = None
+    if args.pipeline:
+        pipeline = timer.run("pipeline", _run_pipeline, libraries, library_apps, args)
+
+    icon_cache = os.path.join(args.cache_dir, library_store.ICON_CACHE_DIR_NAME)
+    prune = timer.run(
+        "cache_prune",
+        library_store.prune_cache_dir,
+        icon_cache,
+        settings.get("cache_size_mb", 200),
+        settings.get("cache_max_files", 2000),
+        not args.prune,
+    )
+
+    return {
+        "steam_root": args.steam_root,
+        "libraries": libraries,
+        "manifests": len(tasks),
+        "store": library_store.detect_library_backend(data_dir),
+        "state_source": state_source,
+        "stored_games": len(stored_games),
+        "games": games,
+        "pipeline": pipeline,
+        "cache_prune": dict(prune, path=icon_cache, dry_run=not args.prune),
+        "timings_ms": timer.phases,
+    }
+
+
+def _print_report(result: dict):
+    print(f"Steam root: {result['steam_root']}")
+    for lib in result["libraries"]:
+        print(f"  library: {lib}")
+    print(f"Manifests: {result['manifests']}, games found: {len(result['games'])}, "
+          f"stored games: {result['stored_games']} ({result['store']}, loaded from {result['state_source']})")
+    for game in result["games"]:
+        print(f"  {game['steam_appid']:>10}  {game['name']}  ->  {game['path']}")
+    pipeline = result["pipeline"]
+    if pipeline:
+        print(f"Pipeline: {pipeline['games']} games with {pipeline['workers']} workers, "
+              f"first game after {pipeline['first_game_ms']} ms")
+    prune = result["cache_prune"]
+    action = "would remove" if prune["dry_run"] else "removed"
+    print(f"Icon cache: {prune['files']} files, {prune['bytes']} bytes, "
+          f"{action} {prune['removed']} ({prune['removed_bytes']} bytes)")
+    print("Timings (ms):")
+    for name, ms in result["timings_ms"].items():
+        print(f"  {name:<18}{ms:>12.3f}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="game_launcher.py", description="Alpha Game Launcher headless tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    scan = commands.add_parser("scan", help="scan Steam libraries without starting the UI")
+    scan.add_argument("--steam-root", help="Steam installation folder (default: detected)")
+    scan.add_argument("--library", action="append", default=[], help="additional library folder, repeatable")
+    scan.add_argument("--data-dir", help="folder holding games.json and settings.json (default: app data folder)")
+    scan.add_argument("--cache-dir", help="cache folder (default: Cache inside the data folder)")
+    scan.add_argument("--pipeline", action="store_true", help="also time the parallel scan used by the app")
+    scan.add_argument("--workers", type=int, default=0, help="pipeline worker threads, 0 = auto")
+    scan.add_argument("--index", help="scan index file for the pipeline run (default: a temporary file)")
+    scan.add_argument("--no-index", action="store_true", help="run the pipeline without the scan index")
+    scan.add_argument("--no-appinfo", action="store_true", help="ignore appcache/appinfo.vdf in the pipeline")
+    scan.add_argument("--prune", action="store_true", help="actually delete pruned cache files instead of a dry run")
+    scan.add_argument("--json", action="store_true", help="print the result as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    if args.command == "scan":
+        args.steam_root = args.steam_root or steam_scanner.find_steam_install_path()
+        if not args.steam_root:
+            print("Steam installation not found, pass --steam-root", file=sys.stderr)
+            return 2
+        args.steam_root = os.path.normpath(args.steam_root)
+        if args.cache_dir is None:
+            if args.data_dir:
+                args.cache_dir = os.path.join(args.data_dir, library_store.CACHE_DIR_NAME)
+            else:
+                args.cache_dir = library_store.cache_data_dir()
+
+        result = run_scan(args)
+        if args.json:
+            json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+            sys.stdout.write("\n")
+        else:
+            _print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,605 @@
+import bisect
+import heapq
+import os
+import re
+import sys
+import time
+from threading import Event, RLock, Thread
+
+from game_record import GameRecord
+
+SORT_MODES = ("name", "favorite", "date_added", "relevance")
+FACETS = ("source", "favorite", "status", "genre")
+TRIGRAM_MIN_QUERY = 3
+SEARCH_CACHE_SIZE = 32
+FUZZY_RESULT_LIMIT = 100
+FUZZY_BUDGET_MS = 25.0
+FUZZY_PREFIX_TOKENS = 256
+_WORD_RE = re.compile(r"[^\W_]+")
+_LETTER_DIGIT_RE = re.compile(r"([a-z])(\d)", re.IGNORECASE)
+
+
+def split_letter_digits(text: str) -> str:
+    return _LETTER_DIGIT_RE.sub(r"\1 \2", text)
+
+
+def search_tokens(text: str) -> list[str]:
+    return _WORD_RE.findall(split_letter_digits(text.casefold()))
+
+
+def game_facets(game: GameRecord) -> list[tuple[str, str]]:
+    facets = [("source", "steam" if str(game.source or "").casefold() == "steam" else "manual")]
+    if game.favorite:
+        facets.append(("favorite", "yes"))
+    genres = game.get("genres")
+    if isinstance(genres, list):
+        facets.extend(("genre", genre) for genre in dict.fromkeys(genres) if isinstance(genre, str) and genre)
+    return facets
+
+
+def _matches_filters(game: GameRecord, filters: dict[str, set[str]]) -> bool:
+    facets = set(game_facets(game))
+    if filters.get("status"):
+        facets.add(("status", "installed" if game.path and os.path.isfile(game.path) else "missing"))
+    return all(not values or any((facet, value) in facets for value in values) for facet, values in filters.items())
+
+
+def _mask_from_slots(slots) -> int:
+    slots = list(slots)
+    if not slots:
+        return 0
+    bits = bytearray((max(slots) >> 3) + 1)
+    for slot in slots:
+        bits[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _slots_from_mask(mask: int) -> list[int]:
+    slots = []
+    for offset, byte in enumerate(mask.to_bytes((mask.bit_length() + 7) >> 3, "little")):
+        if byte:
+            base = offset << 3
+            slots.extend(base + bit for bit in range(8) if byte >> bit & 1)
+    return slots
+
+
+def _trigrams(key: str) -> set[str]:
+    return {key[i:i + 3] for i in range(len(key) - 2)}
+
+
+def _short_grams(key: str) -> set[str]:
+    return set(key) | {key[i:i + 2] for i in range(len(key) - 1)}
+
+
+def _word_signature(word: str) -> set[str]:
+    padded = f" {word} "
+    return {padded[i:i + 2] for i in range(len(padded) - 1)}
+
+
+def _edit_distance(a: str, b: str, cap: int) -> int:
+    if abs(len(a) - len(b)) > cap:
+        return cap + 1
+    before = None
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            cost = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if before is not None and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                cost = min(cost, before[j - 2] + 1)
+            current.append(cost)
+        if min(current) > cap:
+            return cap + 1
+        before, previous = previous, current
+    return previous[-1]
+
+
+class SearchIndex:
+    def __init__(self, games: list[GameRecord] = (), background: bool = False, on_ready=None):
+        self._lock = RLock()
+        self._ready = Event()
+        self._on_ready = on_ready
+        self._reset()
+        if background:
+            Thread(target=self._build, args=(list(games),), daemon=True).start()
+        else:
+            self._build(games)
+
+    def _reset(self):
+        self._records: dict[int, GameRecord] = {}
+        self._keys: dict[int, str] = {}
+        self._slots: dict[int, int] = {}
+        self._trigrams: dict[str, list[int]] = {}
+        self._short: dict[str, list[int]] = {}
+        self._next_slot = 0
+        self._recent: dict[str, list[int]] = {}
+        self._words: dict[int, tuple[str, ...]] = {}
+        self._phrases: dict[int, str] = {}
+        self._word_slots: dict[str, list[int]] = {}
+        self._word_grams: dict[str, set[str]] = {}
+        self._vocab: list[str] | None = None
+        self._views: dict[str, list[tuple]] = {}
+        self._view_keys: dict[str, dict[int, tuple]] = {}
+        self._view_records: dict[tuple, list[GameRecord]] = {}
+        self._all_mask = 0
+        self._facets: dict[tuple[str, str], int] = {}
+        self._slot_facets: dict[int, tuple[tuple[str, str], ...]] = {}
+        self._exists: dict[int, tuple[str, bool]] = {}
+        self._term_masks: dict[str, int] = {}
+
+    def _build(self, games: list[GameRecord]):
+        try:
+            with self._lock:
+                self._add(games)
+        finally:
+            self._ready.set()
+        if self._on_ready is not None:
+            self._on_ready()
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def __len__(self) -> int:
+        self._ready.wait()
+        return len(self._records)
+
+    def _unpost(self, postings: dict[str, list[int]], grams: set[str], slot: int):
+        for gram in grams:
+            bucket = postings.get(gram)
+            if bucket is None:
+                continue
+            pos = bisect.bisect_left(bucket, slot)
+            if pos < len(bucket) and bucket[pos] == slot:
+                del bucket[pos]
+                if not bucket:
+                    del postings[gram]
+
+    def _index(self, slot: int, key: str):
+        self._keys[slot] = key
+        words = search_tokens(key)
+        self._phrases[slot] = " ".join(words)
+        if len(words) > 1:
+            words.append("".join(word[0] for word in words))
+        words = tuple(dict.fromkeys(map(sys.intern, words)))
+        self._words[slot] = words
+        for word in words:
+            if word not in self._word_slots:
+                self._vocab = None
+                for gram in _word_signature(word):
+                    self._word_grams.setdefault(gram, set()).add(word)
+        for postings, grams in ((self._trigrams, _trigrams(key)), (self._short, _short_grams(key)),
+                                (self._word_slots, words)):
+            for gram in grams:
+                bucket = postings.get(gram)
+                if bucket is None:
+                    postings[gram] = [slot]
+                elif bucket[-1] < slot:
+                    bucket.append(slot)
+                else:
+                    bisect.insort(bucket, slot)
+
+    def _unindex(self, slot: int):
+        key = self._keys.pop(slot)
+        words = self._words.pop(slot)
+        del self._phrases[slot]
+        self._unpost(self._trigrams, _trigrams(key), slot)
+        self._unpost(self._short, _short_grams(key), slot)
+        self._unpost(self._word_slots, words, slot)
+        for word in words:
+            if word not in self._word_slots:
+                self._vocab = None
+                for gram in _word_signature(word):
+                    bucket = self._word_grams.get(gram)
+                    if bucket is not None:
+                        bucket.discard(word)
+                        if not bucket:
+                            del self._word_grams[gram]
+
+    def _sort_entry(self, mode: str, slot: int, game: GameRecord) -> tuple:
+        if mode == "favorite":
+            return (not game.favorite, game.sort_key, slot)
+        if mode == "date_added":
+            return (-(game.added_at or 0), -slot, slot)
+        return (game.sort_key, slot)
+
+    def _view(self, mode: str) -> list[tuple]:
+        view = self._views.get(mode)
+        if view is None:
+            keys = {slot: self._sort_entry(mode, slot, game) for slot, game in self._records.items()}
+            view = self._views[mode] = sorted(keys.values())
+            self._view_keys[mode] = keys
+        return view
+
+    def _resort(self, slot: int, game: GameRecord | None):
+        self._view_records.clear()
+        for mode, view in self._views.items():
+            keys = self._view_keys[mode]
+            old = keys.pop(slot, None)
+            new = self._sort_entry(mode, slot, game) if game is not None else None
+            if old == new:
+                if new is not None:
+                    keys[slot] = new
+                continue
+            if old is not None:
+                del view[bisect.bisect_left(view, old)]
+            if new is not None:
+                keys[slot] = new
+                bisect.insort(view, new)
+
+    def _set_facet_mask(self, key: tuple[str, str], mask: int):
+        if mask:
+            self._facets[key] = mask
+        else:
+            self._facets.pop(key, None)
+
+    def _status_of(self, slot: int, game: GameRecord) -> str | None:
+        checked = self._exists.get(slot)
+        if checked is None or checked[0] != game.path:
+            return None
+        return "installed" if checked[1] else "missing"
+
+    def _refacet(self, slot: int, game: GameRecord | None):
+        bit = 1 << slot
+        old = self._slot_facets.pop(slot, ())
+        if game is None:
+            new = ()
+            self._all_mask &= ~bit
+        else:
+            new = self._slot_facets[slot] = tuple(game_facets(game))
+            self._all_mask |= bit
+        facets = self._facets
+        for key in old:
+            if key not in new:
+                self._set_facet_mask(key, facets[key] & ~bit)
+        for key in new:
+            if key not in old:
+                facets[key] = facets.get(key, 0) | bit
+
+        status = self._status_of(slot, game) if game is not None else None
+        for value in ("installed", "missing"):
+            key = ("status", value)
+            if value == status:
+                facets[key] = facets.get(key, 0) | bit
+            elif key in facets:
+                self._set_facet_mask(key, facets[key] & ~bit)
+
+    def _rebuild_status(self):
+        records = self._records
+        postings: dict[str, list[int]] = {"installed": [], "missing": []}
+        for slot in self._exists:
+            game = records.get(slot)
+            status = self._status_of(slot, game) if game is not None else None
+            if status is not None:
+                postings[status].append(slot)
+        for value, slots in postings.items():
+            self._set_facet_mask(("status", value), _mask_from_slots(slots))
+
+    def _rebuild_facets(self):
+        postings: dict[tuple[str, str], list[int]] = {}
+        for slot, game in self._records.items():
+            entries = self._slot_facets[slot] = tuple(game_facets(game))
+            for key in entries:
+                postings.setdefault(key, []).append(slot)
+        self._facets = {key: _mask_from_slots(slots) for key, slots in postings.items()}
+        self._all_mask = _mask_from_slots(self._records)
+        self._rebuild_status()
+
+    def _forget_terms(self):
+        self._recent.clear()
+        self._term_masks.clear()
+
+    def _add(self, games: list[GameRecord]):
+        added = []
+        for game in games:
+            if id(game) in self._slots:
+                continue
+            slot = self._next_slot
+            self._next_slot += 1
+            self._slots[id(game)] = slot
+            self._records[slot] = game
+            self._index(slot, game.name_key)
+            added.append((slot, game))
+        self._forget_terms()
+        if len(added) * 16 > len(self._records):
+            self._views.clear()
+            self._view_keys.clear()
+            self._view_records.clear()
+            self._rebuild_facets()
+        else:
+            for slot, game in added:
+                self._resort(slot, game)
+                self._refacet(slot, game)
+
+    def add(self, games: list[GameRecord]):
+        self._ready.wait()
+        with self._lock:
+            self._add(games)
+
+    def remove(self, games: list[GameRecord]):
+        self._ready.wait()
+        with self._lock:
+            for game in games:
+                slot = self._slots.pop(id(game), None)
+                if slot is not None:
+                    del self._records[slot]
+                    self._unindex(slot)
+                    self._resort(slot, None)
+                    self._refacet(slot, None)
+                    self._exists.pop(slot, None)
+            self._forget_terms()
+
+    def update(self, game: GameRecord):
+        self._ready.wait()
+        with self._lock:
+            slot = self._slots.get(id(game))
+            if slot is None:
+                return
+            if self._keys[slot] != game.name_key:
+                self._unindex(slot)
+                self._index(slot, game.name_key)
+                self._forget_terms()
+            self._resort(slot, game)
+            self._refacet(slot, game)
+
+    def clear(self):
+        self._ready.wait()
+        with self._lock:
+            self._reset()
+
+    def check_paths(self, games: list[GameRecord] | None = None, exists=os.path.isfile):
+        self._ready.wait()
+        with self._lock:
+            if games is None:
+                targets = [(slot, game.path) for slot, game in self._records.items()]
+            else:
+                targets = [(self._slots[id(game)], game.path) for game in games if id(game) in self._slots]
+        checked = [(slot, path, bool(path) and exists(path)) for slot, path in targets]
+        with self._lock:
+            records = self._records
+            changed = []
+            for slot, path, found in checked:
+                game = records.get(slot)
+                if game is not None and game.path == path:
+                    self._exists[slot] = (path, found)
+                    changed.append((slot, game))
+            self._view_records.clear()
+            if len(changed) * 16 > len(records):
+                self._rebuild_status()
+            else:
+                for slot, game in changed:
+                    self._refacet(slot, game)
+
+    def _lookup(self, term: str) -> list[int]:
+        if len(term) < TRIGRAM_MIN_QUERY:
+            return list(self._short.get(term, ()))
+
+        keys = self._keys
+        for end in range(len(term) - 1, TRIGRAM_MIN_QUERY - 1, -1):
+            narrowed = self._recent.get(term[:end])
+            if narrowed is not None:
+                return [slot for slot in narrowed if term in keys[slot]]
+
+        rarest = None
+        for gram in _trigrams(term):
+            bucket = self._trigrams.get(gram)
+            if not bucket:
+                return []
+            if rarest is None or len(bucket) < len(rarest):
+                rarest = bucket
+        if len(term) == TRIGRAM_MIN_QUERY:
+            return list(rarest)
+        return [slot for slot in rarest if term in keys[slot]]
+
+    def _matching_slots(self, term: str) -> list[int]:
+        slots = self._recent.get(term)
+        if slots is None:
+            slots = self._lookup(term)
+            if len(self._recent) >= SEARCH_CACHE_SIZE:
+                del self._recent[next(iter(self._recent))]
+            self._recent[term] = slots
+        return slots
+
+    def _term_mask(self, term: str) -> int:
+        if not term:
+            return self._all_mask
+        mask = self._term_masks.get(term)
+        if mask is None:
+            if len(self._term_masks) >= SEARCH_CACHE_SIZE:
+                del self._term_masks[next(iter(self._term_masks))]
+            mask = self._term_masks[term] = _mask_from_slots(self._matching_slots(term))
+        return mask
+
+    def _filter_mask(self, filters: dict[str, set[str]] | None) -> int:
+        mask = self._all_mask
+        for facet, values in (filters or {}).items():
+            if values:
+                selected = 0
+                for value in values:
+                    selected |= self._facets.get((facet, value), 0)
+                mask &= selected
+        return mask
+
+    def _allowed(self, filters: dict[str, set[str]] | None) -> bytes | None:
+        mask = self._filter_mask(filters)
+        if mask == self._all_mask:
+            return None
+        return mask.to_bytes((self._next_slot >> 3) + 1, "little")
+
+    def _sorted_slots(self, mode: str, slots: list[int]) -> list[GameRecord]:
+        records = self._records
+        view = self._views[mode]
+        if len(slots) * 8 > len(view):
+            wanted = set(slots)
+            return [records[entry[-1]] for entry in view if entry[-1] in wanted]
+        return [records[slot] for slot in sorted(slots, key=self._view_keys[mode].__getitem__)]
+
+    def facet_counts(self, term: str = "", filters: dict[str, set[str]] | None = None) -> dict[str, dict[str, int]]:
+        term = term.casefold()
+        filters = filters or {}
+        self._ready.wait()
+        with self._lock:
+            base = self._term_mask(term)
+            counts: dict[str, dict[str, int]] = {facet: {} for facet in FACETS}
+            scopes = {facet: base & self._filter_mask({key: values for key, values in filters.items() if key != facet})
+                      for facet in FACETS}
+            for (facet, value), mask in self._facets.items():
+                counts[facet][value] = (scopes[facet] & mask).bit_count()
+            return counts
+
+    def restrict(self, games: list[GameRecord], filters: dict[str, set[str]] | None) -> list[GameRecord]:
+        self._ready.wait()
+        with self._lock:
+            bits = self._allowed(filters)
+            if bits is None:
+                return games
+            restricted = []
+            for game in games:
+                slot = self._slots.get(id(game))
+                if slot is not None and bits[slot >> 3] >> (slot & 7) & 1:
+                    restricted.append(game)
+            return restricted
+
+    def search(self, term: str) -> list[GameRecord]:
+        term = term.casefold()
+        self._ready.wait()
+        with self._lock:
+            records = self._records
+            if not term:
+                return list(records.values())
+            return [records[slot] for slot in self._matching_slots(term)]
+
+    def view(self, mode: str, term: str = "", filters: dict[str, set[str]] | None = None) -> list[GameRecord]:
+        if mode not in SORT_MODES or mode == "relevance":
+            mode = "name"
+        term = term.casefold()
+        self._ready.wait()
+        with self._lock:
+            view = self._view(mode)
+            if not term:
+                key = (mode,) + tuple(sorted((facet, *sorted(values)) for facet, values in (filters or {}).items() if values))
+                cached = self._view_records.get(key)
+                if cached is not None:
+                    return cached
+                mask = self._filter_mask(filters)
+                if mask == self._all_mask:
+                    records = self._records
+                    cached = [records[entry[-1]] for entry in view]
+                elif mask.bit_count() * 8 > len(view):
+                    records = self._records
+                    bits = mask.to_bytes((self._next_slot >> 3) + 1, "little")
+                    cached = [records[entry[-1]] for entry in view if bits[entry[-1] >> 3] >> (entry[-1] & 7) & 1]
+                else:
+                    cached = self._sorted_slots(mode, _slots_from_mask(mask))
+                if len(self._view_records) >= SEARCH_CACHE_SIZE:
+                    del self._view_records[next(iter(self._view_records))]
+                self._view_records[key] = cached
+                return cached
+            slots = self._matching_slots(term)
+            bits = self._allowed(filters)
+            if bits is not None:
+                slots = [slot for slot in slots if bits[slot >> 3] >> (slot & 7) & 1]
+            return self._sorted_slots(mode, slots)
+
+    def _match_word(self, query: str) -> dict[str, float]:
+        if self._vocab is None:
+            self._vocab = sorted(self._word_slots)
+        vocab = self._vocab
+        matches = {}
+        start = bisect.bisect_left(vocab, query)
+        for word in vocab[start:start + FUZZY_PREFIX_TOKENS]:
+            if not word.startswith(query):
+                break
+            matches[word] = 1.0 if word == query else 0.9 - 0.01 * min(len(word) - len(query), 10)
+
+        cap = 0 if len(query) < 3 else 1 if len(query) < 7 else 2
+        if cap:
+            grams = _word_signature(query)
+            shared: dict[str, int] = {}
+            for gram in grams:
+                for word in self._word_grams.get(gram, ()):
+                    shared[word] = shared.get(word, 0) + 1
+            needed = max(1, len(grams) - 3 * cap)
+            low, high = len(query) - cap, len(query) + cap
+            for word, count in shared.items():
+                if count >= needed and low <= len(word) <= high and word not in matches:
+                    distance = _edit_distance(query, word, cap)
+                    if distance <= cap:
+                        matches[word] = 0.8 - 0.15 * (distance - 1)
+        return matches
+
+    def rank(self, term: str, limit: int = FUZZY_RESULT_LIMIT, budget_ms: float = FUZZY_BUDGET_MS) -> list[GameRecord]:
+        deadline = time.perf_counter() + budget_ms / 1000
+        query = search_tokens(term)
+        if not query:
+            return []
+        phrase = " ".join(query)
+        readings = [query] + ([["".join(query)]] if len(query) > 1 else [])
+
+        self._ready.wait()
+        with self._lock:
+            scores: dict[int, float] = {}
+            for reading in readings:
+                word_scores = []
+                for word in reading:
+                    matches = self._match_word(word)
+                    best: dict[int, float] = {}
+                    for match, score in sorted(matches.items(), key=lambda item: item[1]):
+                        best.update(dict.fromkeys(self._word_slots[match], score))
+                    word_scores.append(best)
+                    if not best:
+                        break
+                    if time.perf_counter() > deadline:
+                        return self.search(term)[:limit]
+                if not all(word_scores):
+                    continue
+
+                word_scores.sort(key=len)
+                others = word_scores[1:]
+                phrases = self._phrases
+                for checked, (slot, total) in enumerate(word_scores[0].items(), 1):
+                    if not checked & 1023 and time.perf_counter() > deadline:
+                        return self.search(term)[:limit]
+                    for other in others:
+                        score = other.get(slot)
+                        if score is None:
+                            break
+                        total += score
+                    else:
+                        score = total / len(reading)
+                        normalized = phrases[slot]
+                        if phrase in normalized:
+                            score += 0.5 if normalized.startswith(phrase) else 0.3
+                        score -= len(normalized) * 0.001
+                        if score > scores.get(slot, 0.0):
+                            scores[slot] = score
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], -item[0]))
+            return [self._records[slot] for slot, _score in best]
+
+
+def filter_sort_games(games: list[GameRecord], search_term: str = "", sort_mode: str = "name",
+                      index: SearchIndex | None = None,
+                      filters: dict[str, set[str]] | None = None) -> list[GameRecord]:
+    if index is not None and index.ready:
+        if search_term and sort_mode == "relevance":
+            return index.restrict(index.rank(search_term), filters)
+        filtered = index.view(sort_mode, search_term, filters)
+        if search_term and not filtered:
+            return index.restrict(index.rank(search_term), filters)
+        return filtered
+
+    filtered = games
+    if search_term:
+        search_term = search_term.casefold()
+        filtered = [g for g in filtered if search_term in g.name_key]
+    if filters:
+        filtered = [g for g in filtered if _matches_filters(g, filters)]
+
+    if sort_mode in ("name", "relevance"):
+        filtered = sorted(filtered, key=lambda g: g.sort_key)
+    elif sort_mode == "favorite":
+        filtered = sorted(filtered, key=lambda g: (not g.favorite, g.sort_key))
+    elif sort_mode == "date_added":
+        filtered = sorted(reversed(filtered), key=lambda g: g.added_at or 0, reverse=True)
+
+    return filtered
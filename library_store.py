@@ -0,0 +1,1096 @@
+import os
+import sys
+import json
+import hashlib
+import marshal
+import struct
+import tempfile
+import time
+from threading import Event, Lock, RLock, Thread
+from urllib.request import pathname2url
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+GAMES_FILE = "games.json"
+SETTINGS_FILE = "settings.json"
+LIBRARY_DB_FILE = "library.db"
+GAMES_JOURNAL_FILE = "games.journal"
+JOURNAL_COMPACT_BYTES = 256 * 1024
+LIBRARY_BACKENDS = ("sqlite", "files")
+LIBRARY_SNAPSHOT_FILE = "library.snapshot"
+SNAPSHOT_MAGIC = b"AGLSNAP"
+SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<7sBHBB20s")
+_BACKEND_STATE_FILES = {
+    "sqlite": (LIBRARY_DB_FILE, LIBRARY_DB_FILE + "-wal"),
+    "files": (GAMES_FILE, GAMES_JOURNAL_FILE, SETTINGS_FILE),
+}
+LIBRARY_DB_SCHEMA_VERSION = 1
+WRITE_BEHIND_DELAY = 0.5
+WRITE_BEHIND_RETRY_DELAY = 5.0
+USER_DATA_DIR_NAME = "Alpha Game Launcher"
+CACHE_DIR_NAME = "Cache"
+ICON_CACHE_DIR_NAME = "IconCache"
+DEFAULT_SETTINGS = {
+    "chunk_size": 12,
+    "card_chunk_sizes": {},
+    "library_renderer": "widgets",
+    "cache_size_mb": 200,
+    "cache_max_files": 2000,
+    "steamgriddb_api_key": "",
+    "rawg_api_key": "",
+    "artwork_provider": "steamgriddb",
+    "language": "de",
+    "scan_workers": 0,
+    "fast_start_snapshot": True,
+}
+
+
+def app_data_dir() -> str:
+    documents = os.path.join(os.path.expanduser("~"), "Documents")
+    base = documents if os.path.isdir(documents) else os.path.expanduser("~")
+    return os.path.join(base, USER_DATA_DIR_NAME)
+
+
+def cache_data_dir() -> str:
+    return os.path.join(app_data_dir(), CACHE_DIR_NAME)
+
+
+def icon_cache_dir() -> str:
+    return os.path.join(cache_data_dir(), ICON_CACHE_DIR_NAME)
+
+
+def state_file_path(filename: str, data_dir: str | None = None) -> str:
+    return os.path.join(data_dir or app_data_dir(), filename)
+
+
+def legacy_state_candidates(filename: str) -> list[str]:
+    candidates = [
+        os.path.abspath(filename),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), filename),
+    ]
+    seen = set()
+    result = []
+    for path in candidates:
+        norm = os.path.normcase(os.path.abspath(path))
+        if norm not in seen:
+            seen.add(norm)
+            result.append(path)
+    return result
+
+
+def load_json_state(filename: str, default, data_dir: str | None = None):
+    state_path = state_file_path(filename, data_dir)
+    paths_to_try = [state_path]
+    if not os.path.exists(state_path) and data_dir is None:
+        paths_to_try.extend(legacy_state_candidates(filename))
+
+    for path in paths_to_try:
+        if not os.path.exists(path):
+            continue
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if path != state_path:
+                write_json_state(filename, data, data_dir)
+            return data
+        except Exception as e:
+            print(f"Failed to load {filename} from {path}: {e}", file=sys.stderr)
+
+    return default.copy() if isinstance(default, dict) else list(default)
+
+
+def read_json_state(filename: str, default, data_dir: str | None = None):
+    path = state_file_path(filename, data_dir)
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Failed to load {filename} from {path}: {e}", file=sys.stderr)
+    return default.copy() if isinstance(default, dict) else list(default)
+
+
+def write_file_atomic(path: str, data: bytes):
+    state_dir = os.path.dirname(path)
+    os.makedirs(state_dir, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=state_dir)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+def encode_json_state(data) -> bytes:
+    return (json.dumps(data, indent=4, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+def write_json_state(filename: str, data, data_dir: str | None = None) -> bool:
+    state_path = state_file_path(filename, data_dir)
+    try:
+        write_file_atomic(state_path, encode_json_state(data))
+        return True
+    except Exception as e:
+        print(f"Failed to save {filename} to {state_path}: {e}", file=sys.stderr)
+        return False
+
+
+def load_games_state(data_dir: str | None = None) -> list[dict]:
+    games = load_json_state(GAMES_FILE, [], data_dir)
+    return games if isinstance(games, list) else []
+
+
+def load_settings_state(data_dir: str | None = None) -> dict:
+    loaded = load_json_state(SETTINGS_FILE, DEFAULT_SETTINGS, data_dir)
+    settings = DEFAULT_SETTINGS.copy()
+    if isinstance(loaded, dict):
+        settings.update(loaded)
+    return settings
+
+
+def prune_cache_dir(cache_dir: str, max_size_mb: int = 300, max_files: int = 5000, dry_run: bool = False) -> dict:
+    stats = {"files": 0, "bytes": 0, "removed": 0, "removed_bytes": 0}
+    try:
+        if not os.path.isdir(cache_dir):
+            return stats
+        entries = []
+        total_size = 0
+        try:
+            files = list(os.listdir(cache_dir))
+        except Exception:
+            return stats
+
+        for name in files:
+            path = os.path.join(cache_dir, name)
+            try:
+                if not os.path.isfile(path):
+                    continue
+                st = os.stat(path)
+                entries.append((path, st.st_mtime, st.st_size))
+                total_size += st.st_size
+            except (OSError, PermissionError):
+                continue
+
+        stats["files"] = len(entries)
+        stats["bytes"] = total_size
+        if not entries:
+            return stats
+
+        entries.sort(key=lambda x: x[1])
+
+        size_limit = max_size_mb * 1024 * 1024
+        removed_count = 0
+        while (total_size > size_limit or len(entries) > max_files) and entries:
+            if removed_count > 1000:
+                break
+            path, _, sz = entries.pop(0)
+            try:
+                if dry_run or os.path.isfile(path):
+                    if not dry_run:
+                        os.remove(path)
+                    total_size -= sz
+                    removed_count += 1
+                    stats["removed_bytes"] += sz
+            except (OSError, PermissionError):
+                continue
+        stats["removed"] = removed_count
+    except Exception:
+        pass
+    return stats
+
+
+_MISSING = object()
+
+
+def public_record(game: dict) -> dict:
+    return {key: value for key, value in game.items() if not key.startswith("_")}
+
+
+class JsonLibraryStore:
+    name = "json"
+
+    def __init__(self, data_dir: str | None = None):
+        self.data_dir = data_dir
+        self._lock = RLock()
+        self._records: dict[int, dict] = {}
+        self._next_id = 1
+
+    def _track(self, game: dict):
+        if game.get("_id") is None:
+            game["_id"] = self._next_id
+        self._next_id = max(self._next_id, game["_id"] + 1)
+        self._records[game["_id"]] = game
+
+    def _write_games(self) -> bool:
+        return write_json_state(GAMES_FILE, [public_record(g) for g in self._records.values()], self.data_dir)
+
+    def load_games(self) -> list[dict]:
+        with self._lock:
+            self._records = {}
+            games = load_games_state(self.data_dir)
+            for game in games:
+                self._track(game)
+            return games
+
+    def load_settings(self) -> dict:
+        return load_settings_state(self.data_dir)
+
+    def restore_games(self, games: list[dict]):
+        with self._lock:
+            self._records = {game["_id"]: game for game in games}
+            self._next_id = max(self._records, default=0) + 1
+
+    def apply_changes(self, added=(), updated=(), removed=()) -> bool:
+        with self._lock:
+            for game in added:
+                self._track(game)
+            for game in updated:
+                self._track(game)
+            for game in removed:
+                self._records.pop(game.get("_id"), None)
+            return self._write_games()
+
+    def add_games(self, games: list[dict]) -> bool:
+        return self.apply_changes(added=games)
+
+    def update_game(self, game: dict) -> bool:
+        return self.apply_changes(updated=[game])
+
+    def remove_game(self, game: dict) -> bool:
+        return self.apply_changes(removed=[game])
+
+    def replace_games(self, games: list[dict]) -> bool:
+        with self._lock:
+            self._records = {}
+            for game in games:
+                self._track(game)
+            return self._write_games()
+
+    def save_settings(self, settings: dict) -> bool:
+        return write_json_state(SETTINGS_FILE, settings, self.data_dir)
+
+    def export_json(self) -> bool:
+        return True
+
+    def close(self):
+        pass
+
+
+def _id_ranges(ids: list[int]) -> list[list[int]]:
+    ranges: list[list[int]] = []
+    for row_id in ids:
+        if ranges and ranges[-1][1] + 1 == row_id:
+            ranges[-1][1] = row_id
+        else:
+            ranges.append([row_id, row_id])
+    return ranges
+
+
+def _expand_id_ranges(ranges) -> list[int]:
+    return [row_id for first, last in ranges for row_id in range(first, last + 1)]
+
+
+def _journal_line(record: dict) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+class JournalLibraryStore(JsonLibraryStore):
+    name = "files"
+
+    def __init__(self, data_dir: str | None = None, compact_bytes: int = JOURNAL_COMPACT_BYTES):
+        super().__init__(data_dir)
+        self.snapshot_path = state_file_path(GAMES_FILE, data_dir)
+        self.journal_path = state_file_path(GAMES_JOURNAL_FILE, data_dir)
+        self.compact_bytes = compact_bytes
+        self._journal = None
+        self._journal_size = 0
+        self._journal_ops = 0
+        self._journal_generation = 0
+        self._snapshot_size = 0
+        self._compact_thread: Thread | None = None
+
+    def _read_snapshot(self, create: bool = True) -> tuple[list[dict], str]:
+        if not os.path.exists(self.snapshot_path):
+            if not create:
+                return [], ""
+            write_json_state(GAMES_FILE, load_games_state(self.data_dir), self.data_dir)
+        try:
+            with open(self.snapshot_path, "rb") as f:
+                raw = f.read()
+            games = json.loads(raw.decode("utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"Failed to load {GAMES_FILE} from {self.snapshot_path}: {e}", file=sys.stderr)
+            return [], ""
+        self._snapshot_size = len(raw)
+        games = [game for game in games if isinstance(game, dict)] if isinstance(games, list) else []
+        return games, hashlib.sha1(raw).hexdigest()
+
+    def _read_journal(self, path: str, digest: str) -> tuple[dict | None, list[dict], int]:
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError:
+            return None, [], 0
+
+        end = raw.rfind(b"\n") + 1
+        base = None
+        ops = []
+        for line in raw[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except ValueError:
+                print(f"Skipping damaged record in {path}", file=sys.stderr)
+                continue
+            if base is None:
+                if record.get("op") != "base" or record.get("snapshot") != digest:
+                    return None, [], 0
+                base = record
+            else:
+                ops.append(record)
+        if base is None:
+            return None, [], 0
+        if end < len(raw):
+            print(f"Dropping torn record at the end of {path}", file=sys.stderr)
+        return base, ops, end
+
+    def _replay(self, records: dict[int, dict], ops: list[dict]):
+        for op in ops:
+            kind = op.get("op")
+            row_id = op.get("id")
+            if kind == "add" and isinstance(op.get("game"), dict):
+                records[row_id] = dict(op["game"], _id=row_id)
+            elif row_id not in records:
+                continue
+            elif kind == "update":
+                records[row_id].update(op.get("set") or {})
+                for key in op.get("unset") or ():
+                    records[row_id].pop(key, None)
+            elif kind == "favorite":
+                records[row_id]["favorite"] = bool(op.get("value"))
+            elif kind == "remove":
+                del records[row_id]
+
+    def _open_journal(self, size: int):
+        self._journal = open(self.journal_path, "r+b")
+        if os.fstat(self._journal.fileno()).st_size != size:
+            self._journal.truncate(size)
+        self._journal.seek(size)
+        self._journal_size = size
+        self._journal_generation += 1
+
+    def _close_journal(self):
+        if self._journal is not None:
+            try:
+                self._journal.close()
+            finally:
+                self._journal = None
+
+    def _start_journal(self, ids: list[int], digest: str):
+        self._close_journal()
+        data = _journal_line({"op": "base", "snapshot": digest, "ids": _id_ranges(ids)})
+        write_file_atomic(self.journal_path, data)
+        self._open_journal(len(data))
+        self._journal_ops = 0
+
+    def load_games(self) -> list[dict]:
+        with self._lock:
+            self._close_journal()
+            games, digest = self._read_snapshot()
+            base, ops, size = self._read_journal(self.journal_path, digest)
+            journal_path = self.journal_path
+            if base is None:
+                base, ops, size = self._read_journal(self.journal_path + ".new", digest)
+                journal_path = self.journal_path + ".new"
+
+            ids = _expand_id_ranges(base["ids"]) if base is not None else []
+            if len(ids) != len(games):
+                if os.path.exists(self.journal_path):
+                    print(f"{GAMES_JOURNAL_FILE} does not match {GAMES_FILE}, keeping it as a backup", file=sys.stderr)
+                    try:
+                        os.replace(self.journal_path, self.journal_path + ".bak")
+                    except OSError:
+                        pass
+                base, ops, ids = None, [], list(range(1, len(games) + 1))
+
+            records = {row_id: dict(game, _id=row_id) for row_id, game in zip(ids, games)}
+            self._replay(records, ops)
+            self._records = records
+            self._next_id = max(records, default=0) + 1
+
+            try:
+                if base is None:
+                    self._start_journal(ids, digest)
+                else:
+                    if journal_path != self.journal_path:
+                        os.replace(journal_path, self.journal_path)
+                    elif os.path.exists(self.journal_path + ".new"):
+                        os.remove(self.journal_path + ".new")
+                    self._open_journal(size)
+                    self._journal_ops = len(ops)
+            except OSError as e:
+                print(f"Failed to open {self.journal_path}: {e}", file=sys.stderr)
+            return [dict(game) for game in records.values()]
+
+    def read_games(self) -> list[dict]:
+        with self._lock:
+            games, digest = self._read_snapshot(create=False)
+            base, ops, _ = self._read_journal(self.journal_path, digest)
+            if base is None:
+                base, ops, _ = self._read_journal(self.journal_path + ".new", digest)
+            ids = _expand_id_ranges(base["ids"]) if base is not None else []
+            if len(ids) != len(games):
+                ids, ops = list(range(1, len(games) + 1)), []
+            records = {row_id: dict(game, _id=row_id) for row_id, game in zip(ids, games)}
+            self._replay(records, ops)
+            return list(records.values())
+
+    def restore_games(self, games: list[dict]):
+        with self._lock:
+            self._close_journal()
+            self._records = {game["_id"]: dict(game) for game in games}
+            self._next_id = max(self._records, default=0) + 1
+            try:
+                self._snapshot_size = os.path.getsize(self.snapshot_path)
+                with open(self.journal_path, "rb") as f:
+                    self._journal_ops = max(0, f.read().count(b"\n") - 1)
+                self._open_journal(os.path.getsize(self.journal_path))
+            except OSError as e:
+                print(f"Failed to open {self.journal_path}: {e}", file=sys.stderr)
+
+    def _diff(self, old: dict, new: dict) -> dict | None:
+        changed = {
+            key: value for key, value in new.items()
+            if not key.startswith("_") and old.get(key, _MISSING) != value
+        }
+        unset = [key for key in old if not key.startswith("_") and key not in new]
+        if not changed and not unset:
+            return None
+        if not unset and list(changed) == ["favorite"]:
+            return {"op": "favorite", "id": new["_id"], "value": bool(changed["favorite"])}
+        op = {"op": "update", "id": new["_id"], "set": changed}
+        if unset:
+            op["unset"] = unset
+        return op
+
+    def apply_changes(self, added=(), updated=(), removed=()) -> bool:
+        with self._lock:
+            view: dict[int, dict | None] = {}
+            lines = []
+            for game in list(added) + list(updated):
+                if game.get("_id") is None:
+                    game["_id"] = self._next_id
+                self._next_id = max(self._next_id, game["_id"] + 1)
+                row_id = game["_id"]
+                old = view[row_id] if row_id in view else self._records.get(row_id)
+                if old is None:
+                    lines.append({"op": "add", "id": row_id, "game": public_record(game)})
+                else:
+                    op = self._diff(old, game)
+                    if op is None:
+                        continue
+                    lines.append(op)
+                view[row_id] = dict(game)
+            for game in removed:
+                row_id = game.get("_id")
+                if (view[row_id] if row_id in view else self._records.get(row_id)) is not None:
+                    lines.append({"op": "remove", "id": row_id})
+                    view[row_id] = None
+            if not lines:
+                return True
+
+            try:
+                if self._journal is None:
+                    raise OSError("journal is not open")
+                data = b"".join(_journal_line(line) for line in lines)
+                self._journal.write(data)
+                self._journal.flush()
+            except Exception as e:
+                print(f"Failed to append to {self.journal_path}: {e}", file=sys.stderr)
+                try:
+                    self._journal.truncate(self._journal_size)
+                    self._journal.seek(self._journal_size)
+                except Exception:
+                    pass
+                return False
+
+            self._journal_size += len(data)
+            self._journal_ops += len(lines)
+            for row_id, game in view.items():
+                if game is None:
+                    self._records.pop(row_id, None)
+                else:
+                    self._records[row_id] = game
+
+            if self._journal_size > max(self.compact_bytes, self._snapshot_size) and self._compact_thread is None:
+                self._compact_thread = Thread(target=self.compact, name="library-compact", daemon=True)
+                self._compact_thread.start()
+            return True
+
+    def compact(self) -> bool:
+        try:
+            with self._lock:
+                records = list(self._records.values())
+                offset = self._journal_size
+                generation = self._journal_generation
+            raw = encode_json_state([public_record(game) for game in records])
+            digest = hashlib.sha1(raw).hexdigest()
+            base = _journal_line({"op": "base", "snapshot": digest, "ids": _id_ranges([g["_id"] for g in records])})
+
+            fd, snapshot_tmp = tempfile.mkstemp(prefix=f".{GAMES_FILE}.", suffix=".tmp",
+                                                dir=os.path.dirname(self.snapshot_path))
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(raw)
+                with self._lock:
+                    if generation != self._journal_generation:
+                        return True
+                    tail = b""
+                    if self._journal is not None and self._journal_size > offset:
+                        self._journal.seek(offset)
+                        tail = self._journal.read(self._journal_size - offset)
+                        self._journal.seek(self._journal_size)
+                    write_file_atomic(self.journal_path + ".new", base + tail)
+                    os.replace(snapshot_tmp, self.snapshot_path)
+                    self._close_journal()
+                    os.replace(self.journal_path + ".new", self.journal_path)
+                    self._open_journal(len(base) + len(tail))
+                    self._journal_ops = tail.count(b"\n")
+                    self._snapshot_size = len(raw)
+            finally:
+                if os.path.exists(snapshot_tmp):
+                    os.remove(snapshot_tmp)
+            return True
+        except Exception as e:
+            print(f"Failed to compact {self.journal_path}: {e}", file=sys.stderr)
+            return False
+        finally:
+            self._compact_thread = None
+
+    def replace_games(self, games: list[dict]) -> bool:
+        with self._lock:
+            self._records = {}
+            for game in games:
+                if game.get("_id") is None:
+                    game["_id"] = self._next_id
+                self._next_id = max(self._next_id, game["_id"] + 1)
+                self._records[game["_id"]] = dict(game)
+            try:
+                raw = encode_json_state([public_record(game) for game in self._records.values()])
+                write_file_atomic(self.snapshot_path, raw)
+                self._snapshot_size = len(raw)
+                self._start_journal(list(self._records), hashlib.sha1(raw).hexdigest())
+                return True
+            except Exception as e:
+                print(f"Failed to save {GAMES_FILE} to {self.snapshot_path}: {e}", file=sys.stderr)
+                return False
+
+    def export_json(self) -> bool:
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join()
+        return self.compact() if self._journal_ops else True
+
+    def close(self):
+        thread = self._compact_thread
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            self._close_journal()
+
+
+class SqliteLibraryStore:
+    name = "sqlite"
+
+    def __init__(self, data_dir: str | None = None, read_only: bool = False):
+        self.data_dir = data_dir
+        self.path = state_file_path(LIBRARY_DB_FILE, data_dir)
+        self.read_only = read_only
+        self._lock = RLock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is not None:
+            return self._conn
+        if self.read_only:
+            uri = "file:" + pathname2url(os.path.abspath(self.path)) + "?mode=ro"
+            if not os.path.exists(self.path + "-wal"):
+                uri += "&immutable=1"
+            self._conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            return self._conn
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                conn.executescript("""
+                    CREATE TABLE IF NOT EXISTS games (
+                        id INTEGER PRIMARY KEY,
+                        position INTEGER NOT NULL,
+                        name TEXT NOT NULL DEFAULT '',
+                        path TEXT,
+                        steam_appid TEXT,
+                        favorite INTEGER NOT NULL DEFAULT 0,
+                        data TEXT NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS games_position ON games(position);
+                    CREATE INDEX IF NOT EXISTS games_name ON games(name COLLATE NOCASE);
+                    CREATE INDEX IF NOT EXISTS games_steam_appid ON games(steam_appid);
+                    CREATE INDEX IF NOT EXISTS games_path ON games(path);
+                    CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                    CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                """)
+            row = conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+            if row is None:
+                self._migrate_json_state(conn)
+        except Exception:
+            conn.close()
+            raise
+        self._conn = conn
+        return conn
+
+    def _migrate_json_state(self, conn):
+        games = load_games_state(self.data_dir)
+        settings = load_json_state(SETTINGS_FILE, {}, self.data_dir)
+        with conn:
+            conn.executemany(
+                "INSERT INTO games (position, name, path, steam_appid, favorite, data) VALUES (?, ?, ?, ?, ?, ?)",
+                [self._row_values(game, pos)[1:] for pos, game in enumerate(g for g in games if isinstance(g, dict))]
+            )
+            if isinstance(settings, dict):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+                    [(key, json.dumps(value, ensure_ascii=False)) for key, value in settings.items()]
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(LIBRARY_DB_SCHEMA_VERSION),)
+            )
+
+    def _row_values(self, game: dict, position: int = 0) -> tuple:
+        return (
+            game.get("_id"),
+            position,
+            str(game.get("name") or ""),
+            game.get("path"),
+            str(game["steam_appid"]) if game.get("steam_appid") else None,
+            1 if game.get("favorite") else 0,
+            json.dumps(public_record(game), ensure_ascii=False, separators=(",", ":")),
+        )
+
+    def open(self):
+        with self._lock:
+            self._connect()
+        return self
+
+    def restore_games(self, games: list[dict]):
+        pass
+
+    def _write(self, action: str, fn) -> bool:
+        if self.read_only:
+            print(f"Cannot {action} in {self.path}: opened read-only", file=sys.stderr)
+            return False
+        with self._lock:
+            try:
+                conn = self._connect()
+                with conn:
+                    fn(conn)
+                return True
+            except Exception as e:
+                print(f"Failed to {action} in {self.path}: {e}", file=sys.stderr)
+                return False
+
+    def _insert(self, conn, games: list[dict]):
+        position = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM games").fetchone()[0]
+        for game in games:
+            cursor = conn.execute(
+                "INSERT INTO games (id, position, name, path, steam_appid, favorite, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row_values(game, position)
+            )
+            game["_id"] = cursor.lastrowid
+            position += 1
+
+    def _update(self, conn, game: dict):
+        if game.get("_id") is not None:
+            row_id, _, name, path, steam_appid, favorite, data = self._row_values(game)
+            cursor = conn.execute(
+                "UPDATE games SET name = ?, path = ?, steam_appid = ?, favorite = ?, data = ? WHERE id = ?",
+                (name, path, steam_appid, favorite, data, row_id)
+            )
+            if cursor.rowcount:
+                return
+        self._insert(conn, [game])
+
+    def load_games(self) -> list[dict]:
+        with self._lock:
+            try:
+                rows = self._connect().execute("SELECT id, data FROM games ORDER BY position, id").fetchall()
+            except Exception as e:
+                print(f"Failed to load games from {self.path}: {e}", file=sys.stderr)
+                return []
+        games = []
+        for row_id, data in rows:
+            try:
+                game = json.loads(data)
+            except ValueError:
+                continue
+            game["_id"] = row_id
+            games.append(game)
+        return games
+
+    def load_settings(self) -> dict:
+        settings = DEFAULT_SETTINGS.copy()
+        with self._lock:
+            try:
+                rows = self._connect().execute("SELECT key, value FROM settings").fetchall()
+            except Exception as e:
+                print(f"Failed to load settings from {self.path}: {e}", file=sys.stderr)
+                return settings
+        for key, value in rows:
+            try:
+                settings[key] = json.loads(value)
+            except ValueError:
+                continue
+        return settings
+
+    def apply_changes(self, added=(), updated=(), removed=()) -> bool:
+        def apply(conn):
+            if added:
+                self._insert(conn, list(added))
+            for game in updated:
+                self._update(conn, game)
+            row_ids = [(game["_id"],) for game in removed if game.get("_id") is not None]
+            if row_ids:
+                conn.executemany("DELETE FROM games WHERE id = ?", row_ids)
+        return self._write("save games", apply)
+
+    def add_games(self, games: list[dict]) -> bool:
+        return self.apply_changes(added=games)
+
+    def update_game(self, game: dict) -> bool:
+        return self.apply_changes(updated=[game])
+
+    def remove_game(self, game: dict) -> bool:
+        return self.apply_changes(removed=[game])
+
+    def replace_games(self, games: list[dict]) -> bool:
+        def replace(conn):
+            conn.execute("DELETE FROM games")
+            self._insert(conn, games)
+        return self._write("replace games", replace)
+
+    def save_settings(self, settings: dict) -> bool:
+        return self._write("save settings", lambda conn: conn.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in settings.items()]
+        ))
+
+    def export_json(self) -> bool:
+        games = [public_record(game) for game in self.load_games()]
+        return (write_json_state(GAMES_FILE, games, self.data_dir)
+                and write_json_state(SETTINGS_FILE, self.load_settings(), self.data_dir))
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                finally:
+                    self._conn = None
+
+
+class WriteBehindStore:
+    def __init__(self, store, delay: float = WRITE_BEHIND_DELAY, on_error=None):
+        self.store = store
+        self.name = store.name
+        self.delay = delay
+        self.on_error = on_error
+        self._lock = Lock()
+        self._flush_lock = Lock()
+        self._dirty = Event()
+        self._closed = Event()
+        self._next_id = 1
+        self._replace: list[dict] | None = None
+        self._changes: dict[int, tuple[str, dict]] = {}
+        self._settings: dict | None = None
+        self._failing = False
+        self._thread = Thread(target=self._run, name="library-writer", daemon=True)
+        self._thread.start()
+
+    def load_games(self) -> list[dict]:
+        games = self.store.load_games()
+        self.track_ids(games)
+        return games
+
+    def track_ids(self, games: list[dict]):
+        with self._lock:
+            self._next_id = max([self._next_id] + [g["_id"] + 1 for g in games if g.get("_id") is not None])
+
+    def load_settings(self) -> dict:
+        return self.store.load_settings()
+
+    def _assign_id(self, game: dict):
+        if game.get("_id") is None:
+            game["_id"] = self._next_id
+        self._next_id = max(self._next_id, game["_id"] + 1)
+
+    def _queue(self, op: str, game: dict):
+        row_id = game["_id"]
+        previous = self._changes.get(row_id)
+        if previous is not None and previous[0] == "remove":
+            return
+        if previous is not None and previous[0] == "add":
+            if op == "remove":
+                del self._changes[row_id]
+                return
+            op = "add"
+        self._changes[row_id] = (op, dict(game) if op != "remove" else {"_id": row_id})
+
+    def add_games(self, games: list[dict]) -> bool:
+        with self._lock:
+            for game in games:
+                self._assign_id(game)
+                self._queue("add", game)
+        self._dirty.set()
+        return True
+
+    def update_game(self, game: dict) -> bool:
+        with self._lock:
+            if game.get("_id") is None:
+                self._assign_id(game)
+                self._queue("add", game)
+            else:
+                self._queue("update", game)
+        self._dirty.set()
+        return True
+
+    def remove_game(self, game: dict) -> bool:
+        if game.get("_id") is None:
+            return True
+        with self._lock:
+            self._queue("remove", game)
+        self._dirty.set()
+        return True
+
+    def replace_games(self, games: list[dict]) -> bool:
+        with self._lock:
+            for game in games:
+                self._assign_id(game)
+            self._replace = [dict(game) for game in games]
+            self._changes = {}
+        self._dirty.set()
+        return True
+
+    def save_settings(self, settings: dict) -> bool:
+        with self._lock:
+            self._settings = dict(settings)
+        self._dirty.set()
+        return True
+
+    def pending(self) -> bool:
+        with self._lock:
+            return self._replace is not None or bool(self._changes) or self._settings is not None
+
+    def _take(self):
+        with self._lock:
+            batch = (self._replace, self._changes, self._settings)
+            self._replace, self._changes, self._settings = None, {}, None
+            return batch
+
+    def _requeue(self, replace, changes, settings):
+        with self._lock:
+            if self._replace is None:
+                self._replace = replace
+                self._changes = {**changes, **self._changes}
+            if self._settings is None:
+                self._settings = settings
+
+    def flush(self) -> bool:
+        with self._flush_lock:
+            replace, changes, settings = self._take()
+            games_ok = True
+            if replace is not None:
+                games_ok = self.store.replace_games(replace)
+            if games_ok and changes:
+                added = [game for op, game in changes.values() if op == "add"]
+                updated = [game for op, game in changes.values() if op == "update"]
+                removed = [game for op, game in changes.values() if op == "remove"]
+                games_ok = self.store.apply_changes(added, updated, removed)
+            settings_ok = settings is None or self.store.save_settings(settings)
+
+            if not games_ok or not settings_ok:
+                self._requeue(replace if not games_ok else None,
+                              changes if not games_ok else {},
+                              settings if not settings_ok else None)
+                if not self._failing and self.on_error is not None:
+                    self.on_error("games" if not games_ok else "settings")
+            self._failing = not (games_ok and settings_ok)
+            return not self._failing
+
+    def _run(self):
+        while True:
+            self._dirty.wait()
+            self._closed.wait(self.delay)
+            self._dirty.clear()
+            if not self.flush() and not self._closed.is_set():
+                self._closed.wait(WRITE_BEHIND_RETRY_DELAY)
+                self._dirty.set()
+            if self._closed.is_set():
+                return
+
+    def export_json(self) -> bool:
+        self.flush()
+        return self.store.export_json()
+
+    def close(self, timeout: float = 10.0) -> bool:
+        self._closed.set()
+        self._dirty.set()
+        self._thread.join(timeout)
+        if self.pending():
+            deadline = time.monotonic() + timeout
+            while not self.flush() and time.monotonic() < deadline:
+                time.sleep(0.2)
+        self.store.close()
+        return not self.pending()
+
+
+def detect_library_backend(data_dir: str | None = None) -> str:
+    if os.path.exists(state_file_path(LIBRARY_DB_FILE, data_dir)):
+        return "sqlite"
+    if sqlite3 is None or os.path.exists(state_file_path(GAMES_JOURNAL_FILE, data_dir)):
+        return "files"
+    return "sqlite"
+
+
+def open_library_store(data_dir: str | None = None, backend: str | None = None):
+    backend = backend or detect_library_backend(data_dir)
+    if backend == "sqlite" and sqlite3 is not None:
+        store = SqliteLibraryStore(data_dir)
+        try:
+            return store.open()
+        except Exception as e:
+            print(f"Failed to open {store.path}, using plain files: {e}", file=sys.stderr)
+    return JournalLibraryStore(data_dir)
+
+
+def retire_library_backend(backend: str, data_dir: str | None = None):
+    if backend == "sqlite":
+        db_path = state_file_path(LIBRARY_DB_FILE, data_dir)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.replace(db_path + suffix, f"{db_path}.bak{suffix}")
+    elif backend == "files":
+        journal_path = state_file_path(GAMES_JOURNAL_FILE, data_dir)
+        if os.path.exists(journal_path):
+            os.replace(journal_path, journal_path + ".bak")
+
+
+def state_fingerprint(backend: str, data_dir: str | None = None) -> list[tuple]:
+    fingerprint = []
+    for name in _BACKEND_STATE_FILES.get(backend, ()):
+        try:
+            st = os.stat(state_file_path(name, data_dir))
+            fingerprint.append((name, st.st_size, st.st_mtime_ns))
+        except OSError:
+            fingerprint.append((name, -1, -1))
+    return fingerprint
+
+
+def write_library_snapshot(backend: str, games: list[dict], settings: dict, data_dir: str | None = None) -> bool:
+    path = state_file_path(LIBRARY_SNAPSHOT_FILE, data_dir)
+    try:
+        payload = marshal.dumps({
+            "backend": backend,
+            "fingerprint": state_fingerprint(backend, data_dir),
+            "games": games,
+            "settings": settings,
+        })
+        header = _SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version, sys.version_info[0], sys.version_info[1],
+            hashlib.sha1(payload).digest()
+        )
+        write_file_atomic(path, header + payload)
+        return True
+    except Exception as e:
+        print(f"Failed to write {path}: {e}", file=sys.stderr)
+        return False
+
+
+def read_library_snapshot(backend: str, data_dir: str | None = None) -> tuple[list[dict], dict] | None:
+    path = state_file_path(LIBRARY_SNAPSHOT_FILE, data_dir)
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+    if len(raw) < _SNAPSHOT_HEADER.size:
+        return None
+
+    magic, version, marshal_version, major, minor, digest = _SNAPSHOT_HEADER.unpack_from(raw)
+    if (magic, version, marshal_version, (major, minor)) != (
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, marshal.version, tuple(sys.version_info[:2])):
+        return None
+    payload = raw[_SNAPSHOT_HEADER.size:]
+    if hashlib.sha1(payload).digest() != digest:
+        print(f"Ignoring damaged {path}", file=sys.stderr)
+        return None
+    try:
+        data = marshal.loads(payload)
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(data, dict) or data.get("backend") != backend:
+        return None
+    if data.get("fingerprint") != state_fingerprint(backend, data_dir):
+        return None
+    settings = DEFAULT_SETTINGS.copy()
+    settings.update(data.get("settings") or {})
+    return data.get("games") or [], settings
+
+
+def remove_library_snapshot(data_dir: str | None = None):
+    path = state_file_path(LIBRARY_SNAPSHOT_FILE, data_dir)
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def read_library_state(data_dir: str | None = None, use_snapshot: bool = True) -> tuple[dict, list[dict], str]:
+    backend = detect_library_backend(data_dir)
+    snapshot = read_library_snapshot(backend, data_dir) if use_snapshot else None
+    if snapshot is not None:
+        games, settings = snapshot
+        return settings, games, "snapshot"
+    if backend == "sqlite" and sqlite3 is not None and os.path.exists(state_file_path(LIBRARY_DB_FILE, data_dir)):
+        store = SqliteLibraryStore(data_dir, read_only=True)
+        try:
+            return store.load_settings(), store.load_games(), store.name
+        finally:
+            store.close()
+
+    settings = DEFAULT_SETTINGS.copy()
+    loaded = read_json_state(SETTINGS_FILE, {}, data_dir)
+    if isinstance(loaded, dict):
+        settings.update(loaded)
+    source = "files" if os.path.exists(state_file_path(GAMES_JOURNAL_FILE, data_dir)) else "json"
+    return settings, JournalLibraryStore(data_dir).read_games(), source
+
+
+def open_library_state(data_dir: str | None = None, use_snapshot: bool = True):
+    backend = detect_library_backend(data_dir)
+    snapshot = read_library_snapshot(backend, data_dir) if use_snapshot else None
+    store = open_library_store(data_dir, backend)
+    if snapshot is not None and store.name == backend:
+        games, settings = snapshot
+        store.restore_games(games)
+        return store, settings, games, "snapshot"
+    return store, store.load_settings(), store.load_games(), store.name
@@ -0,0 +1,915 @@
+import os
+import re
+import json
+import heapq
+import mmap
+import struct
+import tempfile
+from typing import NamedTuple
+from queue import Queue
+from threading import Event, RLock, Thread
+
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
+MAX_SCAN_WORKERS = 16
+SCAN_INDEX_VERSION = 3
+APPINFO_MAGIC_V27 = 0x07564427
+APPINFO_MAGIC_V28 = 0x07564428
+APPINFO_MAGIC_V29 = 0x07564429
+_APPINFO_ENTRY_HEADER = struct.Struct("<II")
+_BAD_LAUNCH_TYPES = {"none", "server", "editor", "vr", "othervr", "openvr", "oculusvr"}
+
+
+def default_scan_workers() -> int:
+    return min(8, (os.cpu_count() or 2) + 2)
+
+
+def resolve_scan_workers(workers: int | None) -> int:
+    try:
+        workers = int(workers or 0)
+    except (TypeError, ValueError):
+        workers = 0
+    if workers < 1:
+        return default_scan_workers()
+    return min(workers, MAX_SCAN_WORKERS)
+
+
+def volume_key(path: str) -> str:
+    try:
+        return f"dev:{os.stat(path).st_dev}"
+    except OSError:
+        drive, _ = os.path.splitdrive(os.path.abspath(path))
+        return drive.upper() or path
+
+
+class VolumeWorkerPool:
+    def __init__(self, volumes: list[str], workers: int | None = None, cancel: Event | None = None):
+        self._done: Queue = Queue()
+        self._cancel = cancel or Event()
+        self._pending = 0
+        self._lanes: list[tuple[Queue, int]] = []
+        self._queues: dict[str, Queue] = {}
+
+        if not volumes:
+            return
+        workers = resolve_scan_workers(workers)
+        lanes = [Queue() for _ in range(min(workers, len(volumes)))]
+        self._queues = {volume: lanes[pos % len(lanes)] for pos, volume in enumerate(volumes)}
+        base, extra = divmod(workers, len(lanes))
+        for pos, lane in enumerate(lanes):
+            count = base + (1 if pos < extra else 0)
+            self._lanes.append((lane, count))
+            for _ in range(count):
+                Thread(target=self._drain, args=(lane,), daemon=True).start()
+
+    def _drain(self, q: Queue):
+        while True:
+            item = q.get()
+            if item is None:
+                return
+            key, fn, payload = item
+            if self._cancel.is_set():
+                self._done.put((key, None, None))
+                continue
+            try:
+                self._done.put((key, fn(payload), None))
+            except BaseException as e:
+                self._done.put((key, None, e))
+
+    def submit(self, volume: str, key, fn, payload):
+        self._pending += 1
+        self._queues[volume].put((key, fn, payload))
+
+    def completed(self):
+        while self._pending and not self._cancel.is_set():
+            key, result, error = self._done.get()
+            self._pending -= 1
+            if error is not None:
+                raise error
+            yield key, result
+
+    def shutdown(self):
+        for lane, count in self._lanes:
+            for _ in range(count):
+                lane.put(None)
+        self._lanes = []
+
+
+_VDF_BARE_RE = re.compile(r'[{}]|[^\s{}]+')
+_VDF_COMMENT_RE = re.compile(r'//[^\n]*')
+_VDF_ESCAPES = {"n": "\n", "t": "\t", "\\": "\\", '"': '"'}
+_VDF_ESCAPE_RE = re.compile(r'\\(.)')
+
+
+def _vdf_unescape(value: str) -> str:
+    return _VDF_ESCAPE_RE.sub(lambda m: _VDF_ESCAPES.get(m.group(1), "\\" + m.group(1)), value)
+
+
+def parse_vdf(text: str) -> dict:
+    root: dict = {}
+    stack = [root]
+    node = root
+    key = None
+    parts = text.split('"')
+    count = len(parts)
+    i = 0
+    quoted = False
+
+    while i < count:
+        part = parts[i]
+        i += 1
+        quoted = not quoted
+
+        if not quoted:
+            if part.endswith("\\"):
+                while (len(part) - len(part.rstrip("\\"))) % 2 and i < count:
+                    part += '"' + parts[i]
+                    i += 1
+            if "\\" in part:
+                part = _vdf_unescape(part)
+            if key is None:
+                key = part
+            else:
+                node[key] = part
+                key = None
+            continue
+
+        if part.isspace() or not part:
+            continue
+        if "//" in part:
+            start = part.index("//")
+            while start >= 0:
+                while "\n" not in part[start:] and i < count:
+                    part += '"' + parts[i]
+                    i += 1
+                end = part.find("\n", start)
+                start = part.find("//", end) if end >= 0 else -1
+            part = _VDF_COMMENT_RE.sub("", part)
+
+        stripped = part.strip()
+        tokens = (stripped,) if stripped == "{" or stripped == "}" else _VDF_BARE_RE.findall(part)
+        for token in tokens:
+            if token == "{":
+                child: dict = {}
+                node[key if key is not None else ""] = child
+                stack.append(child)
+                node = child
+                key = None
+            elif token == "}":
+                if len(stack) > 1:
+                    stack.pop()
+                    node = stack[-1]
+                key = None
+            elif token[0] == "[" and token[-1] == "]":
+                continue
+            elif key is None:
+                key = token
+            else:
+                node[key] = token
+                key = None
+
+    return root
+
+
+def load_vdf(path: str) -> dict:
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return parse_vdf(f.read())
+
+
+def vdf_get(node, key: str, default=None):
+    if not isinstance(node, dict):
+        return default
+    if key in node:
+        return node[key]
+    key_lower = key.lower()
+    for k, v in node.items():
+        if k.lower() == key_lower:
+            return v
+    return default
+
+
+def vdf_int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _read_reg_str(root, subkey: str, value_name: str) -> str | None:
+    try:
+        with winreg.OpenKey(root, subkey) as key:
+            value, _ = winreg.QueryValueEx(key, value_name)
+            return str(value)
+    except OSError:
+        return None
+
+
+def find_steam_install_path() -> str | None:
+    if winreg is not None:
+        steam_path = (
+            _read_reg_str(winreg.HKEY_CURRENT_USER, r"Software\Valve\Steam", "SteamPath")
+            or _read_reg_str(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\WOW6432Node\Valve\Steam", "InstallPath")
+            or _read_reg_str(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\Valve\Steam", "InstallPath")
+        )
+        return os.path.normpath(steam_path) if steam_path else None
+
+    for candidate in ("~/.steam/steam", "~/.local/share/Steam"):
+        path = os.path.expanduser(candidate)
+        if os.path.isdir(os.path.join(path, "steamapps")):
+            return os.path.realpath(path)
+    return None
+
+
+def read_library_folders(steam_path: str) -> dict[str, list[str] | None]:
+    libraries: dict[str, list[str] | None] = {os.path.normpath(steam_path): None}
+
+    vdf_path = os.path.join(steam_path, "steamapps", "libraryfolders.vdf")
+    if not os.path.exists(vdf_path):
+        return libraries
+
+    try:
+        folders = vdf_get(load_vdf(vdf_path), "libraryfolders", {})
+    except Exception:
+        return libraries
+
+    if not isinstance(folders, dict):
+        return libraries
+
+    for key, entry in folders.items():
+        if isinstance(entry, dict):
+            path = vdf_get(entry, "path")
+            apps = vdf_get(entry, "apps")
+            appids = list(apps) if isinstance(apps, dict) else None
+        elif key.isdigit() and isinstance(entry, str):
+            path, appids = entry, None
+        else:
+            continue
+
+        if not path:
+            continue
+        path = os.path.normpath(path)
+        existing = next((p for p in libraries if _library_key(p) == _library_key(path)), path)
+        if appids is None and libraries.get(existing):
+            continue
+        libraries[existing] = appids
+
+    return libraries
+
+
+def get_steam_library_paths(steam_path: str) -> list[str]:
+    return list(read_library_folders(steam_path))
+
+
+def parse_acf_manifest(acf_path: str) -> dict:
+    try:
+        app_state = vdf_get(load_vdf(acf_path), "AppState", {})
+        if not isinstance(app_state, dict):
+            app_state = {}
+
+        return {
+            "name": vdf_get(app_state, "name") or None,
+            "installdir": vdf_get(app_state, "installdir") or None,
+            "steam_appid": vdf_get(app_state, "appid") or None,
+            "size_on_disk": vdf_int(vdf_get(app_state, "SizeOnDisk")),
+            "state_flags": vdf_int(vdf_get(app_state, "StateFlags")),
+            "last_updated": vdf_int(vdf_get(app_state, "LastUpdated")),
+        }
+    except Exception:
+        return {
+            "name": None,
+            "installdir": None,
+            "steam_appid": None,
+            "size_on_disk": 0,
+            "state_flags": 0,
+            "last_updated": 0,
+        }
+
+
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+_PRUNED_DIR_TOKENS = ("_commonredist", "redist", "vcredist", "directx", "dotnet", "installers", "support", "_data")
+_ASSET_DIR_NAMES = frozenset({
+    "content", "paks", "movies", "videos", "shaders", "shadercache", "localization",
+    "logs", "saved", "screenshots", "__pycache__", "streamingassets", "textures", "sounds",
+})
+_LIKELY_EXE_DIR_NAMES = frozenset({"win64", "x64", "bin64", "binaries", "bin", "binary", "win32", "x86"})
+_BIN_PARENT_NAMES = frozenset({"bin", "binaries", "bin64", "binary"})
+_BAD_EXE_WORDS = (
+    "unins", "setup", "installer", "install", "crash", "crashreport",
+    "report", "helper", "support", "redist", "vc_redist", "vcredist",
+    "directx", "dotnet", "handler", "crs-handler", "connectinstaller",
+    "uplay", "ubisoft", "ea", "origin", "battlenet", "epicgames",
+    "steam", "launcher", "update", "patcher", "config", "settings",
+    "unreal", "unity", "activation", "register",
+)
+EXE_SEARCH_MAX_DEPTH = 4
+EXE_SEARCH_MAX_CANDIDATES = 50
+EXE_HIGH_CONFIDENCE_SCORE = 60
+
+
+def _is_pruned_dir(name_lower: str) -> bool:
+    return any(token in name_lower for token in _PRUNED_DIR_TOKENS)
+
+
+def _exe_scorer(game_root: str, game_name: str):
+    game_name_clean = _NON_ALNUM_RE.sub('', game_name.lower()) if game_name else ""
+    folder_clean = _NON_ALNUM_RE.sub('', os.path.basename(os.path.normpath(game_root)).lower())
+    if len(folder_clean) <= 3:
+        folder_clean = ""
+
+    def score(name_lower: str, parent_lower: str, depth: int) -> int:
+        if any(w in name_lower for w in _BAD_EXE_WORDS):
+            return -100
+
+        n_clean = _NON_ALNUM_RE.sub('', name_lower)
+        points = 10
+
+        if game_name_clean and game_name_clean in n_clean:
+            points += 50
+
+        if folder_clean and folder_clean in n_clean:
+            points += 40
+
+        if depth == 1:
+            points += 20
+
+        if parent_lower in _BIN_PARENT_NAMES:
+            points += 15
+
+        if "x64" in name_lower or "win64" in name_lower or "64bit" in name_lower:
+            points += 5
+
+        if depth > 2:
+            points -= (depth - 2) * 5
+
+        return points
+
+    return score
+
+
+def find_game_exe(game_root: str, game_name: str = "", max_depth: int = EXE_SEARCH_MAX_DEPTH) -> str | None:
+    if not os.path.isdir(game_root):
+        return None
+
+    score = _exe_scorer(game_root, game_name)
+    best_path = None
+    best_score = 0
+    candidates = 0
+    seq = 0
+    pending = [(0, 0, 0, seq, game_root, "")]
+
+    while pending:
+        tier, _, depth, _, directory, directory_lower = heapq.heappop(pending)
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            name_lower = entry.name.lower()
+            try:
+                if name_lower.endswith(".exe"):
+                    if not entry.is_file():
+                        continue
+                    candidates += 1
+                    points = score(name_lower, directory_lower, depth + 1)
+                    if best_path is None or points > best_score:
+                        best_path, best_score = entry.path, points
+                elif entry.is_dir(follow_symlinks=False):
+                    if _is_pruned_dir(name_lower):
+                        continue
+                    seq += 1
+                    if depth >= max_depth:
+                        child_tier = 2
+                    elif name_lower in _ASSET_DIR_NAMES:
+                        child_tier = max(tier, 1)
+                    else:
+                        child_tier = tier
+                    priority = 0 if name_lower in _LIKELY_EXE_DIR_NAMES else 1
+                    heapq.heappush(pending, (child_tier, priority, depth + 1, seq, entry.path, name_lower))
+            except OSError:
+                continue
+
+        if best_score >= EXE_HIGH_CONFIDENCE_SCORE or candidates > EXE_SEARCH_MAX_CANDIDATES:
+            break
+        if depth == 0 and candidates >= 3:
+            break
+
+    if best_path is not None and best_score > 0:
+        return best_path
+
+    return None
+
+
+class AppInfoReader:
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = RLock()
+        self._file = None
+        self._mm: mmap.mmap | None = None
+        self._version = 0
+        self._offsets: dict[int, tuple[int, int]] = {}
+        self._scan_pos = 0
+        self._exhausted = True
+        self._string_table_offset = 0
+        self._strings: list[str] | None = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def open(self) -> bool:
+        if self._mm is not None:
+            return True
+        try:
+            self._file = open(self.path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, _universe = struct.unpack_from("<II", self._mm, 0)
+            if magic not in (APPINFO_MAGIC_V27, APPINFO_MAGIC_V28, APPINFO_MAGIC_V29):
+                raise ValueError(f"Unsupported appinfo.vdf magic {magic:#x}")
+            self._version = magic & 0xFF
+            self._offsets = {}
+            self._strings = None
+            self._scan_pos = 8
+            if self._version >= 0x29:
+                (self._string_table_offset,) = struct.unpack_from("<q", self._mm, 8)
+                self._scan_pos = 16
+            self._exhausted = False
+            return True
+        except (OSError, ValueError, struct.error):
+            self.close()
+            return False
+
+    def close(self):
+        with self._lock:
+            if self._mm is not None:
+                try:
+                    self._mm.close()
+                except Exception:
+                    pass
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+            self._mm = None
+            self._file = None
+            self._exhausted = True
+
+    def _index_until(self, appid: int | None = None):
+        mm = self._mm
+        if mm is None:
+            return
+        limit = self._string_table_offset if self._version >= 0x29 else len(mm)
+        skip = 4 + 4 + 8 + 20 + 4 + (20 if self._version >= 0x28 else 0)
+        pos = self._scan_pos
+
+        while not self._exhausted:
+            if pos + 8 > limit:
+                self._exhausted = True
+                break
+            entry_appid, size = _APPINFO_ENTRY_HEADER.unpack_from(mm, pos)
+            if entry_appid == 0:
+                self._exhausted = True
+                break
+            data_start = pos + 8
+            entry_end = data_start + size
+            if entry_end > limit:
+                self._exhausted = True
+                break
+            self._offsets[entry_appid] = (data_start + skip, entry_end)
+            pos = entry_end
+            if entry_appid == appid:
+                break
+
+        self._scan_pos = pos
+
+    def _load_strings(self) -> list[str]:
+        if self._strings is None:
+            mm = self._mm
+            (count,) = struct.unpack_from("<I", mm, self._string_table_offset)
+            raw = mm[self._string_table_offset + 4:].split(b"\0", count)
+            self._strings = [item.decode("utf-8", errors="replace") for item in raw[:count]]
+        return self._strings
+
+    def _read_cstring(self, pos: int, end: int) -> tuple[str, int]:
+        nul = self._mm.find(b"\0", pos, end)
+        if nul < 0:
+            raise ValueError("Unterminated string in appinfo.vdf")
+        return self._mm[pos:nul].decode("utf-8", errors="replace"), nul + 1
+
+    def _parse_kv(self, pos: int, end: int) -> dict:
+        mm = self._mm
+        string_keys = self._version < 0x29
+        strings = None if string_keys else self._load_strings()
+        root: dict = {}
+        stack = [root]
+
+        while pos < end:
+            kind = mm[pos]
+            pos += 1
+            if kind == 0x08:
+                if len(stack) == 1:
+                    break
+                stack.pop()
+                continue
+
+            if string_keys:
+                key, pos = self._read_cstring(pos, end)
+            else:
+                (key_index,) = struct.unpack_from("<I", mm, pos)
+                pos += 4
+                key = strings[key_index]
+
+            if kind == 0x00:
+                child: dict = {}
+                stack[-1][key] = child
+                stack.append(child)
+            elif kind == 0x01:
+                stack[-1][key], pos = self._read_cstring(pos, end)
+            elif kind in (0x02, 0x04, 0x06):
+                (stack[-1][key],) = struct.unpack_from("<i", mm, pos)
+                pos += 4
+            elif kind == 0x03:
+                (stack[-1][key],) = struct.unpack_from("<f", mm, pos)
+                pos += 4
+            elif kind == 0x07:
+                (stack[-1][key],) = struct.unpack_from("<Q", mm, pos)
+                pos += 8
+            elif kind == 0x0A:
+                (stack[-1][key],) = struct.unpack_from("<q", mm, pos)
+                pos += 8
+            elif kind == 0x05:
+                nul = pos
+                while nul + 1 < end and (mm[nul] or mm[nul + 1]):
+                    nul += 2
+                stack[-1][key] = mm[pos:nul].decode("utf-16-le", errors="replace")
+                pos = nul + 2
+            else:
+                raise ValueError(f"Unknown appinfo.vdf value type {kind:#x}")
+
+        return root
+
+    def get_app(self, appid) -> dict | None:
+        with self._lock:
+            if self._mm is None and not self.open():
+                return None
+            try:
+                appid = int(appid)
+                if appid not in self._offsets:
+                    self._index_until(appid)
+                span = self._offsets.get(appid)
+                if span is None:
+                    return None
+                data = self._parse_kv(*span)
+                return data.get("appinfo", data)
+            except (ValueError, IndexError, KeyError, struct.error):
+                return None
+
+    def get_launch_config(self, appid) -> dict | None:
+        app = self.get_app(appid)
+        config = vdf_get(app, "config")
+        launch = vdf_get(config, "launch")
+        if not isinstance(launch, dict):
+            return None
+
+        best = None
+        best_rank = None
+        for order, entry in enumerate(launch.values()):
+            if not isinstance(entry, dict):
+                continue
+            executable = str(vdf_get(entry, "executable") or "").strip()
+            if not executable.lower().endswith(".exe"):
+                continue
+
+            launch_type = str(vdf_get(entry, "type") or "default").lower()
+            entry_config = vdf_get(entry, "config", {})
+            oslist = str(vdf_get(entry_config, "oslist") or "").lower()
+            if launch_type in _BAD_LAUNCH_TYPES or vdf_get(entry_config, "betakey"):
+                continue
+            if oslist and "windows" not in oslist:
+                continue
+
+            rank = (
+                launch_type != "default",
+                str(vdf_get(entry_config, "osarch") or "") not in ("", "64"),
+                order,
+            )
+            if best_rank is None or rank < best_rank:
+                best, best_rank = entry, rank
+
+        if best is None:
+            return None
+        return {
+            "executable": str(vdf_get(best, "executable") or "").strip(),
+            "workingdir": str(vdf_get(best, "workingdir") or "").strip(),
+            "installdir": str(vdf_get(config, "installdir") or ""),
+        }
+
+
+def _join_steam_relative(game_root: str, relative: str) -> str:
+    parts = [p for p in re.split(r'[\\/]+', relative) if p and p != "."]
+    return os.path.join(game_root, *parts)
+
+
+def resolve_launch_exe(game_root: str, launch: dict | None) -> tuple[str | None, str | None]:
+    if not launch or not launch.get("executable"):
+        return None, None
+    exe_path = _join_steam_relative(game_root, launch["executable"])
+    if not os.path.isfile(exe_path):
+        return None, None
+    working_dir = None
+    if launch.get("workingdir"):
+        working_dir = _join_steam_relative(game_root, launch["workingdir"])
+        if not os.path.isdir(working_dir):
+            working_dir = None
+    return exe_path, working_dir
+
+
+def _library_key(library: str) -> str:
+    return os.path.normcase(os.path.normpath(library))
+
+
+def _mtime_ns(path: str) -> int | None:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class SteamScanIndex:
+    def __init__(self, path: str | None = None):
+        self.path = path
+        self._lock = RLock()
+        self._libraries: dict[str, dict] = {}
+        self.load()
+
+    def load(self):
+        with self._lock:
+            self._libraries = {}
+            if not self.path or not os.path.exists(self.path):
+                return
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict) and data.get("version") == SCAN_INDEX_VERSION:
+                    libraries = data.get("libraries")
+                    if isinstance(libraries, dict):
+                        self._libraries = libraries
+            except Exception:
+                self._libraries = {}
+
+    def save(self) -> bool:
+        if not self.path:
+            return False
+        with self._lock:
+            data = {"version": SCAN_INDEX_VERSION, "libraries": self._libraries}
+            index_dir = os.path.dirname(self.path)
+            try:
+                os.makedirs(index_dir, exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(prefix=".steam_scan_index.", suffix=".tmp", dir=index_dir, text=True)
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+                    os.replace(temp_path, self.path)
+                    return True
+                finally:
+                    if os.path.exists(temp_path):
+                        try:
+                            os.remove(temp_path)
+                        except OSError:
+                            pass
+            except Exception:
+                return False
+
+    def clear(self):
+        with self._lock:
+            self._libraries = {}
+            if self.path and os.path.exists(self.path):
+                try:
+                    os.remove(self.path)
+                except OSError:
+                    pass
+
+    def invalidate_library(self, library: str):
+        with self._lock:
+            self._libraries.pop(_library_key(library), None)
+
+    def retain_libraries(self, libraries: list[str]):
+        keep = {_library_key(lib) for lib in libraries}
+        with self._lock:
+            for key in [k for k in self._libraries if k not in keep]:
+                self._libraries.pop(key, None)
+
+    def library_entry(self, library: str) -> dict:
+        with self._lock:
+            entry = self._libraries.setdefault(_library_key(library), {})
+            entry.setdefault("manifests", {})
+            entry.setdefault("roots", {})
+            return entry
+
+
+def _list_manifest_tasks(libraries: list[str],
+                         library_apps: dict[str, list[str] | None] | None = None) -> list[tuple[str, tuple]]:
+    tasks = []
+    for lib in libraries:
+        steamapps = os.path.join(lib, "steamapps")
+        appids = (library_apps or {}).get(lib)
+
+        if appids is not None:
+            volume = volume_key(lib)
+            for appid in appids:
+                tasks.append((volume, (lib, f"appmanifest_{appid}.acf", None)))
+            continue
+
+        if not os.path.isdir(steamapps):
+            continue
+
+        volume = volume_key(steamapps)
+        with os.scandir(steamapps) as it:
+            for entry in it:
+                file = entry.name
+                if not (file.startswith("appmanifest_") and file.endswith(".acf")):
+                    continue
+                try:
+                    st = entry.stat()
+                    stamp = (st.st_mtime_ns, st.st_size)
+                except OSError:
+                    stamp = (0, -1)
+                tasks.append((volume, (lib, file, stamp)))
+    return tasks
+
+
+def _load_manifest(payload) -> tuple[int, int, dict | None, bool]:
+    lib, file, stamp, cached = payload
+    acf_path = os.path.join(lib, "steamapps", file)
+
+    if stamp is None:
+        try:
+            st = os.stat(acf_path)
+        except OSError:
+            return 0, -1, None, True
+        stamp = (st.st_mtime_ns, st.st_size)
+
+    mtime, size = stamp
+    if cached and cached.get("mtime") == mtime and cached.get("size") == size:
+        return mtime, size, cached.get("meta") or {}, False
+    return mtime, size, parse_acf_manifest(acf_path), True
+
+
+def _resolve_exe(payload, appinfo: AppInfoReader | None = None) -> dict:
+    name, game_root, cached, steam_appid = payload
+    root_mtime = _mtime_ns(game_root)
+
+    if cached and root_mtime is not None and cached.get("root_mtime") == root_mtime:
+        exe = cached.get("exe")
+        if not exe:
+            return cached
+        if _mtime_ns(os.path.dirname(exe)) == cached.get("exe_dir_mtime"):
+            return cached
+
+    exe, working_dir = None, None
+    if appinfo is not None and str(steam_appid).isdigit():
+        exe, working_dir = resolve_launch_exe(game_root, appinfo.get_launch_config(steam_appid))
+    if not exe:
+        exe = find_game_exe(game_root, name)
+    return {
+        "root_mtime": root_mtime,
+        "exe": exe,
+        "exe_dir_mtime": _mtime_ns(os.path.dirname(exe)) if exe else None,
+        "working_dir": working_dir,
+    }
+
+
+class ScanProgress(NamedTuple):
+    processed: int
+    total: int
+    position: int
+    game: dict | None
+
+
+def iter_steam_scan(libraries: list[str], workers: int | None = None,
+                    index: SteamScanIndex | None = None,
+                    library_apps: dict[str, list[str] | None] | None = None,
+                    appinfo_path: str | None = None,
+                    cancel: Event | None = None):
+    cancel = cancel or Event()
+    manifest_tasks = _list_manifest_tasks(libraries, library_apps)
+    total = len(manifest_tasks)
+
+    loaded: list[tuple | None] = [None] * total
+    resolved: dict[int, dict] = {}
+    exe_keys: dict[int, tuple[str, str]] = {}
+    seen_roots: set[str] = set()
+    processed = 0
+    next_pos = 0
+
+    appinfo = AppInfoReader(appinfo_path) if appinfo_path and os.path.isfile(appinfo_path) else None
+    pool = VolumeWorkerPool(list(dict.fromkeys(volume for volume, _ in manifest_tasks)), workers, cancel)
+
+    def resolve(payload):
+        return _resolve_exe(payload, appinfo)
+
+    try:
+        for pos, (volume, (lib, file, stamp)) in enumerate(manifest_tasks):
+            cached = index.library_entry(lib)["manifests"].get(file) if index is not None else None
+            pool.submit(volume, ("manifest", pos), _load_manifest, (lib, file, stamp, cached))
+
+        for (stage, pos), result in pool.completed():
+            if stage == "exe":
+                resolved[pos] = result
+                processed += 1
+                yield ScanProgress(processed, total, pos, _scan_result_game(manifest_tasks[pos], loaded[pos], result))
+                continue
+
+            loaded[pos] = result
+            while next_pos < total and loaded[next_pos] is not None:
+                volume, (lib, file, _) = manifest_tasks[next_pos]
+                _, _, meta, changed = loaded[next_pos]
+                root = _claim_game_root(lib, meta, seen_roots)
+                if root is None:
+                    processed += 1
+                    yield ScanProgress(processed, total, next_pos, None)
+                else:
+                    game_root, _, root_key = root
+                    cached_root = None
+                    if index is not None and not changed:
+                        cached_root = index.library_entry(lib)["roots"].get(root_key)
+                    exe_keys[next_pos] = (lib, root_key)
+                    steam_appid = _manifest_appid(file, meta)
+                    pool.submit(volume, ("exe", next_pos), resolve, (meta["name"], game_root, cached_root, steam_appid))
+                next_pos += 1
+    finally:
+        pool.shutdown()
+        if appinfo is not None:
+            appinfo.close()
+
+    if cancel.is_set() or index is None:
+        return
+
+    index.retain_libraries(libraries)
+    for lib in libraries:
+        index.invalidate_library(lib)
+    for (_, (lib, file, _)), (mtime, size, meta, _) in zip(manifest_tasks, loaded):
+        if meta is not None:
+            index.library_entry(lib)["manifests"][file] = {"mtime": mtime, "size": size, "meta": meta}
+    for pos, (lib, root_key) in exe_keys.items():
+        index.library_entry(lib)["roots"][root_key] = resolved[pos]
+    index.save()
+
+
+def _manifest_appid(file: str, meta: dict) -> str:
+    return meta.get("steam_appid") or os.path.splitext(file)[0].replace("appmanifest_", "")
+
+
+def _manifest_game_root(lib: str, meta: dict | None) -> tuple[str, str, str] | None:
+    if not meta or not meta.get("name") or not meta.get("installdir"):
+        return None
+    installdir = meta["installdir"]
+    game_root = os.path.join(lib, "steamapps", "common", installdir)
+    return game_root, os.path.normpath(game_root).lower(), installdir.lower()
+
+
+def _claim_game_root(lib: str, meta: dict | None, seen_roots: set[str]) -> tuple[str, str, str] | None:
+    root = _manifest_game_root(lib, meta)
+    if root is None or root[1] in seen_roots:
+        return None
+    seen_roots.add(root[1])
+    return root
+
+
+def _scan_result_game(task, loaded, entry: dict) -> dict | None:
+    exe_path = entry.get("exe")
+    if not exe_path:
+        return None
+
+    _, (_, file, _) = task
+    meta = loaded[2]
+    game = {
+        "name": meta["name"],
+        "path": exe_path,
+        "source": "Steam",
+        "steam_appid": _manifest_appid(file, meta)
+    }
+    if entry.get("working_dir"):
+        game["working_dir"] = entry["working_dir"]
+    return game
+
+
+def scan_steam_libraries(libraries: list[str], workers: int | None = None,
+                         index: SteamScanIndex | None = None,
+                         library_apps: dict[str, list[str] | None] | None = None,
+                         appinfo_path: str | None = None) -> list[dict]:
+    found = [
+        (progress.position, progress.game)
+        for progress in iter_steam_scan(libraries, workers, index, library_apps, appinfo_path)
+        if progress.game is not None
+    ]
+    found.sort(key=lambda item: item[0])
+    return [game for _, game in found]
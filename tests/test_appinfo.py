@@ -0,0 +1,169 @@
+import os
+import struct
+
+import pytest
+
+import steam_scanner
+from steam_scanner import AppInfoReader
+from synthetic_steam import write_appinfo
+
+VERSIONS = (0x27, 0x28, 0x29)
+
+
+def launch_app(name, launch, installdir=None):
+    return {"common": {"name": name, "type": "Game"},
+            "config": {"installdir": installdir or name, "launch": {str(i): entry for i, entry in enumerate(launch)}}}
+
+
+def entry(executable, type=None, **config):
+    data = {"executable": executable}
+    if type is not None:
+        data["type"] = type
+    if config:
+        data["config"] = config
+    return data
+
+
+APPS = {
+    10: launch_app("First", [entry("first.exe", "default")]),
+    20: launch_app("Second", [entry("bin\\second.exe", "default", oslist="windows", osarch="64")]),
+    30: launch_app("Third", [entry("third.exe")]),
+}
+
+
+@pytest.fixture(params=VERSIONS, ids=lambda version: f"v{version:x}")
+def appinfo(request, tmp_path):
+    path = str(tmp_path / "appcache" / "appinfo.vdf")
+    write_appinfo(path, APPS, request.param)
+    return path, request.param
+
+
+def test_reads_apps_for_each_header_version(appinfo):
+    path, version = appinfo
+    with AppInfoReader(path) as reader:
+        assert reader._version == version
+        for appid, data in APPS.items():
+            assert reader.get_app(appid) == data
+        assert reader.get_app(99) is None
+        assert reader.get_app("not a number") is None
+
+
+def test_v29_keys_come_from_the_string_table(tmp_path):
+    path = str(tmp_path / "appinfo.vdf")
+    write_appinfo(path, APPS, 0x29)
+    with open(path, "rb") as f:
+        raw = f.read()
+    (table_offset,) = struct.unpack_from("<q", raw, 8)
+
+    assert b"executable" not in raw[:table_offset]
+    assert b"executable\0" in raw[table_offset:]
+    with AppInfoReader(path) as reader:
+        assert reader.get_app(20)["config"]["launch"]["0"]["executable"] == "bin\\second.exe"
+        strings = reader._strings
+        assert "executable" in strings
+        reader.get_app(30)
+        assert reader._strings is strings
+
+
+def test_walks_entry_headers_lazily(appinfo):
+    path, _ = appinfo
+    with AppInfoReader(path) as reader:
+        assert reader._offsets == {}
+        reader.get_app(10)
+        assert list(reader._offsets) == [10]
+        assert not reader._exhausted
+        reader.get_app(20)
+        assert list(reader._offsets) == [10, 20]
+        reader.get_app(10)
+        assert list(reader._offsets) == [10, 20]
+        assert reader.get_app(99) is None
+        assert list(reader._offsets) == [10, 20, 30]
+        assert reader._exhausted
+        assert reader.get_app(30) == APPS[30]
+
+
+def test_rejects_unknown_magic(tmp_path):
+    path = tmp_path / "appinfo.vdf"
+    path.write_bytes(struct.pack("<II", 0x07564426, 1) + b"\0" * 32)
+
+    reader = AppInfoReader(str(path))
+    assert not reader.open()
+    assert reader.get_app(10) is None
+    assert AppInfoReader(str(tmp_path / "missing.vdf")).get_launch_config(10) is None
+
+
+def test_stops_at_truncated_entry(tmp_path):
+    path = str(tmp_path / "appinfo.vdf")
+    write_appinfo(path, APPS, 0x28)
+    with open(path, "rb") as f:
+        raw = f.read()
+    with open(path, "wb") as f:
+        f.write(raw[:-40])
+
+    with AppInfoReader(path) as reader:
+        assert reader.get_app(10) == APPS[10]
+        assert reader.get_app(30) is None
+        assert reader._exhausted
+
+
+def launch_config(tmp_path, launch, version=0x29):
+    path = str(tmp_path / f"appinfo-{version:x}.vdf")
+    write_appinfo(path, {42: launch_app("Game", launch, "Game Dir")}, version)
+    with AppInfoReader(path) as reader:
+        return reader.get_launch_config(42)
+
+
+@pytest.mark.parametrize("version", VERSIONS)
+def test_launch_prefers_default_then_64_bit_then_32_bit(tmp_path, version):
+    launch = [
+        entry("option64.exe", "option", osarch="64"),
+        entry("default32.exe", "default", osarch="32"),
+        entry("default64.exe", "default", osarch="64"),
+        entry("defaultany.exe", "default"),
+    ]
+
+    assert launch_config(tmp_path, launch, version)["executable"] == "default64.exe"
+    assert launch_config(tmp_path, launch[:2], version)["executable"] == "default32.exe"
+    assert launch_config(tmp_path, [launch[0], entry("option32.exe", "option", osarch="32")],
+                         version)["executable"] == "option64.exe"
+
+
+def test_launch_without_type_counts_as_default(tmp_path):
+    launch = [entry("option.exe", "option"), entry("Game.exe", osarch="64")]
+
+    assert launch_config(tmp_path, launch) == {"executable": "Game.exe", "workingdir": "", "installdir": "Game Dir"}
+
+
+@pytest.mark.parametrize("skipped", [
+    entry("beta.exe", "default", betakey="public_beta"),
+    entry("editor.exe", "editor"),
+    entry("server.exe", "server"),
+    entry("vr.exe", "vr"),
+    entry("openvr.exe", "openvr"),
+    entry("mac.app", "default"),
+    entry("linux.exe", "default", oslist="linux"),
+    entry("none.exe", "none"),
+], ids=lambda skipped: skipped["executable"])
+def test_launch_skips_unusable_entries(tmp_path, skipped):
+    assert launch_config(tmp_path, [skipped, entry("play.exe", "option", osarch="32")])["executable"] == "play.exe"
+    assert launch_config(tmp_path, [skipped]) is None
+
+
+def test_launch_keeps_working_dir(tmp_path):
+    launch = [dict(entry(" bin/Game.exe ", "default"), workingdir="bin")]
+
+    assert launch_config(tmp_path, launch) == {"executable": "bin/Game.exe", "workingdir": "bin",
+                                               "installdir": "Game Dir"}
+
+
+def test_resolve_launch_exe(tmp_path):
+    game_root = tmp_path / "Game Dir"
+    (game_root / "bin").mkdir(parents=True)
+    (game_root / "bin" / "Game.exe").write_bytes(b"")
+
+    assert steam_scanner.resolve_launch_exe(str(game_root), {"executable": "bin\\Game.exe", "workingdir": "bin"}) == (
+        os.path.join(str(game_root), "bin", "Game.exe"), os.path.join(str(game_root), "bin"))
+    assert steam_scanner.resolve_launch_exe(str(game_root), {"executable": "./bin//Game.exe", "workingdir": "gone"}) == (
+        os.path.join(str(game_root), "bin", "Game.exe"), None)
+    assert steam_scanner.resolve_launch_exe(str(game_root), {"executable": "missing.exe"}) == (None, None)
+    assert steam_scanner.resolve_launch_exe(str(game_root), None) == (None, None)
@@ -0,0 +1,66 @@
+import os
+import random
+
+import pytest
+
+import steam_scanner
+from bench_exe_discovery import find_game_exe_walk
+from synthetic_steam import LAYOUTS, make_compact_game_tree, make_game_tree
+
+
+def touch(root, *parts):
+    path = os.path.join(root, *parts)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "wb").close()
+    return path
+
+
+TREES = {
+    "asset_folder": ("Content Game", [("Content", "Bin", "ContentGame.exe")]),
+    "deep": ("Deep Game", [("a", "b", "c", "d", "e", "DeepGame.exe")]),
+    "deep_without_name_match": ("Buried", [("a", "b", "c", "d", "Thing.exe")]),
+    "saved_and_paks": ("Pak Game", [("Saved", "Tools", "Editor.exe"), ("Paks", "x64", "PakGame.exe")]),
+    "ea_substring_dead_earth": ("Dead Earth", [("DeadEarth.exe",)]),
+    "ea_substring_heat_signature": ("Heat Signature", [("HeatSignature.exe",)]),
+    "redist_only": ("Redist Game", [("_CommonRedist", "vcredist", "RedistGame.exe"), ("unins000.exe",)]),
+    "data_folder": ("Unity Game", [("UnityGame_Data", "Plugins", "UnityGame.exe")]),
+    "root_and_binaries": ("Star Raiders", [("StarRaiders.exe",),
+                                           ("StarRaiders", "Binaries", "Win64", "StarRaiders-Win64-Shipping.exe")]),
+    "three_root_exes": ("Trio", [("one.exe",), ("two.exe",), ("three.exe",), ("bin", "Trio.exe")]),
+    "empty": ("Nothing", []),
+}
+
+
+@pytest.mark.parametrize("case", sorted(TREES))
+def test_matches_os_walk_finder(tmp_path, case):
+    name, files = TREES[case]
+    game_root = str(tmp_path / name.replace(" ", ""))
+    os.makedirs(game_root)
+    for parts in files:
+        touch(game_root, *parts)
+
+    assert steam_scanner.find_game_exe(game_root, name) == find_game_exe_walk(game_root, name)
+
+
+@pytest.mark.parametrize("layout", LAYOUTS)
+def test_matches_os_walk_finder_on_synthetic_layouts(tmp_path, layout):
+    game_root = str(tmp_path / "Iron Forge")
+    expected = make_compact_game_tree(game_root, "IronForge", random.Random(3), layout)
+
+    assert steam_scanner.find_game_exe(game_root, "Iron Forge") == expected
+    assert find_game_exe_walk(game_root, "Iron Forge") == expected
+
+
+def test_finds_shipping_exe_in_large_tree(tmp_path):
+    game_root = str(tmp_path / "Star Raiders")
+    expected = make_game_tree(game_root, "StarRaiders.exe", files=500, rng=random.Random(1))
+
+    assert steam_scanner.find_game_exe(game_root, "Star Raiders") == expected
+    assert find_game_exe_walk(game_root, "Star Raiders") == expected
+
+
+def test_falls_back_past_depth_cap(tmp_path):
+    game_root = str(tmp_path / "Deep")
+    expected = touch(game_root, "a", "b", "c", "Deep.exe")
+
+    assert steam_scanner.find_game_exe(game_root, "Deep", max_depth=1) == expected
@@ -0,0 +1,142 @@
+import json
+import os
+import threading
+
+import library_store
+from library_store import GAMES_FILE, GAMES_JOURNAL_FILE, JournalLibraryStore
+
+
+def names(games):
+    return sorted(game["name"] for game in games)
+
+
+def make_store(data_dir, count=5):
+    library_store.write_json_state(GAMES_FILE, [{"name": f"game{i}", "path": f"C:/g{i}.exe"} for i in range(count)],
+                                   str(data_dir))
+    store = JournalLibraryStore(str(data_dir))
+    return store, store.load_games()
+
+
+def reopen(data_dir):
+    store = JournalLibraryStore(str(data_dir))
+    try:
+        return store.load_games()
+    finally:
+        store.close()
+
+
+def test_replays_journal_ops(tmp_path):
+    store, games = make_store(tmp_path)
+    store.update_game(dict(games[0], favorite=True))
+    store.update_game(dict(games[1], name="renamed"))
+    store.remove_game(games[2])
+    store.add_games([{"name": "added", "path": "C:/added.exe"}])
+    store.close()
+
+    loaded = {game["name"]: game for game in reopen(tmp_path)}
+
+    assert sorted(loaded) == ["added", "game0", "game3", "game4", "renamed"]
+    assert loaded["game0"]["favorite"] is True
+    assert loaded["renamed"]["path"] == "C:/g1.exe"
+    assert len({game["_id"] for game in loaded.values()}) == 5
+
+
+def test_drops_torn_final_record(tmp_path):
+    store, games = make_store(tmp_path)
+    store.update_game(dict(games[0], favorite=True))
+    store.close()
+    journal = tmp_path / GAMES_JOURNAL_FILE
+    intact = journal.stat().st_size
+    with open(journal, "ab") as f:
+        f.write(b'{"op":"remove","id":')
+
+    store = JournalLibraryStore(str(tmp_path))
+    games = store.load_games()
+    assert journal.stat().st_size == intact
+    assert len(games) == 5
+    assert [game["favorite"] for game in games if game["name"] == "game0"] == [True]
+
+    store.remove_game(games[1])
+    store.close()
+    for line in journal.read_bytes().splitlines():
+        json.loads(line)
+    assert names(reopen(tmp_path)) == ["game0", "game2", "game3", "game4"]
+
+
+def test_snapshot_mismatch_moves_journal_to_backup(tmp_path):
+    store, games = make_store(tmp_path)
+    store.remove_game(games[0])
+    store.close()
+    journal_bytes = (tmp_path / GAMES_JOURNAL_FILE).read_bytes()
+    library_store.write_json_state(GAMES_FILE, [{"name": "edited"}, {"name": "by hand"}], str(tmp_path))
+
+    assert names(reopen(tmp_path)) == ["by hand", "edited"]
+    assert (tmp_path / (GAMES_JOURNAL_FILE + ".bak")).read_bytes() == journal_bytes
+    base = json.loads((tmp_path / GAMES_JOURNAL_FILE).read_bytes().splitlines()[0])
+    assert base["op"] == "base" and base["ids"] == [[1, 2]]
+    assert names(reopen(tmp_path)) == ["by hand", "edited"]
+
+
+def test_compact_keeps_state_and_appends_after(tmp_path):
+    store, games = make_store(tmp_path)
+    for game in games:
+        store.update_game(dict(game, favorite=True))
+    assert store.compact()
+    assert len((tmp_path / GAMES_JOURNAL_FILE).read_bytes().splitlines()) == 1
+    store.remove_game(games[0])
+    store.close()
+
+    loaded = reopen(tmp_path)
+    assert names(loaded) == ["game1", "game2", "game3", "game4"]
+    assert all(game["favorite"] for game in loaded)
+
+
+def test_replace_during_compact_is_kept(tmp_path, monkeypatch):
+    store, games = make_store(tmp_path, 50)
+    for game in games[:40]:
+        store.update_game(dict(game, favorite=True))
+
+    encode = library_store.encode_json_state
+    replaced = []
+
+    def encode_then_replace(data):
+        raw = encode(data)
+        if threading.current_thread().name == "compact" and not replaced:
+            replaced.append(None)
+            replaced[0] = store.replace_games([{"name": "only"}])
+        return raw
+
+    monkeypatch.setattr(library_store, "encode_json_state", encode_then_replace)
+    thread = threading.Thread(target=store.compact, name="compact")
+    thread.start()
+    thread.join()
+    monkeypatch.setattr(library_store, "encode_json_state", encode)
+    store.close()
+
+    assert replaced == [True]
+    assert names(reopen(tmp_path)) == ["only"]
+
+
+def test_crash_between_compaction_renames(tmp_path, monkeypatch):
+    store, games = make_store(tmp_path)
+    store.update_game(dict(games[0], favorite=True))
+    store.remove_game(games[1])
+    journal_path = str(tmp_path / GAMES_JOURNAL_FILE)
+    replace = os.replace
+
+    def crash_on_journal_swap(src, dst):
+        if src == journal_path + ".new" and dst == journal_path:
+            raise OSError("simulated crash")
+        return replace(src, dst)
+
+    monkeypatch.setattr(library_store.os, "replace", crash_on_journal_swap)
+    assert not store.compact()
+    monkeypatch.setattr(library_store.os, "replace", replace)
+    store.close()
+    assert os.path.exists(journal_path + ".new")
+
+    loaded = reopen(tmp_path)
+    assert names(loaded) == ["game0", "game2", "game3", "game4"]
+    assert [game["favorite"] for game in loaded if game["name"] == "game0"] == [True]
+    assert not os.path.exists(journal_path + ".new")
+    assert not os.path.exists(journal_path + ".bak")
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+import library_index
+from game_record import GameRecord
+from synthetic_steam import make_game_records
+
+NAMES = ["Doom", "DOOM Eternal", "Half-Life 2", "Portal", "Straße der Helden", "ﬁnal Fantasy", "Hollow Knight",
+         "Ori and the Blind Forest", "Oxygen Not Included", "Stardew Valley", "Hades", "A Short Hike"]
+
+
+def games():
+    records = [GameRecord.from_dict({"name": name, "source": "steam" if i % 2 else "manual", "favorite": i % 3 == 0,
+                                     "added_at": i}) for i, name in enumerate(NAMES)]
+    records += [GameRecord.from_dict(game) for game in make_game_records(300, random.Random(7))]
+    return records
+
+
+@pytest.mark.parametrize("term", ["o", "O", "oo", "ss", "ß", "fi", "l ", "-", "2", "  ", "or", "ori", "doom e", "zzz"])
+@pytest.mark.parametrize("sort_mode", ["name", "favorite", "date_added"])
+def test_index_matches_linear_filter(term, sort_mode):
+    records = games()
+    index = library_index.SearchIndex(records)
+
+    indexed = library_index.filter_sort_games(records, term, sort_mode, index)
+    linear = library_index.filter_sort_games(records, term, sort_mode)
+
+    assert [id(game) for game in indexed] == [id(game) for game in linear]
+
+
+def test_short_term_matches_inside_words():
+    records = games()
+    index = library_index.SearchIndex(records)
+
+    found = {game.name for game in index.search("o")}
+
+    assert {"Doom", "Portal", "Hollow Knight"} <= found
+
+
+def test_short_term_after_rename():
+    records = games()
+    index = library_index.SearchIndex(records)
+    index.search("q")
+    records[0]["name"] = "Quake"
+    index.update(records[0])
+
+    assert records[0] in index.search("q")
+    assert records[0] not in index.search("oo")
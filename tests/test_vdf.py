@@ -0,0 +1,170 @@
+import steam_scanner
+from steam_scanner import parse_acf_manifest, parse_vdf, vdf_get
+
+
+def test_nested_quoted_blocks():
+    text = '''
+"libraryfolders"
+{
+    "0"
+    {
+        "path"      "C:\\\\Program Files (x86)\\\\Steam"
+        "apps"
+        {
+            "228980"    "123"
+            "620"       "456"
+        }
+    }
+}
+'''
+    parsed = parse_vdf(text)
+
+    assert parsed == {"libraryfolders": {"0": {"path": "C:\\Program Files (x86)\\Steam",
+                                               "apps": {"228980": "123", "620": "456"}}}}
+
+
+def test_escapes():
+    parsed = parse_vdf(r'"a" "say \"hi\"" "b" "tab\there\nnext" "c" "ends with \\" "d" "\q stays"')
+
+    assert parsed == {"a": 'say "hi"', "b": "tab\there\nnext", "c": "ends with \\", "d": "\\q stays"}
+
+
+def test_escaped_quote_in_key():
+    assert parse_vdf(r'"odd \"key\"" "v"') == {'odd "key"': "v"}
+
+
+def test_comments():
+    text = '''
+// leading comment "with quotes"
+"root"  // trailing comment
+{
+    "name"  "Portal"   // comment after a value, "quoted" too
+    // "hidden" "value"
+    "url"   "http://example.com//path"
+}
+'''
+    assert parse_vdf(text) == {"root": {"name": "Portal", "url": "http://example.com//path"}}
+
+
+def test_comment_with_unbalanced_quote():
+    text = '"root"\n{\n    // it\'s "odd\n    "a" "1" // "x" // y\n    "b" "2"\n}\n// "eof'
+
+    assert parse_vdf(text) == {"root": {"a": "1", "b": "2"}}
+
+
+def test_platform_conditionals_are_ignored():
+    text = '''
+"root"
+{
+    "exe"       "game.exe"      [$WIN32]
+    "linux"     "game.sh"       [!$WIN32]
+    "block"     [$WINDOWS]
+    {
+        "a"     "1"
+    }
+}
+'''
+    assert parse_vdf(text) == {"root": {"exe": "game.exe", "linux": "game.sh", "block": {"a": "1"}}}
+
+
+def test_unquoted_tokens():
+    text = '''
+AppState
+{
+    appid 620
+    name "Portal 2"
+    StateFlags	4
+    UserConfig{language english}
+}
+'''
+    assert parse_vdf(text) == {"AppState": {"appid": "620", "name": "Portal 2", "StateFlags": "4",
+                                            "UserConfig": {"language": "english"}}}
+
+
+def test_empty_values_and_stray_braces():
+    assert parse_vdf('"a" "" "b" { } } "c" "3"') == {"a": "", "b": {}, "c": "3"}
+
+
+def test_vdf_get_is_case_insensitive():
+    node = {"AppState": {"Name": "x"}}
+
+    assert vdf_get(vdf_get(node, "appstate"), "name") == "x"
+    assert vdf_get("not a dict", "name", "fallback") == "fallback"
+
+
+MANIFEST = '''"AppState"
+{
+	"appid"		"620"
+	"Universe"		"1"
+	"name"		"Portal 2"
+	"StateFlags"		"4"
+	"installdir"		"Portal 2"
+	"LastUpdated"		"1700000000"
+	"SizeOnDisk"		"12345678901"
+	"InstalledDepots"
+	{
+		"621"
+		{
+			"manifest"		"123"
+			"name"		"depot name"
+		}
+	}
+	"UserConfig"
+	{
+		"name"		"user config name"
+		"installdir"		"elsewhere"
+		"language"		"english"
+	}
+}
+'''
+
+
+def test_parse_acf_manifest_reads_top_level_keys(tmp_path):
+    path = tmp_path / "appmanifest_620.acf"
+    path.write_text(MANIFEST, encoding="utf-8")
+
+    assert parse_acf_manifest(str(path)) == {
+        "name": "Portal 2",
+        "installdir": "Portal 2",
+        "steam_appid": "620",
+        "size_on_disk": 12345678901,
+        "state_flags": 4,
+        "last_updated": 1700000000,
+    }
+
+
+def test_parse_acf_manifest_tolerates_bad_files(tmp_path):
+    broken = tmp_path / "appmanifest_1.acf"
+    broken.write_text('"AppState" { "name" "Half', encoding="utf-8")
+    odd = tmp_path / "appmanifest_2.acf"
+    odd.write_text('"AppState" "not a block"', encoding="utf-8")
+
+    assert parse_acf_manifest(str(broken))["installdir"] is None
+    assert parse_acf_manifest(str(odd))["name"] is None
+    assert parse_acf_manifest(str(tmp_path / "missing.acf"))["size_on_disk"] == 0
+
+
+def test_read_library_folders(tmp_path):
+    steam = tmp_path / "Steam"
+    other = tmp_path / "Library"
+    (steam / "steamapps").mkdir(parents=True)
+    (steam / "steamapps" / "libraryfolders.vdf").write_text(f'''
+"libraryfolders"
+{{
+    "contentstatsid"    "-123"
+    "0"
+    {{
+        "path"      "{steam}"
+        "apps" {{ "620" "1" }}
+    }}
+    "1"
+    {{
+        "path"      "{other}"
+        "apps" {{ "228980" "1" "570" "2" }}
+    }}
+}}
+''', encoding="utf-8")
+
+    libraries = steam_scanner.read_library_folders(str(steam))
+
+    assert libraries == {str(steam): ["620"], str(other): ["228980", "570"]}
@@ -0,0 +1,80 @@
+import math
+
+
+class GridLayout:
+    def __init__(self, card_height: int, padding: int = 10, margin_rows: int = 1):
+        self.card_height = card_height
+        self.padding = padding
+        self.margin_rows = margin_rows
+        self.row_height = card_height + 2 * padding
+        self.columns = 1
+        self.count = 0
+        self.width = 1
+
+    def update(self, width: int, columns: int, count: int) -> bool:
+        width, columns = max(1, width), max(1, columns)
+        changed = (width, columns, count) != (self.width, self.columns, self.count)
+        self.width, self.columns, self.count = width, columns, count
+        return changed
+
+    @property
+    def rows(self) -> int:
+        return math.ceil(self.count / self.columns)
+
+    @property
+    def total_height(self) -> int:
+        return self.rows * self.row_height
+
+    def pool_size(self, viewport_height: int) -> int:
+        rows = math.ceil(max(1, viewport_height) / self.row_height) + 1 + 2 * self.margin_rows
+        return rows * self.columns
+
+    def visible_range(self, top: float, viewport_height: int) -> tuple[int, int]:
+        first_row = max(0, int(top // self.row_height) - self.margin_rows)
+        last_row = int((top + max(1, viewport_height)) // self.row_height) + self.margin_rows
+        return min(self.count, first_row * self.columns), min(self.count, (last_row + 1) * self.columns)
+
+    def cell(self, index: int) -> tuple[int, int, int, int]:
+        row, col = divmod(index, self.columns)
+        cell_width = self.width / self.columns
+        x = round(col * cell_width) + self.padding
+        width = round((col + 1) * cell_width) - self.padding - x
+        return x, row * self.row_height + self.padding, max(1, width), self.card_height
+
+    def index_at(self, top: float) -> int:
+        return min(self.count, int(max(0, top) // self.row_height) * self.columns)
+
+    def index_at_point(self, x: float, y: float) -> int | None:
+        if x < 0 or y < 0:
+            return None
+        row, col = int(y // self.row_height), min(self.columns - 1, int(x * self.columns // self.width))
+        index = row * self.columns + col
+        if index >= self.count:
+            return None
+        left, top, width, height = self.cell(index)
+        if left <= x < left + width and top <= y < top + height:
+            return index
+        return None
+
+
+def rounded_rect(x1: float, y1: float, x2: float, y2: float, radius: float) -> list[float]:
+    r = max(0, min(radius, (x2 - x1) / 2, (y2 - y1) / 2))
+    return [x1 + r, y1, x1 + r, y1, x2 - r, y1, x2 - r, y1, x2, y1, x2, y1 + r, x2, y1 + r, x2, y2 - r,
+            x2, y2 - r, x2, y2, x2 - r, y2, x2 - r, y2, x1 + r, y2, x1 + r, y2, x1, y2, x1, y2 - r,
+            x1, y2 - r, x1, y1 + r, x1, y1 + r, x1, y1]
+
+
+class FrameBudget:
+    def __init__(self, budget_ms: float, chunk_size: int = 12, max_chunk: int = 64, smoothing: float = 0.3):
+        self.budget_ms = budget_ms
+        self.max_chunk = max_chunk
+        self.smoothing = smoothing
+        self.cost_ms = budget_ms / max(1, chunk_size)
+
+    @property
+    def chunk_size(self) -> int:
+        return max(1, min(self.max_chunk, int(self.budget_ms / max(self.cost_ms, 1e-3))))
+
+    def record(self, count: int, elapsed_ms: float):
+        if count > 0:
+            self.cost_ms += self.smoothing * (elapsed_ms / count - self.cost_ms)